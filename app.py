@@ -1,10 +1,7 @@
 
 import streamlit as st
-import streamlit_authenticator as stauth
 from src.config import Config
-from src.services.db_service import DBService
-from src.services.ai_service import AIService
-from src.services.band_auth_service import BandAuthService
+from src.services.service_registry import get_db_service, get_ai_service, get_band_auth, get_authenticator, startup_timings
 from src.ui.styles import Styles
 from src.ui.layout import Layout
 from src.ui.pages.home import HomePage
@@ -29,6 +26,7 @@ def main():
     with st.sidebar:
         st.title("⛰️ 또닥또닥 산악회")
         st.caption("🚀 App Version: v4.25 (KPI Fix)")
+    Layout.render_theme_selector()
 
     # 2. Authentication
     
@@ -36,11 +34,7 @@ def main():
     Styles.apply_custom_css()
     
     # [Naver Band Auth Integration]
-    band_auth = BandAuthService(
-        client_id=Config.BAND_CLIENT_ID,
-        client_secret=Config.BAND_CLIENT_SECRET,
-        redirect_uri=Config.BAND_REDIRECT_URI
-    )
+    band_auth = get_band_auth()
     
     # Check for OAuth Callback
     if "code" in st.query_params:
@@ -62,7 +56,7 @@ def main():
             else:
                  st.error(f"가입된 밴드 목록에서 목표 밴드(ID: {Config.TARGET_BAND_ID})를 찾을 수 없습니다.")
 
-    auth = stauth.Authenticate(Config.CREDENTIALS, "ddodak_cookie", "ddodak_key")
+    auth = get_authenticator()
     
     # Render Login UI (Hybrid - Centered)
     if not st.session_state.get("authentication_status"):
@@ -80,9 +74,9 @@ def main():
             st.link_button("🟩 네이버 밴드로 로그인 (리더/공동리더 권한)", auth_url, use_container_width=True)
             
     if st.session_state["authentication_status"]:
-        # 3. Initialize Services
-        db = DBService()
-        ai = AIService()
+        # 3. Initialize Services (프로세스당 한 번 생성, service_registry 참고)
+        db = get_db_service()
+        ai = get_ai_service()
 
         # 4. Apply Global Styles
         # Styles.apply_custom_css() # Moved to global scope
@@ -104,6 +98,8 @@ def main():
         
         # Logout Button in Sidebar
         auth.logout("로그아웃", "sidebar")
+        Layout.render_cache_stats(db.cache_stats())
+        Layout.render_startup_timings(startup_timings())
         
     elif st.session_state["authentication_status"] is False:
         st.error("비밀번호가 틀렸습니다.")
@@ -0,0 +1,87 @@
+import sys
+import time
+import threading
+from src.config import Config
+
+# =========================================================
+# Benchmark: 홈 대시보드 데이터 로딩 - 순차 실행 vs DashboardLoader 동시 실행
+# 조회 캐시를 비운 콜드 상태에서 모든 항목을 불러오는 시간을 비교하고,
+# 날씨 API가 제한 시간보다 느릴 때 페이지가 제한 시간 안에 반환되는지 확인합니다.
+# 실행: python bench_dashboard.py [DB_PATH]
+# =========================================================
+
+REPEAT = 5
+API_DELAY_SEC = 0.3   # 날씨 API 응답 지연 (네트워크 왕복 가정)
+
+if len(sys.argv) > 1:
+    Config.DB_NAME = sys.argv[1]
+
+from weather_stub import serve
+from src.services.db_service import DBService
+from src.services.dashboard_loader import DashboardLoader
+from src.services.weather_service import get_point_weather, get_weather_provider
+
+ALL = list(DashboardLoader.SOURCES)
+
+
+def cold():
+    # DB 조회 캐시와 산행지 예보 캐시를 비워 매번 실제로 조회하게 함
+    DBService.clear_cache()
+    get_point_weather.clear()
+
+
+def run_sequential(loader):
+    values, elapsed = {}, {}
+    for name in ALL:
+        deps = {d: values.get(d) for d in loader.SOURCES[name][0]}
+        start = time.perf_counter()
+        values[name] = getattr(loader, f"_load_{name}")(**deps)
+        elapsed[name] = time.perf_counter() - start
+    return elapsed
+
+
+def bench(label, fn):
+    times = []
+    for _ in range(REPEAT):
+        cold()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    best = min(times) * 1000
+    print(f"  {label:<36} {best:8.1f} ms")
+    return best
+
+
+def start_stub(delay):
+    server = serve(port=0, delay=delay)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    Config.WEATHER_API_URL = f"http://127.0.0.1:{server.server_address[1]}/v1/forecast"
+    return server
+
+
+if __name__ == "__main__":
+    server = start_stub(API_DELAY_SEC)
+    loader = DashboardLoader(DBService())
+    get_weather_provider().get(wait=5)  # 서울 예보 갱신 스레드는 상시 동작하므로 미리 채움
+
+    print(f"Dashboard data load (cold cache, weather API delay {API_DELAY_SEC * 1000:.0f} ms, best of {REPEAT})")
+    seq = bench("sequential (previous)", lambda: run_sequential(loader))
+    par = bench(f"DashboardLoader ({Config.DASHBOARD_WORKERS} workers)", lambda: loader.load(ALL))
+    print(f"  speed-up: {seq / par:.1f}x")
+
+    cold()
+    snapshot = loader.load(ALL)
+    print("\nPer-source time (concurrent run)")
+    for name, sec in sorted(snapshot.timings.items(), key=lambda t: -t[1]):
+        print(f"  {name:<22} {sec * 1000:8.1f} ms")
+
+    # 느린 API: 제한 시간(WEATHER_TIMEOUT_SEC)을 넘기면 해당 항목만 비우고 반환
+    server.shutdown()
+    start_stub(delay=3.0)
+    Config.WEATHER_TIMEOUT_SEC = 0.5
+    cold()
+    start = time.perf_counter()
+    snapshot = loader.load(ALL)
+    print(f"\nSlow weather API (3 s, timeout {Config.WEATHER_TIMEOUT_SEC} s): returned in {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(f"  errors: {dict(snapshot.errors)}")
+    print(f"  kpis loaded: {snapshot.kpis is not None}, leaderboard loaded: {snapshot.leaderboard is not None}")
@@ -0,0 +1,75 @@
+import os
+import time
+import tempfile
+import duckdb
+from src.config import Config
+
+# =========================================================
+# Benchmark: 월 필터 - 함수 감싸기 vs 날짜 범위
+# 100만 건 events 테이블에서 `strftime('%Y-%m', date) = ?`와 `date >= ? AND date < ?`를 비교합니다.
+# 컬럼을 함수로 감싸면 DuckDB 존맵(min/max) 프루닝이 불가능해 전체를 스캔합니다.
+# 실행: python bench_dates.py
+# =========================================================
+
+ROWS = 1_000_000
+REPEAT = 50
+TARGET_MONTH = "2019-07"
+
+
+def build_sample_db(path):
+    # 일정은 등록 순서대로 쌓이므로 date 기준으로 정렬된 상태로 적재 (실제 DB와 동일한 분포)
+    # 기존 DB처럼 date를 VARCHAR로 만들어 마이그레이션 경로도 함께 검증합니다.
+    with duckdb.connect(path) as conn:
+        conn.execute(f"""
+            CREATE TABLE events AS
+            SELECT CAST(i AS VARCHAR) AS event_id,
+                   strftime(DATE '2000-01-01' + CAST(i * 9131 // {ROWS} AS INTEGER), '%Y-%m-%d') AS date,
+                   '정기산행 ' || i AS title, CAST(i % 500 AS VARCHAR) AS host,
+                   NULL::VARCHAR AS album_url, NULL::VARCHAR AS description, 1 + i % 3 AS score
+            FROM range({ROWS}) t(i)
+        """)
+        conn.execute("ALTER TABLE events ADD PRIMARY KEY (event_id)")
+
+
+def bench(label, fn):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    elapsed = (time.perf_counter() - start) / REPEAT * 1000
+    print(f"  {label:<44} {elapsed:8.2f} ms")
+    return elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.duckdb")
+        build_sample_db(path)
+        Config.DB_NAME = path
+
+        from src.services.db_service import DBService as db
+        from src.services.connection_manager import shutdown
+        from src.services.dates import month_bounds
+        from src.services.migrations import run_migrations
+
+        start = time.perf_counter()
+        applied = run_migrations()
+        print(f"[migration] {applied} ({time.perf_counter() - start:.1f} s)")
+
+        old_sql = "SELECT count(*), sum(score) FROM events WHERE strftime('%Y-%m', date) = ?"
+        new_sql = "SELECT count(*), sum(score) FROM events WHERE date >= ? AND date < ?"
+        assert db.query(old_sql, (TARGET_MONTH,), cache=False).equals(db.query(new_sql, month_bounds(TARGET_MONTH), cache=False))
+
+        print(f"[month filter] {TARGET_MONTH} ({ROWS:,}행)")
+        a = bench("strftime('%Y-%m', date) = ?", lambda: db.query(old_sql, (TARGET_MONTH,), cache=False))
+        b = bench("date >= ? AND date < ?", lambda: db.query(new_sql, month_bounds(TARGET_MONTH), cache=False))
+        print(f"  -> x{a / b:.1f}")
+
+        print("[monthly trend] 최근 12개월 그룹핑")
+        trend_old = "SELECT strftime('%Y-%m', date) AS m, count(*) FROM events WHERE date >= DATE '2024-01-01' GROUP BY m"
+        trend_new = "SELECT month, count(*) FROM events WHERE date >= DATE '2024-01-01' GROUP BY month"
+        a = bench("GROUP BY strftime(...)", lambda: db.query(trend_old, cache=False))
+        b = bench("GROUP BY month (생성 컬럼)", lambda: db.query(trend_new, cache=False))
+        print(f"  -> x{a / b:.1f}")
+
+        shutdown()
@@ -0,0 +1,84 @@
+import os
+import time
+import tempfile
+import threading
+import duckdb
+from src.config import Config
+
+# =========================================================
+# Benchmark: DB 연결 방식 비교
+# 기존 connect-per-call 방식과 ConnectionManager(공유 핸들 + 스레드별 커서)를 비교합니다.
+# 실행: python bench_db.py
+# =========================================================
+
+N_QUERIES = 300       # 측정할 쿼리 수 (대시보드 1회 렌더링 ≈ 15개)
+N_THREADS = 4         # 동시 세션 시뮬레이션 스레드 수
+
+QUERIES = [
+    "SELECT COUNT(*) FROM members WHERE role<>'exmember'",
+    "SELECT user_no, point FROM members WHERE role<>'exmember'",
+    "SELECT SUM(e.score) FROM events e JOIN attendees a ON e.event_id = a.event_id",
+    "SELECT * FROM events ORDER BY date DESC LIMIT 3",
+]
+
+
+def build_sample_db(path):
+    with duckdb.connect(path) as conn:
+        conn.execute("CREATE TABLE members AS SELECT CAST(i AS VARCHAR) AS user_no, 'member' AS role, i % 30 AS point FROM range(2000) t(i)")
+        conn.execute("CREATE TABLE events AS SELECT CAST(i AS VARCHAR) AS event_id, DATE '2024-01-01' + CAST(i AS INTEGER) AS date, 2 AS score FROM range(1000) t(i)")
+        conn.execute("CREATE TABLE attendees AS SELECT CAST(i % 1000 AS VARCHAR) AS event_id, CAST(i % 2000 AS VARCHAR) AS user_no FROM range(20000) t(i)")
+
+
+def run_connect_per_call(path, n):
+    for i in range(n):
+        with duckdb.connect(path) as conn:
+            conn.execute(QUERIES[i % len(QUERIES)]).df()
+
+
+def run_managed(n):
+    from src.services.db_service import DBService
+    for i in range(n):
+        DBService.query(QUERIES[i % len(QUERIES)], cache=False)
+
+
+def timed(label, fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:9.1f} ms  ({elapsed / N_QUERIES * 1000:.3f} ms/query)")
+    return elapsed
+
+
+def timed_threads(label, fn, *args):
+    per_thread = N_QUERIES // N_THREADS
+    threads = [threading.Thread(target=fn, args=args + (per_thread,)) for _ in range(N_THREADS)]
+    start = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:9.1f} ms  ({elapsed / (per_thread * N_THREADS) * 1000:.3f} ms/query)")
+    return elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.duckdb")
+        build_sample_db(path)
+        Config.DB_NAME = path
+
+        from src.services.connection_manager import shutdown
+
+        print(f"--- 단일 스레드 ({N_QUERIES} queries) ---")
+        base = timed("connect-per-call", run_connect_per_call, path, N_QUERIES)
+        pooled = timed("ConnectionManager", run_managed, N_QUERIES)
+        print(f"speedup: x{base / pooled:.1f}")
+
+        # ConnectionManager가 파일 잠금을 잡고 있으므로 비교 전 정리
+        shutdown()
+
+        print(f"\n--- {N_THREADS} 스레드 동시 실행 ---")
+        base = timed_threads("connect-per-call", lambda n: run_connect_per_call(path, n))
+        pooled = timed_threads("ConnectionManager", run_managed)
+        print(f"speedup: x{base / pooled:.1f}")
+
+        shutdown()
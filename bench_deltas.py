@@ -0,0 +1,73 @@
+import os
+import sys
+import threading
+from streamlit.testing.v1 import AppTest
+from weather_stub import serve
+
+# =========================================================
+# Benchmark: 홈 화면 섹션별 Streamlit delta 메시지 수 / 전송 크기
+# 운영 DB 사본(또는 DB_PATH)으로 앱을 실행해 섹션별로 그려진 요소(delta) 수와 직렬화 크기를 집계합니다.
+# 날씨는 로컬 스텁 서버를 사용합니다.
+# 실행: python bench_deltas.py [DB_PATH]
+# =========================================================
+
+APP = """
+import sys
+sys.path.insert(0, {root!r})
+from src.config import Config
+Config.DB_NAME = {db!r}
+Config.WEATHER_API_URL = {weather!r}
+import streamlit as st
+st.config.set_option("server.enableStaticServing", True)
+st.session_state.setdefault("authentication_status", True)
+import app
+app.main()
+"""
+
+
+def walk(node):
+    """
+    요소 트리를 순회하며 (요소 종류, 직렬화 크기)를 반환합니다. (블록 컨테이너 자체도 delta 하나로 셈)
+    전역 스타일시트(<style>로 시작하는 markdown)는 "css"로 따로 구분합니다.
+    """
+    children = getattr(node, "children", None)
+    if children is not None:
+        if getattr(node, "proto", None) is not None:
+            yield "block", node.proto.ByteSize()
+        for child in children.values():
+            yield from walk(child)
+    elif getattr(node, "proto", None) is not None:
+        kind = node.type
+        if kind == "markdown" and node.value.lstrip().startswith("<style>"):
+            kind = "css"
+        yield kind, node.proto.ByteSize()
+
+
+def measure(at):
+    """
+    (delta 수, 전체 크기, markdown 수, markdown 크기, 전역 CSS 크기) — markdown/전체에는 전역 CSS 제외
+    """
+    elements = list(walk(at._tree[0]))
+    css = sum(size for kind, size in elements if kind == "css")
+    elements = [(kind, size) for kind, size in elements if kind != "css"]
+    markdown = [size for kind, size in elements if kind == "markdown"]
+    return len(elements), sum(size for _, size in elements), len(markdown), sum(markdown), css
+
+
+if __name__ == "__main__":
+    root = os.path.dirname(os.path.abspath(__file__))
+    db = sys.argv[1] if len(sys.argv) > 1 else os.path.join(root, "ddodak.duckdb")
+    server = serve(port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    weather = f"http://127.0.0.1:{server.server_address[1]}/v1/forecast"
+    at = AppTest.from_string(APP.format(root=root, db=db, weather=weather), default_timeout=60)
+    at.run()
+
+    print(f"{'section':<30} {'deltas':>7} {'bytes':>10} {'markdown':>9} {'md bytes':>10} {'css':>8}")
+    for section in at.radio(key="home_section").options:
+        at.radio(key="home_section").set_value(section).run()
+        if at.exception:
+            raise RuntimeError(at.exception)
+        count, size, md_count, md_size, css = measure(at)
+        print(f"{section:<30} {count:>7} {size:>10,} {md_count:>9} {md_size:>10,} {css:>8,}")
+    server.shutdown()
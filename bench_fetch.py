@@ -0,0 +1,65 @@
+import os
+import time
+import tempfile
+import duckdb
+from src.config import Config
+
+# =========================================================
+# Benchmark: 결과 형식별 조회 비용 비교
+# DataFrame 경로(query + iloc/tolist)와 query_scalar / query_column / query_arrow를 비교합니다.
+# 모든 측정은 결과 캐시를 끈 상태(cache=False)로 수행합니다.
+# 실행: python bench_fetch.py
+# =========================================================
+
+REPEAT = 500
+
+
+def build_sample_db(path):
+    with duckdb.connect(path) as conn:
+        conn.execute("CREATE TABLE members AS SELECT CAST(i AS VARCHAR) AS user_no, CASE WHEN i % 10 = 0 THEN 'exmember' ELSE 'member' END AS role, i % 30 AS point FROM range(5000) t(i)")
+        conn.execute("CREATE TABLE attendees AS SELECT CAST(i % 500 AS VARCHAR) AS event_id, CAST(i % 5000 AS VARCHAR) AS user_no FROM range(50000) t(i)")
+
+
+def bench(label, fn):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    elapsed = (time.perf_counter() - start) / REPEAT * 1_000_000
+    print(f"  {label:<44} {elapsed:8.1f} µs")
+    return elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.duckdb")
+        build_sample_db(path)
+        Config.DB_NAME = path
+
+        from src.services.db_service import DBService as db
+        from src.services.connection_manager import shutdown
+
+        count_sql = "SELECT COUNT(*) FROM members WHERE role<>'exmember'"
+        ids_sql = "SELECT user_no FROM attendees WHERE event_id=?"
+        params = ("42",)
+
+        print("[scalar] 회원 수")
+        a = bench("query(...).iloc[0, 0]", lambda: db.query(count_sql, cache=False).iloc[0, 0])
+        b = bench("query_scalar(...)", lambda: db.query_scalar(count_sql, cache=False))
+        print(f"  -> x{a / b:.1f}")
+
+        print("[column] 참석자 ID 목록")
+        a = bench("query(...)['user_no'].tolist()", lambda: db.query(ids_sql, params, cache=False)['user_no'].tolist())
+        b = bench("query_column(...).tolist()", lambda: db.query_column(ids_sql, params, cache=False).tolist())
+        print(f"  -> x{a / b:.1f}")
+
+        print("[arrow] 회원 전체 (5,000행)")
+        a = bench("query('SELECT * FROM members')", lambda: db.query("SELECT * FROM members", cache=False))
+        b = bench("query_arrow('SELECT * FROM members')", lambda: db.query_arrow("SELECT * FROM members", cache=False))
+        print(f"  -> x{a / b:.1f}")
+
+        print("[cache hit] 참고용")
+        bench("query_scalar(...) (cached)", lambda: db.query_scalar(count_sql))
+        bench("query(...) (cached, copy)", lambda: db.query(count_sql))
+
+        shutdown()
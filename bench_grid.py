@@ -0,0 +1,106 @@
+import os
+import time
+import tempfile
+import duckdb
+import pandas as pd
+from src.config import Config
+
+# =========================================================
+# Benchmark: 회원/일정 편집 표 - 전체 로드 후 pandas 필터 vs 파라미터 SQL 필터 + 페이지 로드
+# 합성 DB(회원 50,000명 / 일정 50,000건)에서 필터 조합별로 화면에 필요한 데이터(건수, 한 페이지, 선택지)를 얻는 시간을 비교합니다.
+# 조회 캐시를 비운 상태(필터를 처음 바꿨을 때)와 캐시가 찬 상태(같은 조건으로 다시 그릴 때)를 따로 잽니다.
+# 실행: python bench_grid.py
+# =========================================================
+
+ROWS = 50_000
+REPEAT = 5
+
+
+def build_sample_db(path):
+    with duckdb.connect(path) as conn:
+        conn.execute(f"""
+            CREATE TABLE members AS
+            SELECT CAST(i AS VARCHAR) AS user_no, 1970 + i % 30 AS birth_year, '회원' || i AS name,
+                   ['서울', '인천', '강남', '관악', '경기'][1 + i % 5] AS area,
+                   ['member', 'staff', 'admin', 'exmember'][1 + i % 4] AS role,
+                   '메모 ' || (i % 997) AS description, '회원' || i AS original_name
+            FROM range({ROWS}) t(i)
+        """)
+        conn.execute(f"""
+            CREATE TABLE events AS
+            SELECT CAST(i AS VARCHAR) AS event_id, DATE '2015-01-01' + CAST(i // 10 AS INTEGER) AS date,
+                   ['관악산', '북한산', '도봉산', '설악산'][1 + i % 4] || ' 산행 ' || i AS title
+            FROM range({ROWS}) t(i)
+        """)
+        conn.execute("ALTER TABLE events ADD COLUMN month DATE")
+        conn.execute("UPDATE events SET month = CAST(date_trunc('month', date) AS DATE)")
+
+
+def pandas_members(db, years, text):
+    df_all = db.query("SELECT * FROM members ORDER BY birth_year, name")
+    [sorted(df_all[c].dropna().unique()) for c in ('birth_year', 'area', 'role')]
+    mask = pd.Series([True] * len(df_all))
+    if years: mask &= df_all['birth_year'].isin(years)
+    if text:
+        mask &= df_all['name'].str.contains(text, case=False, na=False) | df_all['description'].str.contains(text, case=False, na=False)
+    return df_all[mask]
+
+
+def sql_members(grid, years, text):
+    from src.services.grid_service import GridFilter
+    [grid.options("members", c) for c in ('birth_year', 'area', 'role')]
+    f = GridFilter().isin("birth_year", years).search("members", "user_no", text)
+    grid.count("members", f)
+    return grid.page("members", f, "birth_year, name, user_no", 0)
+
+
+def pandas_events(db, month, text):
+    df_e = db.query("SELECT * FROM events ORDER BY date DESC")
+    df_e['month'] = df_e['date'].astype(str).str[:7]
+    sorted(df_e['month'].unique(), reverse=True)
+    mask = pd.Series([True] * len(df_e))
+    if month: mask &= df_e['month'] == month
+    if text: mask &= df_e['title'].str.contains(text, case=False, na=False)
+    return df_e[mask].drop(columns=['month'])
+
+
+def sql_events(grid, month, text):
+    from src.services.grid_service import GridFilter
+    from src.services.dates import month_bounds
+    grid.options("events", "strftime(month, '%Y-%m')")
+    f = GridFilter().between("date", *(month_bounds(month) if month else (None, None))).search("events", "event_id", text)
+    grid.count("events", f)
+    return grid.page("events", f, "date DESC, event_id", 0, columns="* EXCLUDE (month)")
+
+
+def bench(fn, cold):
+    from src.services.db_service import DBService
+    times = []
+    for _ in range(REPEAT):
+        if cold:
+            DBService.clear_cache()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        Config.DB_NAME = os.path.join(tmp, "bench.duckdb")
+        build_sample_db(Config.DB_NAME)
+        from src.services.db_service import DBService
+        from src.services.grid_service import GridService
+        db, grid = DBService(), GridService(DBService())
+
+        cases = [
+            ("members: no filter", lambda: pandas_members(db, [], ""), lambda: sql_members(grid, [], "")),
+            ("members: year", lambda: pandas_members(db, [1985], ""), lambda: sql_members(grid, [1985], "")),
+            ("members: year + text", lambda: pandas_members(db, [1985], "메모 1"), lambda: sql_members(grid, [1985], "메모 1")),
+            ("events: no filter", lambda: pandas_events(db, None, ""), lambda: sql_events(grid, None, "")),
+            ("events: month + text", lambda: pandas_events(db, "2020-05", "관악"), lambda: sql_events(grid, "2020-05", "관악")),
+        ]
+        print(f"Grid data per rerun ({ROWS:,} rows, page size {Config.GRID_PAGE_SIZE}, best of {REPEAT})")
+        print(f"  {'case':<24} {'pandas cold':>12} {'pandas warm':>12} {'sql cold':>10} {'sql warm':>10}")
+        for label, old, new in cases:
+            print(f"  {label:<24} {bench(old, True):10.1f}ms {bench(old, False):10.1f}ms {bench(new, True):8.1f}ms {bench(new, False):8.1f}ms")
@@ -0,0 +1,92 @@
+import os
+import time
+import random
+import difflib
+import tempfile
+import duckdb
+import numpy as np
+from src.config import Config
+
+# =========================================================
+# Benchmark: 참석자 일괄 입력 이름 매칭 - 입력마다 전체 회원 비교(difflib) vs MemberNameIndex(bigram 행렬)
+# 합성 회원(MEMBERS명)과 오타/생년이 섞인 입력(QUERIES건)으로 매칭 시간과 1순위 정확도를 비교합니다.
+# 끝으로 키(UNIQUE/PK)가 없는 attendees 테이블에 매칭 결과를 두 번 저장해 중복 없이 한 번만 들어가는지 확인합니다.
+# 실행: python bench_import.py
+# =========================================================
+
+MEMBERS = 2000
+QUERIES = 500
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+SYLLABLES = "민서지수영현준우진하은도윤재희성연아예주원승태혜경"
+
+
+def build_sample_db(path, rng):
+    names = [rng.choice(SURNAMES) + rng.choice(SYLLABLES) + rng.choice(SYLLABLES) for _ in range(MEMBERS)]
+    with duckdb.connect(path) as conn:
+        conn.execute("CREATE TABLE members (user_no VARCHAR PRIMARY KEY, birth_year INTEGER, name VARCHAR, original_name VARCHAR, area VARCHAR, role VARCHAR)")
+        conn.executemany("INSERT INTO members VALUES (?, ?, ?, ?, '서울', 'member')",
+                         [(str(i), 1975 + i % 20, name, name) for i, name in enumerate(names)])
+        # 기존 DB처럼 (event_id, user_no)에 키가 없는 참석 테이블
+        conn.execute("CREATE TABLE attendees (event_id VARCHAR, user_no VARCHAR)")
+    return names
+
+
+def make_queries(names, rng):
+    """
+    (입력 이름, 생년, 정답 user_no). 1/4은 한 글자 오타, 절반은 생년 포함
+    """
+    queries = []
+    for _ in range(QUERIES):
+        i = rng.randrange(len(names))
+        name = names[i]
+        if rng.random() < 0.25:
+            pos = rng.randrange(1, len(name))
+            name = name[:pos] + rng.choice(SYLLABLES) + name[pos + 1:]
+        year = (1975 + i % 20) if rng.random() < 0.5 else None
+        queries.append((name, year, str(i)))
+    return queries
+
+
+def naive_top(names, queries):
+    return [max(range(len(names)), key=lambda j: difflib.SequenceMatcher(None, q, names[j]).ratio()) for q, _, _ in queries]
+
+
+def bench(label, fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    print(f"  {label:<40} {min(times) * 1000:10.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        Config.DB_NAME = os.path.join(tmp, "bench.duckdb")
+        names = build_sample_db(Config.DB_NAME, rng)
+        queries = make_queries(names, rng)
+        answers = np.array([u for _, _, u in queries])
+
+        from src.services.db_service import DBService
+        from src.services.member_index import MemberIndexService
+        from src.services.attendance_import import AttendanceImportService
+        service = MemberIndexService(DBService())
+
+        print(f"Name matching ({QUERIES} inputs x {MEMBERS} members)")
+        naive = bench("difflib per input (full scan)", lambda: naive_top(names, queries), repeat=1)
+        index = bench("build MemberNameIndex (once per generation)", service._build_names)
+        positions, _ = bench("MemberNameIndex.top (matrix)", lambda: index.top([q for q, _, _ in queries], [y for _, y, _ in queries]))
+
+        print("\nTop-1 accuracy")
+        print(f"  difflib                                  {np.mean(np.array([str(i) for i in naive]) == answers):10.1%}")
+        print(f"  MemberNameIndex (+ birth year)           {np.mean(index.user_nos[positions[:, 0]] == answers):10.1%}")
+
+        # 같은 참석 목록을 두 번 저장: 두 번째는 추가 0건이어야 함
+        pairs = [("E1", u) for u in index.user_nos[positions[:, 0]]]
+        importer = AttendanceImportService(DBService())
+        first, second = importer.save(pairs), importer.save(pairs)
+        stored = DBService.query_scalar("SELECT count(*) FROM attendees", cache=False)
+        assert first == stored == len(set(pairs)) and second == 0, (first, second, stored)
+        print(f"\nSave to keyless attendees: {first} added, re-save {second} added (OK)")
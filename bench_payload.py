@@ -0,0 +1,62 @@
+import os
+from streamlit.testing.v1 import AppTest
+from src.ui.backgrounds import get_backgrounds
+
+# =========================================================
+# Benchmark: 배경 이미지 전송량 - base64 인라인 CSS vs 정적 파일 URL
+# 전역 CSS(st.markdown)는 rerun마다 웹소켓으로 다시 전송되므로, 그 메시지 크기를 비교합니다.
+# 정적 파일은 HTTP로 한 번 내려받은 뒤 브라우저 캐시를 사용합니다.
+# 실행: python bench_payload.py
+# =========================================================
+
+RERUNS = 10
+
+# 변경 전: background.png를 base64로 CSS에 넣어 매 rerun 전송 (inject_b64.py 방식)
+BEFORE = """
+import base64
+import streamlit as st
+with open("background.png", "rb") as f:
+    b64 = base64.b64encode(f.read()).decode()
+st.markdown(f'''<style>[data-testid="stAppViewContainer"] {{
+    background-image: linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.5)), url('data:image/png;base64,{b64}') !important;
+}}</style>''', unsafe_allow_html=True)
+"""
+
+# 변경 후: 전역 CSS 전체 (배경은 정적 파일 URL)
+AFTER = """
+import streamlit as st
+st.config.set_option("server.enableStaticServing", True)
+from src.ui.styles import Styles
+Styles.apply_custom_css()
+"""
+
+
+def payload_bytes(script):
+    """
+    스크립트 한 번 실행 시 생성되는 markdown 요소들의 직렬화 크기(바이트)를 반환합니다.
+    """
+    at = AppTest.from_string(script, default_timeout=60)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception)
+    return sum(md.proto.ByteSize() for md in at.markdown)
+
+
+def fmt(n):
+    return f"{n / 1024:,.1f} KB"
+
+
+if __name__ == "__main__":
+    before = payload_bytes(BEFORE)
+    after = payload_bytes(AFTER)
+
+    print(f"Websocket payload per rerun (global CSS)")
+    print(f"  before (base64 inline) : {fmt(before):>12}   x{RERUNS} reruns = {fmt(before * RERUNS)}")
+    print(f"  after  (static URL)    : {fmt(after):>12}   x{RERUNS} reruns = {fmt(after * RERUNS)}")
+    print(f"  reduction              : {before / max(after, 1):.0f}x")
+
+    print(f"\nStatic files (HTTP, browser-cached after first load)")
+    print(f"  background.png original: {fmt(os.path.getsize('background.png'))}")
+    for bg in get_backgrounds():
+        for v in bg.variants:
+            print(f"  {v.path:<44} {fmt(os.path.getsize(os.path.join('static', v.path))):>10}")
@@ -0,0 +1,71 @@
+import os
+import time
+import random
+import tempfile
+import duckdb
+import pandas as pd
+from src.config import Config
+
+# =========================================================
+# Benchmark: 회원/일정 검색 - pandas str.contains / SQL ILIKE vs SearchIndex (글자 bigram 역색인)
+# 합성 회원(ROWS명, 한국어 이름 + 설명)에서 검색어별 응답 시간과, 쓰기 1건 커밋 후 색인 갱신 비용을 잽니다.
+# 실행: python bench_search.py
+# =========================================================
+
+ROWS = 100_000
+REPEAT = 5
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+SYLLABLES = "민서지수영현준우진하은도윤재희성연아예주원승태혜경"
+WORDS = ["북한산", "관악산", "도봉산", "설악산", "둘레길", "야간산행", "사진", "총무", "신입", "백패킹", "암벽", "러닝"]
+QUERIES = ["김민수", "북한산", "야간산행", "설악산 사진", "수"]
+
+
+def build_sample_db(path, rng):
+    rows = [
+        (str(i), 1970 + i % 30,
+         rng.choice(SURNAMES) + rng.choice(SYLLABLES) + rng.choice(SYLLABLES),
+         " ".join(rng.sample(WORDS, 3)) + f" 메모{i % 997}")
+        for i in range(ROWS)
+    ]
+    df = pd.DataFrame(rows, columns=["user_no", "birth_year", "name", "description"])
+    with duckdb.connect(path) as conn:
+        conn.execute("CREATE TABLE members AS SELECT user_no, birth_year, name, name AS original_name, description FROM df")
+        conn.execute("ALTER TABLE members ADD PRIMARY KEY (user_no)")
+
+
+def bench(fn, repeat=REPEAT):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, result
+
+
+if __name__ == "__main__":
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as tmp:
+        Config.DB_NAME = os.path.join(tmp, "bench.duckdb")
+        build_sample_db(Config.DB_NAME, rng)
+        from src.services.db_service import DBService
+        from src.services.search_index import SearchService, _get_indexes
+
+        df_all = DBService.query("SELECT * FROM members", cache=False)
+        build_ms, _ = bench(lambda: (setattr(_get_indexes()["members"], "stale", True), SearchService.search("members", "x")), repeat=1)
+
+        print(f"Member search ({ROWS:,} rows, best of {REPEAT})")
+        print(f"  index build (once, then incremental)  {build_ms:8.1f} ms")
+        print(f"  {'query':<14} {'str.contains':>13} {'SQL ILIKE':>11} {'SearchIndex':>12} {'hits':>7}")
+        for q in QUERIES:
+            pandas_ms, _ = bench(lambda: df_all[
+                df_all['name'].str.contains(q, case=False, na=False) | df_all['description'].str.contains(q, case=False, na=False)
+            ])
+            sql_ms, _ = bench(lambda: DBService.query_column(
+                "SELECT user_no FROM members WHERE name ILIKE ? OR description ILIKE ?", (f"%{q}%", f"%{q}%"), cache=False))
+            index_ms, hits = bench(lambda: SearchService.search("members", q))
+            print(f"  {q:<14} {pandas_ms:11.1f}ms {sql_ms:9.1f}ms {index_ms:10.2f}ms {len(hits):7,}")
+
+        # 쓰기 1건: 커밋 직후 해당 행만 다시 읽어 색인 갱신
+        row = pd.DataFrame({"user_no": ["1"], "name": ["홍길동"], "description": ["백패킹 입문"]})
+        write_ms, _ = bench(lambda: DBService.upsert_df("members", row, "user_no"))
+        print(f"\n  upsert 1 row incl. index update       {write_ms:8.1f} ms  (found: {SearchService.search('members', '홍길동')[:1]})")
@@ -0,0 +1,89 @@
+import os
+import time
+import tempfile
+import duckdb
+import pandas as pd
+from src.config import Config
+
+# =========================================================
+# Benchmark: 회원 활동 요약 - 뷰 직접 조회 vs 구체화 테이블
+# 합성 DB(회원 5,000명 / 일정 5,000건 / 참석 100,000건)에 운영 뷰와 같은 형태의 뷰를 만들어 비교합니다.
+# 읽기 비용과 함께 쓰기 1건당 증분 갱신 / 전체 재계산 비용도 측정합니다.
+# 실행: python bench_summary.py
+# =========================================================
+
+REPEAT = 30
+
+
+def build_sample_db(path):
+    with duckdb.connect(path) as conn:
+        conn.execute("CREATE TABLE members AS SELECT CAST(i AS VARCHAR) AS user_no, 1980 + i % 15 AS birth_year, '회원' || i AS name, '서울' AS area, CASE WHEN i % 10 = 0 THEN 'exmember' ELSE 'member' END AS role, i % 30 AS point FROM range(5000) t(i)")
+        conn.execute("CREATE TABLE events AS SELECT CAST(i AS VARCHAR) AS event_id, DATE '2020-01-01' + CAST(i // 2 AS INTEGER) AS date, '산행 ' || i AS title, CAST(i % 5000 AS VARCHAR) AS host, 1 + i % 3 AS score FROM range(5000) t(i)")
+        conn.execute("CREATE TABLE attendees AS SELECT DISTINCT CAST(i % 5000 AS VARCHAR) AS event_id, CAST((i * 7919) % 5000 AS VARCHAR) AS user_no FROM range(100000) t(i)")
+        conn.execute("ALTER TABLE members ADD PRIMARY KEY (user_no)")
+        conn.execute("ALTER TABLE events ADD PRIMARY KEY (event_id)")
+        conn.execute("""
+            CREATE VIEW v_member_attendance_summary AS
+            SELECT m.user_no, CAST(m.birth_year % 100 AS VARCHAR) || '/' || m.name AS MemberID, m.area AS 지역,
+                   SUM(CASE WHEN e.date >= date_trunc('month', today()) THEN e.score ELSE 0 END) AS 획득점수,
+                   COALESCE(m.point, 0) + COALESCE(SUM(e.score), 0) AS 현재포인트,
+                   CASE WHEN m.role = 'exmember' THEN 'exmember'
+                        WHEN MAX(e.date) < today() - INTERVAL 90 DAY THEN '😴🚨'
+                        WHEN COUNT(e.event_id) = 0 THEN '🌱🚨' ELSE '🙂' END AS 회원상태
+            FROM members m
+            LEFT JOIN attendees a ON a.user_no = m.user_no
+            LEFT JOIN events e ON e.event_id = a.event_id
+            GROUP BY m.user_no, m.birth_year, m.name, m.area, m.point, m.role
+        """)
+
+
+def bench(label, fn, repeat=REPEAT):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    print(f"  {label:<44} {elapsed:8.2f} ms")
+    return elapsed
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.duckdb")
+        build_sample_db(path)
+        Config.DB_NAME = path
+
+        from src.services.db_service import DBService as db
+        from src.services.connection_manager import shutdown
+        from src.services.migrations import run_migrations
+        from src.services.summary_service import MemberSummaryService, VIEW, TABLE
+
+        run_migrations()
+        MemberSummaryService.rebuild()
+
+        print("[read] SELECT * (캐시 미사용)")
+        a = bench(f"FROM {VIEW}", lambda: db.query(f"SELECT * FROM {VIEW}", cache=False))
+        b = bench(f"FROM {TABLE}", lambda: db.query(f"SELECT * FROM {TABLE}", cache=False))
+        print(f"  -> x{a / b:.1f}")
+
+        print("[write] 참석 1건 추가/삭제 시 요약 갱신 포함 비용")
+        row = pd.DataFrame({"event_id": ["0"], "user_no": ["1"]})
+
+        def toggle_attendance():
+            with db.transaction() as tx:
+                tx.delete_keys("attendees", "user_no", ["1"])
+                tx.insert_df("attendees", row)
+
+        Config.USE_SUMMARY_TABLE = False
+        a = bench("갱신 없음 (USE_SUMMARY_TABLE=false)", toggle_attendance)
+        MemberSummaryService.rebuild()
+        Config.USE_SUMMARY_TABLE = True
+        b = bench("회원 단위 증분 갱신", toggle_attendance)
+        c = bench("전체 재계산 (rebuild)", MemberSummaryService.rebuild)
+        print(f"  -> 증분 갱신 오버헤드 {b - a:.2f} ms / 전체 재계산 {c:.2f} ms")
+
+        view = db.query(f"SELECT * FROM {VIEW} ORDER BY user_no", cache=False)
+        table = db.query(f"SELECT * FROM {TABLE} ORDER BY user_no", cache=False)
+        assert view.equals(table), "구체화 테이블이 뷰와 다릅니다."
+
+        shutdown()
@@ -0,0 +1,89 @@
+import os
+import time
+import tempfile
+import duckdb
+import pandas as pd
+from src.config import Config
+
+# =========================================================
+# Benchmark: 회원 명부 저장 방식 비교
+# 기존 iterrows() + 행 단위 INSERT OR REPLACE 루프와 DBService.upsert_df를 비교합니다.
+# 실행: python bench_upsert.py  (10,000행 루프 측정은 수 분 이상 걸립니다)
+# =========================================================
+
+SIZES = [1_000, 10_000]
+
+SCHEMA = """
+CREATE TABLE members (
+    user_no VARCHAR PRIMARY KEY, birth_year INTEGER, name VARCHAR, area VARCHAR,
+    role VARCHAR, gender VARCHAR, phone VARCHAR, description VARCHAR, point INTEGER
+)
+"""
+
+
+def make_members(n):
+    return pd.DataFrame({
+        "user_no": [str(100000 + i) for i in range(n)],
+        "birth_year": [1980 + i % 15 for i in range(n)],
+        "name": [f"회원{i}" for i in range(n)],
+        "area": ["서울", "경기", "인천"] * (n // 3) + ["서울"] * (n % 3),
+        "role": "member",
+        "gender": "M",
+        "phone": "010-0000-0000",
+        "description": "",
+        "point": [i % 30 for i in range(n)],
+    })
+
+
+def save_row_by_row(path, df):
+    # 기존 MembersPage 저장 로직 (매 행마다 connect + INSERT OR REPLACE)
+    cols = ", ".join([f'"{c}"' for c in df.columns])
+    placeholders = ", ".join(["?"] * len(df.columns))
+    sql = f"INSERT OR REPLACE INTO members ({cols}) VALUES ({placeholders})"
+    for _, row in df.iterrows():
+        with duckdb.connect(path) as conn:
+            conn.execute(sql, tuple(row))
+
+
+def save_bulk(df):
+    from src.services.db_service import DBService
+    DBService.upsert_df("members", df, "user_no")
+
+
+def reset(path):
+    from src.services.connection_manager import shutdown
+    shutdown()
+    if os.path.exists(path):
+        os.remove(path)
+    with duckdb.connect(path) as conn:
+        conn.execute(SCHEMA)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.duckdb")
+        Config.DB_NAME = path
+
+        for n in SIZES:
+            df = make_members(n)
+            print(f"--- {n:,} rows ---")
+
+            reset(path)
+            start = time.perf_counter()
+            save_row_by_row(path, df)
+            loop = time.perf_counter() - start
+            print(f"iterrows + execute loop   {loop * 1000:10.1f} ms")
+
+            reset(path)
+            start = time.perf_counter()
+            save_bulk(df)
+            bulk = time.perf_counter() - start
+            print(f"DBService.upsert_df       {bulk * 1000:10.1f} ms  (x{loop / bulk:.0f})")
+
+            # 두 번째 저장은 전부 갱신(UPDATE) 경로
+            start = time.perf_counter()
+            save_bulk(df.assign(point=df["point"] + 1))
+            print(f"upsert_df (all updates)   {(time.perf_counter() - start) * 1000:10.1f} ms\n")
+
+        from src.services.connection_manager import shutdown
+        shutdown()
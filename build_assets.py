@@ -0,0 +1,20 @@
+import os
+from src.ui.backgrounds import build_assets, source_images, MANIFEST_PATH, STATIC_DIR
+
+# =========================================================
+# 정적 에셋 빌드
+# background.png, bg_*.png를 여러 너비의 AVIF/WebP로 인코딩해 static/assets/<해시>/에 쓰고
+# static/assets/manifest.json을 갱신합니다. 입력이 바뀌지 않았으면 기존 결과를 재사용합니다.
+# 실행: python build_assets.py
+# =========================================================
+
+if __name__ == "__main__":
+    sources = source_images()
+    print(f"Found {len(sources)} images: {[os.path.basename(s) for s in sources]}")
+    manifest = build_assets(sources)
+    for bg in manifest["backgrounds"]:
+        original = os.path.getsize(next(s for s in sources if os.path.splitext(os.path.basename(s))[0] == bg["name"]))
+        print(f"  {bg['name']} ({original / 1024:,.1f} KB)")
+        for v in bg["variants"]:
+            print(f"    {v['path']:<44} {v['bytes'] / 1024:8.1f} KB")
+    print(f"SUCCESS: {os.path.relpath(MANIFEST_PATH, os.path.dirname(STATIC_DIR))} (version {manifest['version']})")
@@ -0,0 +1,14 @@
+from src.services.migrations import run_migrations
+from src.services.summary_service import MemberSummaryService, TABLE
+from src.services.db_service import DBService
+
+# =========================================================
+# member_attendance_summary 전체 재계산
+# 뷰 정의를 바꿨거나 앱 밖에서 DB를 직접 수정한 경우 실행합니다.
+# 실행: python rebuild_summary.py
+# =========================================================
+
+if __name__ == "__main__":
+    run_migrations()
+    MemberSummaryService.rebuild()
+    print(f"{TABLE} 재계산 완료: {DBService.query_scalar(f'SELECT count(*) FROM {TABLE}', cache=False)}행")
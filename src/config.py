@@ -21,6 +21,37 @@ class Config:
     # Docker 환경에서는 /app/ddodak.duckdb
     DB_NAME = 'ddodak.duckdb' 
     
+    # 조회 결과 캐시 최대 메모리 (MB)
+    QUERY_CACHE_MAX_MB = int(os.getenv("QUERY_CACHE_MAX_MB", "64"))
+    
+    # 회원 활동 요약 조회 경로 (true: 구체화 테이블 member_attendance_summary / false: 뷰 직접 조회)
+    USE_SUMMARY_TABLE = os.getenv("USE_SUMMARY_TABLE", "true").lower() in ("1", "true", "yes")
+    
+    # Gemini 모델 목록 재탐색 주기 (초)
+    AI_MODEL_TTL_SEC = int(os.getenv("AI_MODEL_TTL_SEC", "21600"))
+    
+    # 날씨 예보 API (Open-Meteo 호환, 로컬 스텁: python weather_stub.py)
+    WEATHER_API_URL = os.getenv("WEATHER_API_URL", "https://api.open-meteo.com/v1/forecast")
+    WEATHER_REFRESH_SEC = int(os.getenv("WEATHER_REFRESH_SEC", "1800"))
+    WEATHER_TIMEOUT_SEC = float(os.getenv("WEATHER_TIMEOUT_SEC", "3"))
+    
+    # 홈 대시보드 동시 로딩 (작업 스레드 수 / DB 조회 항목별 제한 시간)
+    DASHBOARD_WORKERS = int(os.getenv("DASHBOARD_WORKERS", "6"))
+    DASHBOARD_TIMEOUT_SEC = float(os.getenv("DASHBOARD_TIMEOUT_SEC", "5"))
+    
+    # 회원/일정 편집 표 한 페이지의 행 수
+    GRID_PAGE_SIZE = int(os.getenv("GRID_PAGE_SIZE", "200"))
+    
+    # 참석자 일괄 입력 이름 매칭 기준 (이름 bigram 유사도 0~1)
+    # AUTO 이상이면서 2순위와 차이가 충분하면 자동 확정, MIN 이상이면 확인 필요, 그 미만은 매칭 실패
+    IMPORT_MATCH_AUTO = float(os.getenv("IMPORT_MATCH_AUTO", "0.8"))
+    IMPORT_MATCH_MIN = float(os.getenv("IMPORT_MATCH_MIN", "0.4"))
+    
+    # 프로필 이미지 썸네일 캐시 (static/ 아래에 두면 정적 파일 URL로 제공)
+    IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", "static/avatars")
+    AVATAR_SIZE = 96  # px (40px 표시 기준 고해상도 대응)
+    IMAGE_FETCH_TIMEOUT_SEC = float(os.getenv("IMAGE_FETCH_TIMEOUT_SEC", "3"))
+    
     # 회칙 링크 (보고서 생성 시 사용)
     RULES_URL = "https://www.band.us/band/85157163/post/4765"
     
@@ -1,3 +1,6 @@
+import time
+import threading
+from contextlib import nullcontext
 import google.generativeai as genai
 from src.config import Config
 
@@ -9,10 +12,32 @@ from src.config import Config
 class AIService:
     """
     Google Gemini API를 이용한 AI 기능을 제공하는 클래스입니다.
+    모델 탐색(list_models)은 네트워크 호출이므로 생성 시점이 아니라 model을 처음 사용할 때 수행하고,
+    결과는 Config.AI_MODEL_TTL_SEC 동안 재사용합니다. (실패 시에는 RETRY_SEC 후 재시도)
     """
-    def __init__(self):
-        self.model = self._setup_model()
-        self.model_name = "None"
+    RETRY_SEC = 60
+
+    def __init__(self, on_discover=None):
+        self._model = None
+        self.model_name = "None"  # 탐색 전에는 "None" (표시용, 탐색을 일으키지 않음)
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._on_discover = on_discover  # 탐색 시간 측정용 컨텍스트 매니저 (service_registry.timed)
+
+    @property
+    def model(self):
+        """
+        사용 가능한 GenerativeModel을 반환합니다. 만료되었으면 다시 탐색합니다.
+        """
+        if time.monotonic() >= self._expires_at:
+            with self._lock:
+                if time.monotonic() >= self._expires_at:
+                    timer = self._on_discover("AIService 모델 탐색") if self._on_discover else nullcontext()
+                    with timer:
+                        self._model = self._setup_model()
+                    ttl = Config.AI_MODEL_TTL_SEC if self._model else self.RETRY_SEC
+                    self._expires_at = time.monotonic() + ttl
+        return self._model
 
     def _setup_model(self):
         """
@@ -0,0 +1,145 @@
+import re
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from src.config import Config
+from src.services.member_index import MemberIndexService
+
+# =========================================================
+# 2. Service Layer - Attendance Import (참석자 일괄 입력)
+# 밴드 댓글/명단을 붙여넣거나 여러 일정의 CSV를 올리면 이름을 회원과 매칭해 한 번에 저장합니다.
+# 이름 매칭은 MemberNameIndex(이름 bigram 행렬)로 전체 입력을 한꺼번에 계산합니다.
+# =========================================================
+
+MATCHED = "matched"        # 자동 확정
+AMBIGUOUS = "ambiguous"    # 후보 중 선택 필요
+UNMATCHED = "unmatched"    # 비슷한 회원 없음
+NO_EVENT = "no_event"      # 등록되지 않은 event_id
+
+# 댓글 한 줄(또는 쉼표 구분)에 한 명씩 적는다고 가정합니다.
+SPLIT = r"[\n,;·]+"
+SKIP = r"불참|취소|못\s*가|못\s*갑"                            # 불참 댓글은 제외
+NUMBERING = r"^\s*\d{1,3}\s*[.)]\s*"                           # "1. 홍길동", "2) 김철수"
+NOISE = r"참석|참가|확정|신청|완료|합니다|할게요|해요|입니다|님(?![가-힣])"
+YEAR = r"(?<!\d)((?:19|20)\d{2}|\d{2})(?!\d)"                 # 85, 1985, 85년생
+NAME = r"([가-힣]{2,}|[A-Za-z][A-Za-z ]*[A-Za-z])"
+
+
+@dataclass(frozen=True)
+class ImportPlan:
+    """
+    매칭 결과. rows는 입력 한 줄당 한 행입니다.
+    - event_id, raw(원문), name, birth_year: 입력에서 읽은 값
+    - status: MATCHED / AMBIGUOUS / UNMATCHED / NO_EVENT
+    - user_no, label, score: 1순위 후보 (UNMATCHED/NO_EVENT는 비어 있음)
+    - candidates: AMBIGUOUS일 때 (user_no, label, score) 후보 목록
+    """
+    rows: pd.DataFrame
+
+    def of(self, status):
+        return self.rows[self.rows['status'] == status]
+
+    def counts(self):
+        return self.rows['status'].value_counts().to_dict()
+
+
+class AttendanceImportService:
+    """
+    붙여넣은 텍스트/CSV -> 입력 행 -> 이름 매칭(ImportPlan) -> 확인 후 저장 순서로 사용합니다.
+    """
+    MARGIN = 0.15    # 자동 확정하려면 1순위가 2순위보다 이만큼 높아야 함
+    TOP_K = 3
+
+    def __init__(self, db):
+        self.db = db
+        self.index = MemberIndexService(db)
+
+    # --- 입력 읽기 ---
+
+    @staticmethod
+    def parse_text(text, event_id):
+        """
+        밴드 댓글/명단 텍스트를 입력 행(event_id, raw, name, birth_year)으로 바꿉니다.
+        '생년/이름/지역' 형식(참가 체크 화면 표시 이름)도 그대로 읽습니다.
+        """
+        raw = pd.Series(re.split(SPLIT, text or ""), dtype=str).str.strip()
+        raw = raw[raw.ne("") & ~raw.str.contains(SKIP)]
+        body = raw.str.replace(NUMBERING, "", regex=True)
+
+        labeled = body.str.count("/") >= 2
+        parts = body.str.split("/")
+        cleaned = body.str.replace(NOISE, " ", regex=True)
+        name = cleaned.str.extract(NAME, expand=False).str.strip()
+        name = name.where(~labeled, parts.str[1].str.strip())
+        year = body.str.extract(YEAR, expand=False)
+        year = year.where(~labeled, parts.str[0].str.extract(YEAR, expand=False))
+
+        rows = pd.DataFrame({'event_id': str(event_id), 'raw': raw, 'name': name, 'birth_year': year})
+        return rows[rows['name'].notna() & rows['name'].ne("")].reset_index(drop=True)
+
+    @staticmethod
+    def parse_csv(file):
+        """
+        여러 일정의 참석자 CSV를 입력 행으로 바꿉니다. event_id, name 컬럼은 필수이고 birth_year는 선택입니다.
+        """
+        df = pd.read_csv(file, dtype=str).rename(columns=lambda c: str(c).strip())
+        missing = {'event_id', 'name'} - set(df.columns)
+        if missing:
+            raise ValueError(f"CSV에 {', '.join(sorted(missing))} 컬럼이 없습니다.")
+        if 'birth_year' not in df.columns:
+            df['birth_year'] = None
+        rows = df[['event_id', 'name', 'birth_year']].apply(lambda c: c.str.strip())
+        rows['raw'] = rows['name']
+        rows = rows[rows['event_id'].notna() & rows['name'].notna() & rows['name'].ne("")]
+        return rows[['event_id', 'raw', 'name', 'birth_year']].reset_index(drop=True)
+
+    # --- 매칭 ---
+
+    def match(self, entries):
+        """
+        입력 행 전체를 한 번에 매칭해 ImportPlan을 반환합니다.
+        """
+        index = self.index.names()
+        rows = entries.reset_index(drop=True).copy()
+        for col in ('status', 'user_no', 'label', 'score'):
+            rows[col] = None
+        rows['candidates'] = [[] for _ in range(len(rows))]
+        rows['status'] = UNMATCHED
+        if rows.empty or len(index.user_nos) == 0:
+            return ImportPlan(rows=rows)
+
+        positions, scores = index.top(rows['name'], rows['birth_year'].tolist(), self.TOP_K)
+        best = scores[:, 0]
+        second = scores[:, 1] if scores.shape[1] > 1 else np.zeros(len(rows))
+        status = np.where(best >= Config.IMPORT_MATCH_MIN, AMBIGUOUS, UNMATCHED).astype(object)
+        status[(best >= Config.IMPORT_MATCH_AUTO) & (best - second >= self.MARGIN)] = MATCHED
+        known = set(self.db.query_column("SELECT event_id FROM events").astype(str))
+        status[~rows['event_id'].astype(str).isin(known).to_numpy()] = NO_EVENT
+
+        found = np.isin(status, [MATCHED, AMBIGUOUS])
+        rows['status'] = status
+        rows['user_no'] = np.where(found, index.user_nos[positions[:, 0]], None)
+        rows['label'] = np.where(found, index.labels[positions[:, 0]], None)
+        rows['score'] = np.where(found, best.round(2), None)
+        rows['candidates'] = [
+            [(index.user_nos[p], index.labels[p], round(float(sc), 2)) for p, sc in zip(ps, ss) if sc >= Config.IMPORT_MATCH_MIN]
+            if st == AMBIGUOUS else []
+            for ps, ss, st in zip(positions, scores, status)
+        ]
+        return ImportPlan(rows=rows)
+
+    # --- 저장 ---
+
+    def save(self, pairs):
+        """
+        (event_id, user_no) 목록을 하나의 트랜잭션으로 추가합니다. 이미 있는 참석 기록은 그대로 둡니다.
+        새로 추가된 행 수를 반환합니다.
+        """
+        pairs = pd.DataFrame(pairs, columns=['event_id', 'user_no']).astype(str).drop_duplicates()
+        if pairs.empty:
+            return 0
+        with self.db.transaction() as tx:
+            before = int(tx.query("SELECT count(*) AS n FROM attendees")['n'].iloc[0])
+            tx.insert_missing("attendees", pairs, ["event_id", "user_no"])
+            after = int(tx.query("SELECT count(*) AS n FROM attendees")['n'].iloc[0])
+        return after - before
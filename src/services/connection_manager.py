@@ -0,0 +1,103 @@
+import atexit
+import threading
+import duckdb
+import streamlit as st
+from src.config import Config
+
+# =========================================================
+# 2. Service Layer - Connection Manager
+# 프로세스 전역 DuckDB 연결을 관리합니다.
+# =========================================================
+
+class ConnectionManager:
+    """
+    프로세스 전체에서 하나의 DuckDB 데이터베이스 핸들을 공유하고,
+    스레드마다 전용 커서(cursor)를 발급하는 연결 관리자입니다.
+    DuckDB 커넥션은 여러 스레드에서 동시에 사용할 수 없으므로
+    Streamlit 세션 스레드별로 `conn.cursor()`를 하나씩 만들어 재사용합니다.
+    """
+    def __init__(self, db_name):
+        self.db_name = db_name
+        self._conn = None
+        self._cursors = {}  # thread ident -> cursor
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def cursor(self):
+        """
+        현재 스레드 전용 커서를 반환합니다. 없으면 새로 생성합니다.
+        """
+        ident = threading.get_ident()
+        cur = self._cursors.get(ident)
+        if cur is not None:
+            return cur
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ConnectionManager가 이미 종료되었습니다.")
+            if self._conn is None:
+                self._conn = duckdb.connect(self.db_name)
+            # 종료된 스레드의 커서 정리 후 새 커서 발급
+            self._prune_dead_threads()
+            cur = self._conn.cursor()
+            self._cursors[ident] = cur
+            return cur
+
+    def release(self):
+        """
+        현재 스레드의 커서를 닫습니다. (작업 스레드 종료 시 호출)
+        """
+        with self._lock:
+            cur = self._cursors.pop(threading.get_ident(), None)
+        if cur is not None:
+            cur.close()
+
+    def close(self):
+        """
+        모든 커서와 공유 데이터베이스 핸들을 닫습니다. 여러 번 호출해도 안전합니다.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for cur in self._cursors.values():
+                try:
+                    cur.close()
+                except Exception as e:
+                    print(f"DB Cursor Close Error: {e}")
+            self._cursors.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def _prune_dead_threads(self):
+        alive = {t.ident for t in threading.enumerate()}
+        for ident in [i for i in self._cursors if i not in alive]:
+            try:
+                self._cursors.pop(ident).close()
+            except Exception as e:
+                print(f"DB Cursor Close Error: {e}")
+
+
+@st.cache_resource(show_spinner=False)
+def get_connection_manager(db_name=None):
+    """
+    프로세스 전역에서 공유되는 ConnectionManager를 반환합니다.
+    모든 세션 스레드가 같은 인스턴스를 사용하며, 프로세스 종료 시 자동으로 닫힙니다.
+    """
+    manager = ConnectionManager(db_name or Config.DB_NAME)
+    atexit.register(manager.close)
+    return manager
+
+
+def shutdown():
+    """
+    공유 연결을 명시적으로 닫고 캐시에서 제거합니다.
+    (배치 스크립트 종료, 테스트 정리, DB 파일 교체 전 등에 사용)
+    """
+    get_connection_manager().close()
+    get_connection_manager.clear()
@@ -0,0 +1,214 @@
+import time
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+try:
+    from streamlit.runtime.scriptrunner_utils.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+except ImportError:  # streamlit < 1.39
+    from streamlit.runtime.scriptrunner.script_run_context import SCRIPT_RUN_CONTEXT_ATTR_NAME
+from src.config import Config
+from src.services.dashboard_service import DashboardService
+from src.services.leaderboard_service import LeaderboardService
+from src.services.image_cache import get_image_cache
+from src.services.mountains import find_mountain
+from src.services.weather_service import get_point_weather, get_weather_provider
+
+# =========================================================
+# 2. Service Layer - Dashboard Loader
+# 홈 대시보드에 필요한 DB 조회와 HTTP 요청을 스레드 풀에서 동시에 실행하고,
+# 결과를 하나의 불변 스냅샷으로 모아 화면(_render_*)에 넘깁니다.
+# 각 작업 스레드는 ConnectionManager의 스레드별 커서를 사용합니다.
+# =========================================================
+
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """
+    한 번의 렌더링에 쓰이는 대시보드 데이터. 요청하지 않았거나 실패/시간 초과한 항목은 None이며,
+    사유는 errors[이름]에 남습니다.
+    """
+    kpis: object = None                    # DashboardKPIs
+    upcoming: pd.DataFrame = None          # 다가오는 일정 (주최자 정보 포함)
+    upcoming_weather: tuple = None         # 일정별 (산 이름, DailyWeather) 또는 None
+    forecast: object = None                # 서울 Forecast
+    event_trend: pd.DataFrame = None       # 월별 공지 수 (최근 5개월)
+    event_stats: pd.DataFrame = None       # 연간 공지 통계
+    member_summary: pd.DataFrame = None    # 회원 활동 요약
+    member_distribution: pd.DataFrame = None  # 생년/성별
+    months: tuple = None                   # 명예의 전당 조회 가능 월
+    leaderboard: object = None             # 이번 달 MonthlyLeaderboard
+    birth_years: pd.DataFrame = None       # 활동 회원 생년 목록
+    avatars: bool = None                   # 프로필 썸네일 미리 받기 완료 여부
+    errors: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    timings: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))  # 이름 -> 초
+
+
+class DashboardLoader:
+    """
+    SOURCES의 각 항목은 (의존 항목, 제한 시간 설정 이름)입니다.
+    의존 항목이 없는 것은 한꺼번에 시작하고, 의존 항목이 끝나면 이어서 시작합니다.
+    제한 시간을 넘긴 항목은 기다리지 않고 None으로 두며, 작업 자체는 백그라운드에서 끝까지 실행되어
+    조회 캐시를 채웁니다. (다음 렌더링에서 바로 사용)
+    """
+    SOURCES = {
+        "kpis": ((), "DASHBOARD_TIMEOUT_SEC"),
+        "upcoming": ((), "DASHBOARD_TIMEOUT_SEC"),
+        "upcoming_weather": (("upcoming",), "WEATHER_TIMEOUT_SEC"),
+        "forecast": ((), "WEATHER_TIMEOUT_SEC"),
+        "event_trend": ((), "DASHBOARD_TIMEOUT_SEC"),
+        "event_stats": ((), "DASHBOARD_TIMEOUT_SEC"),
+        "member_summary": ((), "DASHBOARD_TIMEOUT_SEC"),
+        "member_distribution": ((), "DASHBOARD_TIMEOUT_SEC"),
+        "months": ((), "DASHBOARD_TIMEOUT_SEC"),
+        "leaderboard": ((), "DASHBOARD_TIMEOUT_SEC"),
+        "birth_years": ((), "DASHBOARD_TIMEOUT_SEC"),
+        "avatars": (("upcoming", "leaderboard"), "IMAGE_FETCH_TIMEOUT_SEC"),
+    }
+
+    def __init__(self, db, pool=None):
+        self.dashboard = DashboardService(db)
+        self.leaderboard = LeaderboardService(db)
+        self.pool = pool or get_dashboard_pool()
+
+    def load(self, names):
+        """
+        names에 해당하는 항목을 동시에 불러와 DashboardSnapshot으로 반환합니다.
+        의존 항목은 names에 포함된 경우에만 기다립니다.
+        """
+        names = [n for n in self.SOURCES if n in set(names)]
+        ctx = get_script_run_ctx(suppress_warning=True)
+        values, errors, timings = {}, {}, {}
+        pending = {}   # future -> (name, deadline)
+        waiting = list(names)
+
+        def deps_of(name):
+            return [d for d in self.SOURCES[name][0] if d in names]
+
+        def submit_ready():
+            for name in list(waiting):
+                deps = deps_of(name)
+                if any(d not in values and d not in errors for d in deps):
+                    continue
+                waiting.remove(name)
+                failed = [d for d in deps if d in errors]
+                if failed and len(failed) == len(deps):
+                    errors[name] = f"선행 항목 실패: {', '.join(failed)}"
+                    continue
+                inputs = {d: values.get(d) for d in deps}
+                timeout = getattr(Config, self.SOURCES[name][1])
+                future = self.pool.submit(self._run, ctx, name, inputs)
+                pending[future] = (name, time.monotonic() + timeout)
+
+        submit_ready()
+        while pending:
+            now = time.monotonic()
+            next_deadline = min(deadline for _, deadline in pending.values())
+            done, _ = wait(pending, timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+            for future in done:
+                name, _ = pending.pop(future)
+                try:
+                    values[name], timings[name] = future.result()
+                except Exception as e:
+                    print(f"Dashboard Load Error: {name} ({e})")
+                    errors[name] = str(e)
+            now = time.monotonic()
+            for future, (name, deadline) in list(pending.items()):
+                if now >= deadline:
+                    del pending[future]
+                    print(f"Dashboard Load Timeout: {name}")
+                    errors[name] = "시간 초과"
+            submit_ready()
+
+        for name in waiting:
+            errors.setdefault(name, "선행 항목 미완료")
+        return DashboardSnapshot(
+            **values,
+            errors=MappingProxyType(errors),
+            timings=MappingProxyType(timings),
+        )
+
+    def _run(self, ctx, name, inputs):
+        # 작업 스레드에서도 st.cache_resource 등이 현재 세션 컨텍스트를 찾을 수 있도록 연결
+        # 풀 스레드는 여러 세션이 함께 쓰므로 작업이 끝나면(시간 초과로 버려진 작업 포함) 원래 상태로 되돌림
+        thread = threading.current_thread()
+        previous = get_script_run_ctx(suppress_warning=True)
+        if ctx is not None:
+            add_script_run_ctx(thread, ctx)
+        try:
+            start = time.perf_counter()
+            value = getattr(self, f"_load_{name}")(**inputs)
+            return value, time.perf_counter() - start
+        finally:
+            # add_script_run_ctx(thread, None)은 호출 스레드의 컨텍스트를 다시 붙이므로 속성을 직접 되돌림
+            if previous is not None:
+                setattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME, previous)
+            elif hasattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME):
+                delattr(thread, SCRIPT_RUN_CONTEXT_ATTR_NAME)
+
+    # --- 항목별 로더 ---
+
+    def _load_kpis(self):
+        return self.dashboard.get_kpis()
+
+    def _load_upcoming(self):
+        return self.dashboard.get_upcoming_events()
+
+    def _load_upcoming_weather(self, upcoming):
+        """
+        예정 산행별 (산 이름, 해당 날짜 예보)를 행 순서대로 반환합니다. 알 수 없으면 None.
+        모든 산의 예보는 다중 좌표 요청 한 번으로 가져오고 (좌표, 날짜) 단위로 캐싱됩니다.
+        """
+        mountains = [find_mountain(title) for title in upcoming['title']]
+        targets = [(i, m, pd.to_datetime(d).date()) for i, (m, d) in enumerate(zip(mountains, upcoming['date'])) if m and pd.notna(d)]
+        result = [None] * len(upcoming)
+        if targets:
+            forecasts = get_point_weather().get_many([(lat, lon, d) for _, (_, lat, lon), d in targets])
+            for (i, (name, _, _), _), forecast in zip(targets, forecasts):
+                if forecast:
+                    result[i] = (name, forecast)
+        return tuple(result)
+
+    def _load_forecast(self):
+        # 백그라운드 갱신 스레드가 있으므로 콜드 스타트 직후에만 실제로 기다림
+        return get_weather_provider().get(wait=Config.WEATHER_TIMEOUT_SEC)
+
+    def _load_event_trend(self):
+        return self.dashboard.get_event_trend()
+
+    def _load_event_stats(self):
+        return self.dashboard.get_event_stats()
+
+    def _load_member_summary(self):
+        return self.dashboard.get_member_summary()
+
+    def _load_member_distribution(self):
+        return self.dashboard.get_member_distribution()
+
+    def _load_months(self):
+        return tuple(self.leaderboard.available_months())
+
+    def _load_leaderboard(self):
+        return self.leaderboard.get_month(self.leaderboard.current_month())
+
+    def _load_birth_years(self):
+        return self.dashboard.get_birth_years()
+
+    def _load_avatars(self, upcoming=None, leaderboard=None):
+        urls = []
+        if upcoming is not None:
+            urls += list(upcoming['profile_image_url'])
+        if leaderboard is not None:
+            urls += list(leaderboard.top_hosts['profile_image_url']) + list(leaderboard.top_attendees['profile_image_url'])
+        get_image_cache().prefetch(urls)
+        return True
+
+
+@st.cache_resource(show_spinner=False)
+def get_dashboard_pool():
+    """
+    대시보드 데이터 로딩용 프로세스 전역 스레드 풀 (동시 실행 수 제한)
+    """
+    return ThreadPoolExecutor(max_workers=Config.DASHBOARD_WORKERS, thread_name_prefix="dashboard")
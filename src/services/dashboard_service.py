@@ -0,0 +1,128 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from src.services.summary_service import MemberSummaryService
+
+# =========================================================
+# 2. Service Layer - Dashboard
+# 홈 대시보드에 필요한 집계 데이터를 제공합니다.
+# =========================================================
+
+@dataclass(frozen=True)
+class DashboardKPIs:
+    """
+    대시보드 상단 KPI 카드 값
+    """
+    total_members: int   # 총 회원수 (exmember 제외)
+    active_members: int  # 최근 90일 내 참석한 회원 수
+    total_points: int    # 누적 포인트 (회원 기본 포인트 + 참석 점수)
+
+
+class DashboardService:
+    """
+    대시보드 집계 쿼리를 모아 둔 서비스입니다.
+    결과는 DBService 조회 캐시에 보관되며 members/events/attendees가 변경될 때만 다시 계산됩니다.
+    """
+    # 회원 집계와 참석 집계를 각각 한 번씩만 스캔하는 단일 쿼리
+    KPI_SQL = """
+        WITH member_kpi AS (
+            SELECT COUNT(*) AS total_members, COALESCE(SUM(point), 0) AS base_points
+            FROM members
+            WHERE role<>'exmember'
+        ),
+        attend_kpi AS (
+            SELECT COALESCE(SUM(e.score), 0) AS event_score,
+                   COUNT(DISTINCT a.user_no) FILTER (WHERE e.date >= ?) AS active_members
+            FROM attendees a
+            JOIN events e ON a.event_id = e.event_id
+        )
+        SELECT total_members, active_members, base_points + event_score AS total_points
+        FROM member_kpi, attend_kpi
+    """
+    ACTIVE_DAYS = 90
+
+    # 주최자 정보를 가져오기 위해 members 테이블과 JOIN
+    UPCOMING_SQL = """
+        SELECT e.*, m.name as host_name, m.birth_year, m.area, m.profile_image_url 
+        FROM events e 
+        LEFT JOIN members m ON e.host = m.user_no 
+        WHERE e.date >= ? 
+        ORDER BY e.date ASC 
+        LIMIT ?
+    """
+
+    # 월별 추이 (최근 5개월)
+    # 날짜 컬럼은 함수로 감싸지 않고 범위로만 비교하고(존맵 활용), 그룹핑은 month 키로 합니다.
+    TREND_SQL = """
+        SELECT strftime(month, '%Y-%m') as month, count 
+        FROM (
+            SELECT month, count(*) as count 
+            FROM events 
+            WHERE date >= CAST(date_trunc('month', today() - interval 4 month) AS DATE)
+              AND date <= today()
+            GROUP BY month
+        ) 
+        ORDER BY month
+    """
+
+    # 연간 통계 (최근 12개월)
+    STATS_SQL = """
+        WITH monthly_data AS (
+            SELECT strftime(month, '%Y-%m') as month, cnt 
+            FROM (
+                SELECT month, count(*) as cnt 
+                FROM events 
+                WHERE date >= CAST(date_trunc('month', today() - interval 11 month) AS DATE)
+                  AND date <= today()
+                GROUP BY month
+            )
+        )
+        SELECT 
+            (SELECT AVG(cnt) FROM monthly_data) as avg_cnt,
+            (SELECT month FROM monthly_data ORDER BY cnt DESC, month DESC LIMIT 1) as peak_month,
+            (SELECT cnt FROM monthly_data ORDER BY cnt DESC, month DESC LIMIT 1) as peak_cnt,
+            (SELECT month FROM monthly_data ORDER BY cnt ASC, month ASC LIMIT 1) as low_month,
+            (SELECT cnt FROM monthly_data ORDER BY cnt ASC, month ASC LIMIT 1) as low_cnt,
+            (SELECT count(*) FROM events WHERE date >= CAST(date_trunc('month', today()) AS DATE) AND date <= today()) as current_cnt
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def get_kpis(self):
+        """
+        KPI 세 가지를 한 번의 쿼리로 계산하여 반환합니다.
+        """
+        since = (datetime.now() - timedelta(days=self.ACTIVE_DAYS)).date()
+        row = self.db.query(self.KPI_SQL, (since,)).iloc[0]
+        return DashboardKPIs(
+            total_members=int(row['total_members']),
+            active_members=int(row['active_members']),
+            total_points=int(row['total_points']),
+        )
+
+    def get_upcoming_events(self, limit=3):
+        """
+        오늘 이후 가장 가까운 일정 limit건을 주최자 정보와 함께 반환합니다.
+        """
+        return self.db.query(self.UPCOMING_SQL, (datetime.now().date(), limit))
+
+    def get_event_trend(self):
+        return self.db.query(self.TREND_SQL)
+
+    def get_event_stats(self):
+        return self.db.query(self.STATS_SQL)
+
+    def get_member_summary(self):
+        """
+        회원별 활동 요약 (구체화 테이블 또는 뷰)
+        """
+        return self.db.query(f"SELECT * FROM {MemberSummaryService.relation()}")
+
+    def get_member_distribution(self):
+        """
+        활동 회원의 생년/성별 목록
+        """
+        return self.db.query("SELECT birth_year, gender FROM members WHERE role<>'exmember'")
+
+    def get_birth_years(self):
+        return self.db.query("SELECT DISTINCT birth_year FROM members WHERE role<>'exmember' ORDER BY birth_year")
@@ -0,0 +1,22 @@
+from datetime import date, datetime
+
+# =========================================================
+# 2. Service Layer - Date Helpers
+# 월 단위 필터를 인덱스/존맵을 탈 수 있는 날짜 범위로 변환합니다.
+# =========================================================
+
+def month_bounds(month):
+    """
+    'YYYY-MM' 문자열(또는 date)을 반열린 구간 [해당 월 1일, 다음 달 1일)로 변환합니다.
+    `strftime('%Y-%m', date) = ?` 대신 `date >= ? AND date < ?` 형태로 사용합니다.
+    형식이 잘못되면 ValueError를 발생시킵니다.
+    """
+    if isinstance(month, (date, datetime)):
+        start = date(month.year, month.month, 1)
+    else:
+        start = datetime.strptime(str(month).strip(), "%Y-%m").date()
+    if start.month == 12:
+        end = date(start.year + 1, 1, 1)
+    else:
+        end = date(start.year, start.month + 1, 1)
+    return start, end
@@ -1,40 +1,355 @@
-import duckdb
-from src.config import Config
+import uuid
+import threading
+import pandas as pd
+from contextlib import contextmanager
+from src.services.connection_manager import get_connection_manager
+from src.services.query_cache import MISS, get_query_cache, read_tables, written_table
 
 # =========================================================
 # 2. Service Layer - Database
 # 데이터베이스 연결 및 쿼리 실행을 담당합니다.
 # =========================================================
 
+# 스레드별 진행 중인 트랜잭션 (중첩 호출 시 바깥 트랜잭션에 합류)
+_local = threading.local()
+
+# 쓰기를 관찰하는 객체 목록 (파생 테이블 유지 등, DBService.add_observer 참고)
+_observers = []
+
+
+class Transaction:
+    """
+    DBService.transaction() 블록 안에서 사용하는 작업 단위(Unit of Work)입니다.
+    모든 문장은 같은 커서에서 실행되고, 블록이 끝날 때 한 번만 커밋됩니다.
+    변경된 테이블은 커밋 이후에 조회 캐시에서 무효화됩니다.
+    """
+    def __init__(self, conn):
+        self.conn = conn
+        self.tables = set()
+        self.unknown_write = False
+        self.context = {}  # 옵저버가 커밋 전까지 보관하는 트랜잭션별 상태
+
+    def query(self, sql, params=None):
+        """
+        트랜잭션 안에서 조회합니다. (커밋 전 변경 내용이 보이며 캐시를 거치지 않음)
+        """
+        res = self.conn.execute(sql, params) if params else self.conn.execute(sql)
+        return res.df()
+
+    def query_column(self, sql, params=None):
+        """
+        트랜잭션 안에서 첫 번째 컬럼을 NumPy 배열로 조회합니다.
+        """
+        res = self.conn.execute(sql, params) if params else self.conn.execute(sql)
+        return next(iter(res.fetchnumpy().values()))
+
+    def query_arrow(self, sql, params=None):
+        """
+        트랜잭션 안에서 결과를 pyarrow.Table로 조회합니다.
+        """
+        res = self.conn.execute(sql, params) if params else self.conn.execute(sql)
+        return res.fetch_arrow_table()
+
+    def execute(self, sql, params=None):
+        """
+        SQL 조작 쿼리를 트랜잭션 안에서 실행합니다.
+        어떤 행이 바뀌는지 알 수 없으므로 옵저버에는 대상 행 없이(batch=None) 알립니다.
+        """
+        table = written_table(sql)
+        self._notify(table, None)
+        self._touch(table)
+        if params:
+            self.conn.execute(sql, params)
+        else:
+            self.conn.execute(sql)
+
+    def upsert_df(self, table, df, key):
+        """
+        DataFrame 전체를 하나의 집합 연산(INSERT ... ON CONFLICT)으로 저장합니다.
+        key 컬럼(들)이 같은 행이 있으면 나머지 컬럼을 갱신하고, 없으면 추가합니다.
+        같은 키가 여러 번 나오면 마지막 행이 반영됩니다. 저장한 행 수를 반환합니다.
+        """
+        keys = [key] if isinstance(key, str) else list(key)
+        if df is None or df.empty:
+            return 0
+        if df[keys].isna().any(axis=None):
+            raise ValueError(f"{table}.{', '.join(keys)} 값이 비어 있는 행은 저장할 수 없습니다.")
+
+        batch = df.drop_duplicates(subset=keys, keep="last")
+        cols = ", ".join(f'"{c}"' for c in batch.columns)
+        updates = [c for c in batch.columns if c not in keys]
+        conflict = ", ".join(f'"{k}"' for k in keys)
+        if updates:
+            action = "DO UPDATE SET " + ", ".join(f'"{c}" = EXCLUDED."{c}"' for c in updates)
+        else:
+            action = "DO NOTHING"
+        sql = f'INSERT INTO {table} ({cols}) SELECT {cols} FROM {{src}} ON CONFLICT ({conflict}) {action}'
+
+        self._notify(table, batch)
+        self._run_batch(table, batch, sql)
+        return len(batch)
+
+    def insert_df(self, table, df):
+        """
+        DataFrame 전체를 하나의 INSERT ... SELECT 문으로 추가합니다. 추가한 행 수를 반환합니다.
+        """
+        if df is None or df.empty:
+            return 0
+        cols = ", ".join(f'"{c}"' for c in df.columns)
+        self._notify(table, df)
+        self._run_batch(table, df, f'INSERT INTO {table} ({cols}) SELECT {cols} FROM {{src}}')
+        return len(df)
+
+    def insert_missing(self, table, df, key):
+        """
+        key 컬럼(들) 값이 테이블에 아직 없는 행만 추가합니다. (NOT EXISTS anti-join, 이미 있는 행은 그대로 둠)
+        upsert_df(ON CONFLICT)와 달리 key에 UNIQUE/PRIMARY KEY 제약이 없어도 동작합니다.
+        """
+        keys = [key] if isinstance(key, str) else list(key)
+        if df is None or df.empty:
+            return 0
+        batch = df.drop_duplicates(subset=keys)
+        cols = ", ".join(f'"{c}"' for c in batch.columns)
+        src_cols = ", ".join(f'b."{c}"' for c in batch.columns)
+        match = " AND ".join(f't."{k}" = b."{k}"' for k in keys)
+        self._notify(table, batch)
+        self._run_batch(
+            table, batch,
+            f'INSERT INTO {table} ({cols}) SELECT {src_cols} FROM {{src}} b WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE {match})',
+        )
+        return len(batch)
+
+    def delete_keys(self, table, key, ids):
+        """
+        key 컬럼 값이 ids에 포함된 행을 한 번의 DELETE 문으로 삭제합니다. 삭제 대상 수를 반환합니다.
+        key가 여러 컬럼이면 ids는 같은 순서의 값 튜플 목록입니다. (예: ("event_id", "user_no"))
+        """
+        keys = [key] if isinstance(key, str) else list(key)
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return 0
+        batch = pd.DataFrame(ids if len(keys) > 1 else {keys[0]: ids}, columns=keys)
+        self._notify(table, batch)
+        cols = ", ".join(f'"{k}"' for k in keys)
+        self._run_batch(table, batch, f'DELETE FROM {table} WHERE ({cols}) IN (SELECT {cols} FROM {{src}})')
+        return len(ids)
+
+    def _run_batch(self, table, batch, sql):
+        """
+        DataFrame을 DuckDB 가상 테이블로 등록한 뒤 sql을 실행합니다.
+        sql의 {src} 자리에 등록된 테이블명이 들어갑니다.
+        """
+        self._touch(table)
+        src = f"_batch_{uuid.uuid4().hex}"
+        self.conn.register(src, batch)
+        try:
+            self.conn.execute(sql.replace("{src}", src))
+        finally:
+            self.conn.unregister(src)
+
+    def _notify(self, table, batch):
+        """
+        쓰기 직전에 옵저버에게 알립니다. (삭제될 행을 미리 조회할 수 있도록 실행 전에 호출)
+        """
+        for observer in _observers:
+            observer.on_write(self, table, batch)
+
+    def _touch(self, table):
+        if table is None:
+            self.unknown_write = True
+        else:
+            self.tables.add(table)
+
+
 class DBService:
     """
     DuckDB와의 연결 및 쿼리 실행을 전담하는 클래스입니다.
-    Context Manager를 사용하여 연결 누수를 방지합니다.
+    매 호출마다 DB 파일을 여는 대신 ConnectionManager가 관리하는
+    프로세스 공유 핸들의 스레드별 커서를 재사용합니다.
+    조회 결과는 QueryCache에 보관되며, execute로 테이블이 변경되면 해당 결과만 무효화됩니다.
     """
     @staticmethod
-    def query(sql, params=None):
+    def query(sql, params=None, cache=True):
         """
         SQL 조회 쿼리(SELECT)를 실행하고 결과를 DataFrame으로 반환합니다.
+        cache=False이면 결과 캐시를 거치지 않고 항상 DB에서 조회합니다.
+        (트랜잭션 진행 중에는 커밋 전 데이터가 캐시에 남지 않도록 항상 캐시를 건너뜁니다)
+        """
+        # 호출부에서 컬럼을 추가/수정하는 경우가 많으므로 캐시에는 사본을 보관하고 사본을 반환
+        return DBService._fetch(
+            "df", sql, params, cache,
+            fetch=lambda res: res.df(),
+            size=lambda df: int(df.memory_usage(deep=True).sum()),
+            copy=lambda df: df.copy(),
+        )
+
+    @staticmethod
+    def query_scalar(sql, params=None, cache=True):
+        """
+        첫 번째 행의 첫 번째 값만 반환합니다. (COUNT/SUM 등 KPI 조회용, 결과가 없으면 None)
+        DataFrame을 만들지 않고 fetchone()으로 바로 읽습니다.
         """
+        def fetch(res):
+            row = res.fetchone()
+            return row[0] if row else None
+        return DBService._fetch("scalar", sql, params, cache, fetch=fetch, size=lambda v: 64, copy=None)
+
+    @staticmethod
+    def query_column(sql, params=None, cache=True):
+        """
+        첫 번째 컬럼을 NumPy 배열로 반환합니다. (ID 목록 조회 등, NULL이 있으면 masked array)
+        """
+        def fetch(res):
+            columns = res.fetchnumpy()
+            return next(iter(columns.values()))
+        return DBService._fetch("column", sql, params, cache, fetch=fetch, size=lambda a: int(a.nbytes) + 64, copy=lambda a: a.copy())
+
+    @staticmethod
+    def query_arrow(sql, params=None, cache=True):
+        """
+        결과를 pyarrow.Table로 반환합니다. Arrow 테이블은 불변이므로 캐시 적중 시 복사하지 않습니다.
+        """
+        return DBService._fetch(
+            "arrow", sql, params, cache,
+            fetch=lambda res: res.fetch_arrow_table(),
+            size=lambda t: int(t.nbytes),
+            copy=None,
+        )
+
+    @staticmethod
+    def _fetch(kind, sql, params, cache, fetch, size, copy):
+        """
+        query_* 공통 경로: 결과 캐시 확인 → 실행 → fetch 함수로 변환 → 캐시 저장.
+        copy가 주어지면 캐시에 보관하는 값과 반환하는 값을 분리합니다.
+        """
+        qcache = get_query_cache()
+        use_cache = cache and getattr(_local, "tx", None) is None
+        key = qcache.make_key(sql, params, kind) if use_cache else None
+        cached = qcache.get(key)
+        if cached is not MISS:
+            return copy(cached) if copy else cached
+
+        tables = read_tables(sql)
+        snapshot = qcache.snapshot(tables)
         try:
-            with duckdb.connect(Config.DB_NAME) as conn:
-                return conn.execute(sql, params).df() if params else conn.execute(sql).df()
+            conn = get_connection_manager().cursor()
+            res = conn.execute(sql, params) if params else conn.execute(sql)
+            value = fetch(res)
         except Exception as e:
             print(f"DB Query Error: {e}")
             raise e
 
+        if key is not None:
+            qcache.put(key, tables, copy(value) if copy else value, snapshot, size(value))
+        return value
+
     @staticmethod
     def execute(sql, params=None):
         """
         SQL 조작 쿼리(INSERT, UPDATE, DELETE)를 실행합니다.
+        진행 중인 트랜잭션이 있으면 합류하고, 없으면 한 문장짜리 트랜잭션으로 실행합니다.
+        (옵저버 처리와 캐시 무효화가 커밋 시점에 함께 이루어짐)
+        """
+        with DBService.transaction() as tx:
+            tx.execute(sql, params)
+        return None
+
+    @staticmethod
+    @contextmanager
+    def transaction():
         """
+        여러 조작 쿼리를 하나의 원자적 작업으로 묶습니다.
+
+            with db.transaction() as tx:
+                tx.execute("DELETE FROM attendees WHERE event_id=?", (ev_id,))
+                tx.insert_df("attendees", df_new)
+
+        블록이 정상 종료되면 한 번 커밋하고, 예외가 발생하면 전체를 롤백한 뒤 예외를 다시 던집니다.
+        이미 트랜잭션 안에서 호출되면 새 트랜잭션을 열지 않고 바깥 트랜잭션에 합류합니다.
+        """
+        outer = getattr(_local, "tx", None)
+        if outer is not None:
+            yield outer
+            return
+
+        conn = get_connection_manager().cursor()
+        tx = Transaction(conn)
+        conn.execute("BEGIN TRANSACTION")
+        _local.tx = tx
         try:
-            with duckdb.connect(Config.DB_NAME) as conn:
-                if params:
-                    conn.execute(sql, params)
-                else:
-                    conn.execute(sql)
-                return None
+            yield tx
+            # 파생 데이터 갱신도 같은 트랜잭션에 포함되어 원본과 함께 커밋/롤백됨
+            for observer in _observers:
+                observer.before_commit(tx)
+            conn.execute("COMMIT")
         except Exception as e:
-            print(f"DB Execute Error: {e}")
+            try:
+                conn.execute("ROLLBACK")
+            except Exception as rollback_error:
+                print(f"DB Rollback Error: {rollback_error}")
+            print(f"DB Transaction Error: {e}")
             raise e
+        else:
+            # 커밋된 내용을 바탕으로 하는 메모리 내 파생 데이터 갱신 (실패해도 커밋은 유지)
+            for observer in _observers:
+                try:
+                    observer.after_commit(tx)
+                except Exception as e:
+                    print(f"DB Observer Error: {e}")
+        finally:
+            _local.tx = None
+            # 커밋/롤백 모두 끝난 뒤 무효화 (롤백이어도 무효화는 무해함)
+            qcache = get_query_cache()
+            if tx.unknown_write:
+                qcache.bump(None)
+            for table in tx.tables:
+                qcache.bump(table)
+
+    @staticmethod
+    def upsert_df(table, df, key):
+        """
+        DataFrame 전체를 하나의 트랜잭션, 하나의 집합 연산으로 저장합니다. (Transaction.upsert_df 참고)
+        """
+        with DBService.transaction() as tx:
+            return tx.upsert_df(table, df, key)
+
+    @staticmethod
+    def insert_df(table, df):
+        """
+        DataFrame 전체를 하나의 트랜잭션, 하나의 INSERT 문으로 추가합니다.
+        """
+        with DBService.transaction() as tx:
+            return tx.insert_df(table, df)
+
+    @staticmethod
+    def delete_keys(table, key, ids):
+        """
+        key 컬럼 값이 ids에 포함된 행을 하나의 트랜잭션으로 삭제합니다. (Transaction.delete_keys 참고)
+        """
+        with DBService.transaction() as tx:
+            return tx.delete_keys(table, key, ids)
+
+    @staticmethod
+    def add_observer(observer):
+        """
+        쓰기 옵저버를 등록합니다. 옵저버는 세 메서드를 구현합니다.
+        - on_write(tx, table, batch): 각 쓰기 직전 호출. batch는 대상 행 DataFrame (알 수 없으면 None)
+        - before_commit(tx): 최상위 트랜잭션 커밋 직전 호출
+        - after_commit(tx): 커밋 성공 직후, 조회 캐시 무효화 전에 호출 (같은 커서로 커밋된 내용을 읽을 수 있음)
+        """
+        if observer not in _observers:
+            _observers.append(observer)
+
+    @staticmethod
+    def cache_stats():
+        """
+        조회 결과 캐시의 적중/실패 횟수와 메모리 사용량을 반환합니다.
+        """
+        return get_query_cache().stats()
+
+    @staticmethod
+    def clear_cache():
+        """
+        조회 결과 캐시를 비웁니다. (외부 프로세스가 DB를 수정한 경우 등)
+        """
+        get_query_cache().bump(None)
@@ -0,0 +1,120 @@
+import math
+from src.config import Config
+from src.services.search_index import SearchService
+
+# =========================================================
+# 2. Service Layer - Grid Query (회원/일정 편집 표)
+# 필터를 파라미터 SQL의 WHERE 절로 DB에 넘기고, 표에는 한 페이지씩만 불러옵니다.
+# 검색어는 SearchService(메모리 역색인)로 키 목록을 구해 넘기며, 이때 표는 관련도 순으로 정렬합니다.
+# 필터 선택지(DISTINCT)와 페이지/건수 조회는 조회 캐시를 거치므로 테이블에 쓰기가 있을 때만 다시 조회합니다.
+# =========================================================
+
+class GridFilter:
+    """
+    WHERE 절 조립기. 값은 항상 ? 파라미터로 넘기고, 조건이 없는 필터는 건너뜁니다.
+    """
+    def __init__(self):
+        self.clauses = []
+        self.params = []
+        self.terms = []       # (키 컬럼, 검색어)
+        self.ranking = None   # (키 컬럼, 관련도 순 키 목록)
+
+    def isin(self, column, values):
+        values = list(values or [])
+        if values:
+            self.clauses.append(f'"{column}" IN ({", ".join("?" * len(values))})')
+            self.params.extend(values)
+        return self
+
+    def equals(self, expr, value):
+        if value is not None:
+            self.clauses.append(f"{expr} = ?")
+            self.params.append(value)
+        return self
+
+    def between(self, column, start, end):
+        """
+        반열린 구간 start <= column < end. (예: between("date", *month_bounds("2024-05")))
+        컬럼에 식을 씌우지 않으므로 존맵으로 범위 밖 블록을 건너뛸 수 있습니다.
+        """
+        if start is not None and end is not None:
+            self.clauses.append(f'"{column}" >= ? AND "{column}" < ?')
+            self.params.extend([start, end])
+        return self
+
+    def search(self, table, column, text):
+        """
+        검색어와 맞는 행만 남기고 표를 관련도 순으로 정렬합니다. (SearchService 색인 사용)
+        검색 결과는 WHERE 절에 넣지 않고 GridService가 다른 조건과 교집합을 구해 페이지 단위로 조회합니다.
+        """
+        text = (text or "").strip()
+        if text:
+            self.terms.append((column, text))
+            self.ranking = (column, SearchService.search(table, text))
+        return self
+
+    @property
+    def where(self):
+        return " WHERE " + " AND ".join(self.clauses) if self.clauses else ""
+
+    @property
+    def signature(self):
+        """
+        필터 조건 식별자 (조건이 바뀌면 페이지를 처음으로 되돌리는 데 사용)
+        """
+        return (self.where, tuple(self.params), tuple(self.terms))
+
+
+class GridService:
+    """
+    편집 표 한 페이지와 건수, 필터 선택지를 조회합니다.
+    """
+    def __init__(self, db):
+        self.db = db
+
+    def options(self, table, expr):
+        """
+        필터 선택지 (NULL 제외, 정렬). 예: options("members", "area")
+        """
+        return self.db.query_column(f"SELECT DISTINCT {expr} AS v FROM {table} WHERE v IS NOT NULL ORDER BY v").tolist()
+
+    def total(self, table):
+        return int(self.db.query_scalar(f"SELECT count(*) FROM {table}"))
+
+    def count(self, table, grid_filter):
+        if grid_filter.ranking:
+            return len(self._ranked(table, grid_filter))
+        return int(self.db.query_scalar(f"SELECT count(*) FROM {table}{grid_filter.where}", tuple(grid_filter.params)))
+
+    @staticmethod
+    def pages(count, page_size=None):
+        return max(1, math.ceil(count / (page_size or Config.GRID_PAGE_SIZE)))
+
+    def page(self, table, grid_filter, order_by, page, columns="*", page_size=None):
+        """
+        page(0부터)번째 페이지의 행을 DataFrame으로 반환합니다.
+        검색어가 있으면 관련도 순 키 목록에서 해당 페이지의 키만 골라 조회합니다.
+        """
+        page_size = page_size or Config.GRID_PAGE_SIZE
+        if grid_filter.ranking:
+            column = grid_filter.ranking[0]
+            keys = self._ranked(table, grid_filter)[page * page_size:(page + 1) * page_size]
+            df = self.db.query(f'SELECT {columns} FROM {table} WHERE CAST("{column}" AS VARCHAR) IN (SELECT UNNEST(?))', (keys,))
+            rank = {k: i for i, k in enumerate(keys)}
+            return df.iloc[df[column].astype(str).map(rank).argsort(kind="stable")].reset_index(drop=True)
+        sql = f"SELECT {columns} FROM {table}{grid_filter.where} ORDER BY {order_by} LIMIT ? OFFSET ?"
+        return self.db.query(sql, tuple(grid_filter.params) + (page_size, page * page_size))
+
+    def _ranked(self, table, grid_filter):
+        """
+        관련도 순 검색 결과 중 나머지 필터 조건도 만족하는 키 목록. (필터 객체에 한 번만 계산해 둠)
+        """
+        if getattr(grid_filter, "_ranked", None) is None:
+            column, keys = grid_filter.ranking
+            if grid_filter.clauses:
+                allowed = set(self.db.query_column(
+                    f'SELECT CAST("{column}" AS VARCHAR) FROM {table}{grid_filter.where}', tuple(grid_filter.params)
+                ).tolist())
+                keys = [k for k in keys if k in allowed]
+            grid_filter._ranked = keys
+        return grid_filter._ranked
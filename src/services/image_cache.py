@@ -0,0 +1,219 @@
+import os
+import io
+import json
+import time
+import base64
+import hashlib
+import tempfile
+import threading
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
+import requests
+import streamlit as st
+from PIL import Image, ImageOps
+from src.config import Config
+
+# =========================================================
+# 2. Service Layer - Image Cache
+# 회원 프로필 이미지를 한 번만 내려받아 썸네일로 디스크에 보관하고,
+# 이미지가 없는 회원은 외부 서비스 대신 로컬에서 이니셜 아바타(SVG)를 만듭니다.
+# =========================================================
+
+# 아바타 배경색 팔레트 (이름 해시로 선택)
+AVATAR_COLORS = ["#e76f51", "#f4a261", "#2a9d8f", "#264653", "#8ab17d", "#6d597a", "#b56576", "#457b9d"]
+
+
+def initials(name):
+    """
+    아바타에 표시할 글자를 고릅니다. 한글 세 글자 이상이면 이름(성 제외) 두 글자, 그 외에는 앞 두 글자.
+    """
+    name = "".join(ch for ch in str(name or "") if not ch.isdigit()).strip()
+    if not name:
+        return "?"
+    if "가" <= name[0] <= "힣":
+        return name[1:3] if len(name) >= 3 else name[:2]
+    words = name.split()
+    if len(words) >= 2:
+        return (words[0][0] + words[1][0]).upper()
+    return name[:2].upper()
+
+
+def initials_avatar(name):
+    """
+    이름 이니셜 원형 아바타를 SVG data URI로 반환합니다. (글꼴은 브라우저가 렌더링하므로 한글도 그대로 표시)
+    """
+    text = initials(name)
+    color = AVATAR_COLORS[int(hashlib.md5(str(name).encode()).hexdigest(), 16) % len(AVATAR_COLORS)]
+    font_size = 30 if len(text) == 1 else 24
+    svg = (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="64" height="64" viewBox="0 0 64 64">'
+        f'<circle cx="32" cy="32" r="32" fill="{color}"/>'
+        f'<text x="50%" y="50%" dy=".35em" text-anchor="middle" font-family="sans-serif" '
+        f'font-size="{font_size}" font-weight="bold" fill="#fff">{escape(text)}</text></svg>'
+    )
+    return "data:image/svg+xml;base64," + base64.b64encode(svg.encode()).decode()
+
+
+class ImageCache:
+    """
+    원격 프로필 이미지를 정사각형 썸네일(WebP)로 변환해 cache_dir에 저장합니다.
+    파일명은 썸네일 내용의 해시이며, 원본 URL → 해시 매핑은 index.json에 보관해 재시작 후에도 재사용합니다.
+    cache_dir가 정적 파일 경로(static/)이고 정적 서빙이 켜져 있으면 URL 경로로, 아니면 data URI로 참조합니다.
+    """
+    FAILURE_RETRY_SEC = 3600
+    WORKERS = 4
+
+    def __init__(self, cache_dir, size, timeout):
+        self.cache_dir = cache_dir
+        self.size = size
+        self.timeout = timeout
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._index = self._load_index()  # url -> 파일명
+        self._failed = {}                 # url -> 실패 시각 (monotonic)
+        self._data_uris = {}              # 파일명 -> data URI
+        self._queued = set()              # 백그라운드로 내려받는 중인 URL
+        self._pool = ThreadPoolExecutor(max_workers=self.WORKERS, thread_name_prefix="image-cache")
+        self._lock = threading.Lock()
+
+    def avatar(self, url, name):
+        """
+        <img src>에 넣을 값을 반환합니다. 이미지가 없거나 받을 수 없으면 이니셜 아바타를 반환합니다.
+        화면을 그리는 중에는 내려받지 않습니다. 아직 썸네일이 없으면 이니셜 아바타를 반환하고
+        백그라운드로 내려받아 두어 다음 화면부터 사진을 씁니다. (미리 받으려면 prefetch 사용)
+        """
+        if not isinstance(url, str) or not url.strip():
+            return initials_avatar(name)
+        url = url.strip()
+        filename = self._cached(url)
+        if filename:
+            return self._src(filename)
+        self._enqueue(url)
+        return initials_avatar(name)
+
+    def prefetch(self, urls):
+        """
+        아직 캐시에 없는 URL들을 병렬로 내려받습니다.
+        이미 내려받는 중(백그라운드 대기열/다른 세션의 prefetch)이거나 최근 실패한 URL은 건너뜁니다.
+        """
+        pending = self._claim(u.strip() for u in urls if isinstance(u, str) and u.strip() and u.strip() not in self._index)
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=self.WORKERS) as pool:
+                list(pool.map(self._fetch_queued, pending))
+        elif pending:
+            self._fetch_queued(pending[0])
+
+    def _cached(self, url):
+        """
+        이미 저장된 썸네일 파일명. 없으면 None (내려받지 않음)
+        """
+        with self._lock:
+            filename = self._index.get(url)
+        if filename and os.path.exists(os.path.join(self.cache_dir, filename)):
+            return filename
+        return None
+
+    def _claim(self, urls):
+        """
+        urls 중 지금 내려받아도 되는 것(진행 중이 아니고 최근 실패하지 않은 URL)을 진행 중으로 표시해 반환합니다.
+        표시한 URL은 _fetch_queued가 끝날 때 해제됩니다.
+        """
+        now = time.monotonic()
+        claimed = []
+        with self._lock:
+            for url in dict.fromkeys(urls):
+                failed_at = self._failed.get(url)
+                if url in self._queued or (failed_at is not None and now - failed_at < self.FAILURE_RETRY_SEC):
+                    continue
+                self._queued.add(url)
+                claimed.append(url)
+        return claimed
+
+    def _enqueue(self, url):
+        """
+        url을 백그라운드 내려받기 대기열에 넣습니다. (이미 진행 중이거나 최근 실패한 URL은 건너뜀)
+        """
+        for url in self._claim([url]):
+            self._pool.submit(self._fetch_queued, url)
+
+    def _fetch_queued(self, url):
+        try:
+            self._ensure(url)
+        finally:
+            with self._lock:
+                self._queued.discard(url)
+
+    def _ensure(self, url):
+        with self._lock:
+            filename = self._index.get(url)
+            if filename and os.path.exists(os.path.join(self.cache_dir, filename)):
+                return filename
+            failed_at = self._failed.get(url)
+            if failed_at is not None and time.monotonic() - failed_at < self.FAILURE_RETRY_SEC:
+                return None
+        try:
+            res = requests.get(url, timeout=self.timeout)
+            res.raise_for_status()
+            thumb = self._thumbnail(res.content)
+        except Exception as e:
+            print(f"Image Cache Error: {url} ({e})")
+            with self._lock:
+                self._failed[url] = time.monotonic()
+            return None
+
+        filename = hashlib.sha256(thumb).hexdigest()[:20] + ".webp"
+        path = os.path.join(self.cache_dir, filename)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if not os.path.exists(path):
+            # 같은 썸네일을 동시에 쓰는 경우가 있으므로 쓰기마다 고유한 임시 파일을 거쳐 교체
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+                f.write(thumb)
+            os.replace(f.name, path)
+        with self._lock:
+            self._index[url] = filename
+            self._failed.pop(url, None)
+            self._save_index()
+        return filename
+
+    def _thumbnail(self, content):
+        with Image.open(io.BytesIO(content)) as img:
+            img = ImageOps.exif_transpose(img).convert("RGB")
+            thumb = ImageOps.fit(img, (self.size, self.size), Image.LANCZOS)
+            out = io.BytesIO()
+            thumb.save(out, "WEBP", quality=80)
+            return out.getvalue()
+
+    def _src(self, filename):
+        static_root = os.path.abspath("static")
+        path = os.path.abspath(os.path.join(self.cache_dir, filename))
+        if st.get_option("server.enableStaticServing") and path.startswith(static_root + os.sep):
+            return "app/static/" + os.path.relpath(path, static_root).replace(os.sep, "/")
+        with self._lock:
+            uri = self._data_uris.get(filename)
+        if uri is None:
+            with open(path, "rb") as f:
+                uri = "data:image/webp;base64," + base64.b64encode(f.read()).decode()
+            with self._lock:
+                self._data_uris[filename] = uri
+        return uri
+
+    def _load_index(self):
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = self._index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, ensure_ascii=False)
+        os.replace(tmp, self._index_path)
+
+
+@st.cache_resource(show_spinner=False)
+def get_image_cache():
+    """
+    프로세스 전역 ImageCache를 반환합니다.
+    """
+    return ImageCache(Config.IMAGE_CACHE_DIR, size=Config.AVATAR_SIZE, timeout=Config.IMAGE_FETCH_TIMEOUT_SEC)
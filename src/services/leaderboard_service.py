@@ -0,0 +1,144 @@
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+import pandas as pd
+import streamlit as st
+from src.config import Config
+from src.services.dates import month_bounds
+from src.services.query_cache import get_query_cache
+
+# =========================================================
+# 2. Service Layer - Leaderboard (명예의 전당)
+# 월별 공지왕/참석왕/인기 산행/생년별 참가 순위를 한 번에 계산합니다.
+# =========================================================
+
+@dataclass(frozen=True)
+class MonthlyLeaderboard:
+    """
+    한 달 치 명예의 전당 집계 결과
+    """
+    month: str                       # 'YYYY-MM'
+    top_hosts: pd.DataFrame          # name, profile_image_url, cnt
+    top_attendees: pd.DataFrame      # name, profile_image_url, score
+    popular_events: pd.DataFrame     # title, cnt
+    birth_year_attendance: pd.DataFrame  # birth_year, cnt (실인원)
+
+
+class _LeaderboardStore:
+    """
+    월별 집계 결과를 프로세스 전역에 보관합니다.
+    LRU로 밀려나지 않으며, 원본 테이블 세대가 바뀐 경우에만 다시 계산합니다.
+    """
+    def __init__(self):
+        self._boards = {}  # month -> (generations, MonthlyLeaderboard)
+        self._lock = threading.Lock()
+
+    def get(self, month, generations):
+        with self._lock:
+            entry = self._boards.get(month)
+        if entry and entry[0] == generations:
+            return entry[1]
+        return None
+
+    def put(self, month, generations, board):
+        with self._lock:
+            self._boards[month] = (generations, board)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_store():
+    return _LeaderboardStore()
+
+
+class LeaderboardService:
+    """
+    명예의 전당 순위 엔진입니다.
+    공지왕(events 기준)과 참석 기반 순위 3종(GROUPING SETS)을 하나의 쿼리로 계산합니다.
+    """
+    SOURCE_TABLES = ("events", "attendees", "members")
+    TOP_N = 3
+
+    # month_attend 한 번의 스캔으로 참석왕/인기 산행/생년별 실인원을 GROUPING SETS로 집계하고,
+    # 공지왕은 같은 CTE(month_events)에서 UNION ALL로 붙입니다.
+    MONTH_SQL = """
+        WITH month_events AS (
+            SELECT event_id, title, host, score
+            FROM events
+            WHERE date >= ? AND date < ?
+        ),
+        month_attend AS (
+            SELECT me.title, me.score, a.user_no,
+                   m.user_no IS NOT NULL AS is_member, m.name, m.profile_image_url, m.birth_year
+            FROM month_events me
+            JOIN attendees a ON a.event_id = me.event_id
+            LEFT JOIN members m ON a.user_no = m.user_no
+        )
+        SELECT CASE WHEN GROUPING(title) = 0 THEN 'event'
+                    WHEN GROUPING(birth_year) = 0 THEN 'birth'
+                    ELSE 'attendee' END AS board,
+               is_member, name, profile_image_url, title, birth_year,
+               SUM(score) AS score, COUNT(user_no) AS cnt, COUNT(DISTINCT user_no) AS people
+        FROM month_attend
+        GROUP BY GROUPING SETS ((is_member, name, profile_image_url), (title), (is_member, birth_year))
+        UNION ALL
+        SELECT 'host' AS board, TRUE, m.name, m.profile_image_url, NULL, NULL,
+               NULL, COUNT(*) AS cnt, NULL
+        FROM month_events me
+        JOIN members m ON me.host = m.user_no
+        GROUP BY m.name, m.profile_image_url
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    @staticmethod
+    def current_month():
+        return datetime.now(Config.KST).strftime('%Y-%m')
+
+    def available_months(self):
+        """
+        일정이 등록된 월 목록(최신순)을 반환합니다. 이번 달은 항상 포함됩니다.
+        """
+        months = self.db.query_column("SELECT strftime(month, '%Y-%m') FROM events WHERE month IS NOT NULL GROUP BY month ORDER BY month DESC").tolist()
+        current = self.current_month()
+        if current not in months:
+            months.insert(0, current)
+        return months
+
+    def get_month(self, month):
+        """
+        month('YYYY-MM')의 순위를 반환합니다.
+        이미 계산한 달은 원본 테이블에 쓰기가 없었다면 조인 없이 메모리에서 바로 반환합니다.
+        """
+        store = _get_store()
+        qcache = get_query_cache()
+        # 계산 전에 세대를 기록해야 계산 도중의 쓰기를 놓치지 않음
+        generations = tuple(qcache.generation(t) for t in self.SOURCE_TABLES)
+        board = store.get(month, generations)
+        if board is None:
+            board = self._compute(month)
+            store.put(month, generations, board)
+        return board
+
+    def _compute(self, month):
+        df = self.db.query(self.MONTH_SQL, month_bounds(month), cache=False)
+        n = self.TOP_N
+
+        hosts = df[df['board'] == 'host']
+        hosts = hosts.sort_values(['cnt', 'name'], ascending=[False, True]).head(n)
+
+        attendees = df[(df['board'] == 'attendee') & df['is_member'].fillna(False).astype(bool)]
+        attendees = attendees.sort_values(['score', 'name'], ascending=[False, True]).head(n)
+
+        events = df[df['board'] == 'event']
+        events = events.sort_values(['cnt', 'title'], ascending=[False, True]).head(n)
+
+        births = df[(df['board'] == 'birth') & df['is_member'].fillna(False).astype(bool)]
+
+        return MonthlyLeaderboard(
+            month=month,
+            top_hosts=hosts[['name', 'profile_image_url', 'cnt']].reset_index(drop=True),
+            top_attendees=attendees[['name', 'profile_image_url', 'score']].reset_index(drop=True),
+            popular_events=events[['title', 'cnt']].reset_index(drop=True),
+            birth_year_attendance=births[['birth_year', 'people']].rename(columns={'people': 'cnt'}).reset_index(drop=True),
+        )
@@ -0,0 +1,209 @@
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+import numpy as np
+import streamlit as st
+from src.services.query_cache import get_query_cache
+
+# =========================================================
+# 2. Service Layer - Member Label Index
+# 참가 체크 화면의 표시 이름('생년/이름/지역') <-> 회원 번호(user_no) 대응표입니다.
+# members 테이블 세대마다 한 번만 만들고, 선택 결과 변환은 dict 조회(O(1))로 처리합니다.
+# 일괄 입력용 이름 n-gram 색인(MemberNameIndex)도 같은 방식으로 보관합니다.
+# =========================================================
+
+@dataclass(frozen=True)
+class MemberLabelIndex:
+    """
+    활동 회원(exmember 제외)의 표시 이름 목록과 양방향 대응표.
+    표시 이름이 겹치는 회원은 뒤에 회원 번호를 붙여 구분합니다.
+    """
+    labels: tuple                    # 표시 순서 (생년, 이름)
+    user_nos: tuple                  # labels와 같은 순서의 회원 번호
+    by_label: MappingProxyType       # 표시 이름 -> user_no
+    by_user: MappingProxyType        # user_no -> 표시 이름
+
+    def labels_for(self, user_nos):
+        """
+        회원 번호 목록을 표시 이름 목록으로 바꿉니다. (목록에 없는 회원은 제외)
+        """
+        return [self.by_user[u] for u in user_nos if u in self.by_user]
+
+    def user_nos_for(self, labels):
+        return [self.by_label[label] for label in labels]
+
+
+def name_grams(name, n=2):
+    """
+    이름의 글자 n-gram 집합. 앞뒤에 공백을 붙여 두 글자 이름도 n-gram이 여러 개 나오게 합니다.
+    """
+    text = " " + "".join(str(name).lower().split()) + " "
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def birth_yy(year):
+    """
+    생년을 두 자리(0~99)로 맞춥니다. (85 / 1985 모두 85) 알 수 없으면 -1
+    """
+    try:
+        return int(year) % 100
+    except (TypeError, ValueError):
+        return -1
+
+
+@dataclass(frozen=True)
+class MemberNameIndex:
+    """
+    회원 이름/원래 이름(original_name)의 bigram 행렬. 여러 이름을 행렬곱 한 번으로 전체 회원과 비교합니다.
+    유사도는 Dice 계수(2|A∩B| / (|A|+|B|))이며, 이름 키가 여러 개인 회원은 가장 높은 값을 씁니다.
+    """
+    YEAR_MISMATCH = 0.7              # 입력한 생년이 다르면 유사도에 곱하는 값
+
+    user_nos: np.ndarray             # 회원 번호 (회원 순서)
+    labels: np.ndarray               # 표시 이름 '생년/이름/지역'
+    years: np.ndarray                # 두 자리 생년 (-1: 없음)
+    vocab: MappingProxyType          # bigram -> 열 번호
+    grams: np.ndarray                # (bigram 수, 이름 키 수) float32, 키가 가진 bigram이면 1
+    key_sizes: np.ndarray            # 이름 키별 bigram 수
+    key_starts: np.ndarray           # 회원별 첫 이름 키 위치 (키는 회원 순서로 정렬)
+
+    def scores(self, names, years=None):
+        """
+        (입력 이름 수, 회원 수) 유사도 행렬. years는 입력별 생년 (없으면 None/NaN)
+        """
+        names = list(names)
+        query = np.zeros((len(names), len(self.vocab)), dtype=np.float32)
+        sizes = np.zeros(len(names), dtype=np.float32)
+        for row, name in enumerate(names):
+            grams = name_grams(name)
+            sizes[row] = len(grams)
+            cols = [self.vocab[g] for g in grams if g in self.vocab]
+            query[row, cols] = 1
+        overlap = query @ self.grams
+        dice = 2 * overlap / (sizes[:, None] + self.key_sizes[None, :])
+        # 이름 키 -> 회원: 회원별 최댓값
+        scores = np.maximum.reduceat(dice, self.key_starts, axis=1) if len(self.key_starts) else dice
+        if years is not None:
+            query_years = np.array([birth_yy(y) for y in years])
+            known = (query_years[:, None] >= 0) & (self.years[None, :] >= 0)
+            mismatch = known & (query_years[:, None] != self.years[None, :])
+            scores = np.where(mismatch, scores * self.YEAR_MISMATCH, scores)
+        return scores
+
+    def top(self, names, years=None, k=3):
+        """
+        입력별 상위 k명의 (회원 위치, 유사도)를 높은 순으로 반환합니다. 각각 (입력 수, k) 배열
+        """
+        scores = self.scores(names, years)
+        k = min(k, scores.shape[1])
+        if k == 0:
+            return np.empty((len(scores), 0), dtype=int), np.empty((len(scores), 0))
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        part_scores = np.take_along_axis(scores, part, axis=1)
+        order = np.argsort(-part_scores, axis=1, kind="stable")
+        return np.take_along_axis(part, order, axis=1), np.take_along_axis(part_scores, order, axis=1)
+
+
+class _MemberIndexStore:
+    """
+    종류별로 최근에 만든 색인 하나씩을 프로세스 전역에 보관합니다. members 세대가 바뀐 경우에만 다시 만듭니다.
+    """
+    def __init__(self):
+        self._entries = {}  # kind -> (generation, index)
+        self._lock = threading.Lock()
+
+    def get(self, kind, generation):
+        with self._lock:
+            entry = self._entries.get(kind)
+        if entry and entry[0] == generation:
+            return entry[1]
+        return None
+
+    def put(self, kind, generation, index):
+        with self._lock:
+            self._entries[kind] = (generation, index)
+
+
+@st.cache_resource(show_spinner=False)
+def _get_store():
+    return _MemberIndexStore()
+
+
+class MemberIndexService:
+    """
+    표시 이름은 SQL에서 한 번에 만들고(행 단위 apply 없음), 결과를 MemberLabelIndex로 묶습니다.
+    """
+    LABELS_SQL = """
+        SELECT user_no, concat(birth_year, '/', name, '/', area) AS label
+        FROM members
+        WHERE role <> 'exmember'
+        ORDER BY birth_year, name
+    """
+    NAMES_SQL = """
+        SELECT user_no, birth_year, name, original_name,
+               concat(birth_year, '/', name, '/', area, CASE WHEN role = 'exmember' THEN ' (탈퇴)' ELSE '' END) AS label
+        FROM members
+        ORDER BY birth_year, name
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def get(self):
+        return self._cached("labels", self._build)
+
+    def names(self):
+        """
+        이름 n-gram 색인 (일괄 입력 매칭용, 탈퇴 회원 포함)
+        """
+        return self._cached("names", self._build_names)
+
+    @staticmethod
+    def _cached(kind, build):
+        store = _get_store()
+        # 만들기 전에 세대를 기록해야 만드는 도중의 쓰기를 놓치지 않음
+        generation = get_query_cache().generation("members")
+        index = store.get(kind, generation)
+        if index is None:
+            index = build()
+            store.put(kind, generation, index)
+        return index
+
+    def _build(self):
+        df = self.db.query(self.LABELS_SQL, cache=False)
+        user_nos = df['user_no'].astype(str)
+        labels = df['label']
+        dup = labels.duplicated(keep=False)
+        labels = labels.where(~dup, labels + " #" + user_nos)
+        return MemberLabelIndex(
+            labels=tuple(labels),
+            user_nos=tuple(user_nos),
+            by_label=MappingProxyType(dict(zip(labels, user_nos))),
+            by_user=MappingProxyType(dict(zip(user_nos, labels))),
+        )
+
+    def _build_names(self):
+        df = self.db.query(self.NAMES_SQL, cache=False)
+        # 이름 키: 회원마다 name, original_name (같으면 하나만). 비어 있는 키는 어떤 입력과도 겹치지 않음
+        keys = df[['name', 'original_name']].fillna("").astype(str).reset_index(names='member')
+        keys = keys.melt(id_vars='member', value_name='key').drop_duplicates(['member', 'key'])
+        keys = keys.sort_values('member', kind="stable")
+        key_grams = [name_grams(k) for k in keys['key']]
+
+        vocab = {}
+        for grams in key_grams:
+            for g in grams:
+                vocab.setdefault(g, len(vocab))
+        matrix = np.zeros((len(vocab), len(key_grams)), dtype=np.float32)
+        for col, grams in enumerate(key_grams):
+            matrix[[vocab[g] for g in grams], col] = 1
+
+        return MemberNameIndex(
+            user_nos=df['user_no'].astype(str).to_numpy(),
+            labels=df['label'].to_numpy(),
+            years=np.array([birth_yy(y) for y in df['birth_year']]),
+            vocab=MappingProxyType(vocab),
+            grams=matrix,
+            key_sizes=matrix.sum(axis=0),
+            key_starts=np.searchsorted(keys['member'].to_numpy(), np.arange(len(df))),
+        )
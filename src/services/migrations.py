@@ -0,0 +1,120 @@
+import pandas as pd
+import streamlit as st
+from src.services.db_service import DBService
+
+# =========================================================
+# 2. Service Layer - Schema Migrations
+# 앱 시작 시 DB 스키마를 현재 코드가 기대하는 형태로 맞춥니다.
+# 모든 마이그레이션은 스키마를 확인한 뒤 필요한 경우에만 실행되므로 여러 번 실행해도 안전합니다.
+# =========================================================
+
+# events.month: 행사일이 속한 달의 1일 (월별 집계/그룹핑용 타입 있는 키)
+MONTH_EXPR = "CAST(date_trunc('month', date) AS DATE)"
+
+
+def _columns(table):
+    return DBService.query(
+        "SELECT column_name, data_type, is_nullable, column_default FROM information_schema.columns "
+        "WHERE table_name = ? ORDER BY ordinal_position",
+        (table,), cache=False,
+    )
+
+
+def _rebuild_table(tx, table, column_types=None, using=None, extra_columns=()):
+    """
+    테이블을 같은 제약조건(PK/UNIQUE/CHECK/FK, NOT NULL, DEFAULT)으로 다시 만들면서
+    일부 컬럼 타입을 바꾸거나(column_types, 변환식은 using) 생성 컬럼을 덧붙입니다.
+    DuckDB는 인덱스가 있는 테이블의 ALTER COLUMN TYPE과 생성 컬럼 ADD를 지원하지 않으므로
+    새 테이블 생성 → 데이터 복사(CAST) → 기존 테이블 삭제 → 이름 교체 순서로 진행합니다.
+    """
+    column_types = column_types or {}
+    using = using or {}
+    columns = _columns(table)
+    constraints = DBService.query(
+        "SELECT constraint_text FROM duckdb_constraints() WHERE table_name = ? AND constraint_type <> 'NOT NULL'",
+        (table,), cache=False,
+    )['constraint_text'].tolist()
+    indexes = DBService.query_column(
+        "SELECT sql FROM duckdb_indexes() WHERE table_name = ? AND sql IS NOT NULL", (table,), cache=False,
+    ).tolist()
+
+    defs, selects = [], []
+    for _, col in columns.iterrows():
+        name = col['column_name']
+        col_type = column_types.get(name, col['data_type'])
+        col_def = f'"{name}" {col_type}'
+        if col['is_nullable'] == 'NO':
+            col_def += " NOT NULL"
+        if pd.notna(col['column_default']):
+            col_def += f" DEFAULT {col['column_default']}"
+        defs.append(col_def)
+        selects.append(using.get(name, f'"{name}"'))
+    defs.extend(extra_columns)
+
+    tmp = f"{table}__migrated"
+    cols = ", ".join(f'"{c}"' for c in columns['column_name'])
+    tx.execute(f"CREATE TABLE {tmp} ({', '.join(defs + constraints)})")
+    tx.execute(f"INSERT INTO {tmp} ({cols}) SELECT {', '.join(selects)} FROM {table}")
+    tx.execute(f"DROP TABLE {table}")
+    tx.execute(f"ALTER TABLE {tmp} RENAME TO {table}")
+    for index_sql in indexes:
+        tx.execute(index_sql)
+
+
+def migrate_events_date_month(tx):
+    """
+    1) events.date를 DATE 타입으로 보장합니다. (VARCHAR/TIMESTAMP로 저장된 기존 DB 대응)
+    2) 행사일이 속한 달의 1일을 담는 생성 컬럼 events.month를 추가합니다.
+    변환할 수 없는 날짜가 있으면 예외가 발생하고 전체가 롤백됩니다.
+    """
+    columns = _columns("events").set_index('column_name')['data_type'].to_dict()
+    needs_date = columns.get("date") != "DATE"
+    needs_month = "month" not in columns
+    if not (needs_date or needs_month):
+        return False
+
+    column_types, using = {}, {}
+    if needs_date:
+        column_types["date"] = "DATE"
+        using["date"] = 'CAST(CAST("date" AS TIMESTAMP) AS DATE)'
+    extra = [f"month DATE GENERATED ALWAYS AS ({MONTH_EXPR}) VIRTUAL"] if needs_month else []
+    _rebuild_table(tx, "events", column_types, using, extra)
+    return True
+
+
+def migrate_materialized_refresh(tx):
+    """
+    구체화 테이블별 마지막 전체 재계산 날짜를 기록하는 materialized_refresh 테이블을 만듭니다.
+    """
+    if not _columns("materialized_refresh").empty:
+        return False
+    tx.execute("CREATE TABLE materialized_refresh (name VARCHAR PRIMARY KEY, refreshed_on DATE NOT NULL)")
+    return True
+
+
+MIGRATIONS = [
+    ("events.date DATE 타입 + month 생성 컬럼", migrate_events_date_month),
+    ("materialized_refresh 메타 테이블", migrate_materialized_refresh),
+]
+
+
+def run_migrations():
+    """
+    등록된 마이그레이션을 순서대로 하나의 트랜잭션에서 실행하고, 적용된 항목 이름을 반환합니다.
+    """
+    applied = []
+    with DBService.transaction() as tx:
+        for name, migrate in MIGRATIONS:
+            if migrate(tx):
+                applied.append(name)
+    for name in applied:
+        print(f"DB Migration Applied: {name}")
+    return applied
+
+
+@st.cache_resource(show_spinner="🛠️ DB 스키마 점검 중...")
+def ensure_schema():
+    """
+    프로세스당 한 번만 마이그레이션을 실행합니다.
+    """
+    return run_migrations()
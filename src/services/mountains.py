@@ -0,0 +1,48 @@
+import re
+from functools import lru_cache
+
+# =========================================================
+# 2. Service Layer - Mountain Index
+# 일정 제목(예: "북한산 정기산행")에서 산 이름을 찾아 정상 좌표로 변환합니다.
+# =========================================================
+
+# 산 이름 -> (위도, 경도) : 정상 부근 좌표 (날씨 조회용이므로 소수점 셋째 자리 정도면 충분)
+MOUNTAINS = {
+    # 서울/수도권
+    "북한산": (37.659, 126.978), "도봉산": (37.699, 127.016), "관악산": (37.445, 126.964),
+    "수락산": (37.698, 127.082), "불암산": (37.653, 127.087), "청계산": (37.425, 127.043),
+    "인왕산": (37.586, 126.958), "북악산": (37.593, 126.971), "아차산": (37.571, 127.103),
+    "용마산": (37.579, 127.093), "삼성산": (37.437, 126.937), "남산": (37.551, 126.988),
+    "검단산": (37.519, 127.226), "예봉산": (37.579, 127.242), "운길산": (37.589, 127.309),
+    "사패산": (37.716, 127.012), "소요산": (37.943, 127.076), "감악산": (37.940, 126.970),
+    "천마산": (37.674, 127.288), "축령산": (37.753, 127.327), "유명산": (37.588, 127.493),
+    "용문산": (37.544, 127.529), "명지산": (37.942, 127.429), "연인산": (37.871, 127.427),
+    "화악산": (38.016, 127.525), "명성산": (38.107, 127.333), "광교산": (37.333, 127.018),
+    "수리산": (37.355, 126.892), "마니산": (37.613, 126.430), "계양산": (37.546, 126.719),
+    # 강원/충청
+    "설악산": (38.119, 128.465), "오대산": (37.794, 128.543), "치악산": (37.365, 128.053),
+    "태백산": (37.095, 128.916), "소백산": (36.957, 128.485), "월악산": (36.886, 128.107),
+    "속리산": (36.543, 127.870), "계룡산": (36.343, 127.206), "대둔산": (36.121, 127.321),
+    # 영호남/제주
+    "덕유산": (35.860, 127.746), "지리산": (35.337, 127.731), "내장산": (35.483, 126.891),
+    "무등산": (35.134, 126.989), "마이산": (35.758, 127.410), "가야산": (35.822, 128.119),
+    "팔공산": (36.017, 128.695), "주왕산": (36.393, 129.161), "청량산": (36.789, 128.917),
+    "금정산": (35.283, 129.052), "한라산": (33.362, 126.533),
+}
+
+# 긴 이름 우선 (예: "북한산성"보다 구체적인 이름이 추가되어도 먼저 매칭되도록)
+_MOUNTAIN_RE = re.compile("|".join(sorted(map(re.escape, MOUNTAINS), key=len, reverse=True)))
+
+
+@lru_cache(maxsize=1024)
+def find_mountain(title):
+    """
+    일정 제목에 포함된 첫 번째 산 이름과 좌표를 (name, lat, lon)으로 반환합니다. 없으면 None.
+    """
+    if not title:
+        return None
+    match = _MOUNTAIN_RE.search(str(title))
+    if not match:
+        return None
+    name = match.group(0)
+    return (name, *MOUNTAINS[name])
@@ -0,0 +1,194 @@
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+import streamlit as st
+from src.config import Config
+
+# =========================================================
+# 2. Service Layer - Query Result Cache
+# SELECT 결과를 테이블 세대(generation) 기준으로 캐싱합니다.
+# =========================================================
+
+# 뷰(View)가 실제로 읽는 원본 테이블 목록
+# 뷰를 조회한 결과는 원본 테이블 중 하나라도 변경되면 무효화됩니다.
+VIEW_DEPENDENCIES = {
+    "v_member_attendance_summary": {"members", "events", "attendees"},
+}
+
+# 실행 시점마다 결과가 달라지는 함수가 포함된 쿼리는 캐싱하지 않습니다.
+# (today()/current_date는 캐시 키에 날짜가 포함되므로 허용)
+_VOLATILE_RE = re.compile(r"\b(now|random|uuid|gen_random_uuid|current_timestamp|get_current_time)\b", re.IGNORECASE)
+_READ_TABLE_RE = re.compile(r"\b(?:FROM|JOIN)\s+(\"?[\w.]+\"?)", re.IGNORECASE)
+_CTE_NAME_RE = re.compile(r"(\w+)\s+AS\s*\(", re.IGNORECASE)
+_WRITE_TABLE_RE = re.compile(
+    r"^\s*(?:INSERT\s+(?:OR\s+\w+\s+)?INTO|UPDATE|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?"
+    r"|CREATE\s+(?:OR\s+REPLACE\s+)?(?:TEMP\s+|TEMPORARY\s+)?(?:TABLE|VIEW)"
+    r"|DROP\s+(?:TABLE|VIEW)|ALTER\s+TABLE)"
+    r"\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?(\"?[\w.]+\"?)",
+    re.IGNORECASE,
+)
+
+
+# 캐시 미적중 표시 (None도 정상 결과로 캐싱할 수 있도록 별도 객체 사용)
+MISS = object()
+
+
+def normalize_sql(sql):
+    """
+    공백/줄바꿈 차이만 있는 동일 쿼리가 같은 키를 갖도록 정규화합니다.
+    """
+    return " ".join(sql.split()).rstrip(";").strip()
+
+
+def _clean_name(name):
+    return name.strip('"').split(".")[-1].lower()
+
+
+def read_tables(sql):
+    """
+    쿼리가 읽는 테이블 집합을 추출합니다. 뷰는 원본 테이블로 확장합니다.
+    """
+    ctes = {m.lower() for m in _CTE_NAME_RE.findall(sql)}
+    tables = set()
+    for name in _READ_TABLE_RE.findall(sql):
+        name = _clean_name(name)
+        if name in ctes:
+            continue
+        tables.add(name)
+        tables |= VIEW_DEPENDENCIES.get(name, set())
+    return tables
+
+
+def written_table(sql):
+    """
+    조작 쿼리가 변경하는 테이블명을 반환합니다. 판별할 수 없으면 None을 반환합니다.
+    """
+    match = _WRITE_TABLE_RE.match(sql)
+    return _clean_name(match.group(1)) if match else None
+
+
+def _params_key(params):
+    if not params:
+        return ()
+    try:
+        key = tuple(params)
+        hash(key)
+        return key
+    except TypeError:
+        return (repr(params),)
+
+
+class QueryCache:
+    """
+    정규화된 SQL + 파라미터를 키로 조회 결과(DataFrame/스칼라/배열)를 보관하는 LRU 캐시입니다.
+    각 항목은 읽은 테이블로 태깅되며, 테이블 세대가 증가하면 해당 항목만 무효화됩니다.
+    같은 프로세스의 DBService를 거치지 않은 외부 쓰기(별도 스크립트 등)는 감지하지 못합니다.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (tables, df, nbytes)
+        self._generations = defaultdict(int)
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def make_key(self, sql, params=None, kind="df"):
+        """
+        캐시 키를 생성합니다. 캐싱할 수 없는 쿼리는 None을 반환합니다.
+        today() 등 날짜 의존 쿼리를 위해 오늘 날짜(KST)를 키에 포함합니다.
+        """
+        if _VOLATILE_RE.search(sql):
+            return None
+        today = datetime.now(Config.KST).date()
+        return (kind, today, normalize_sql(sql), _params_key(params))
+
+    def snapshot(self, tables):
+        """
+        쿼리 실행 직전의 테이블 세대를 기록합니다. (실행 중 쓰기가 끼어들면 저장하지 않기 위함)
+        """
+        with self._lock:
+            return {t: self._generations[t] for t in tables}, self._generations["*"]
+
+    def get(self, key):
+        if key is None:
+            return MISS
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, tables, value, snapshot, nbytes):
+        if key is None or not tables or nbytes > self.max_bytes:
+            return
+        generations, global_gen = snapshot
+        with self._lock:
+            # 조회 도중 관련 테이블에 쓰기가 발생했다면 오래된 결과이므로 저장하지 않음
+            if global_gen != self._generations["*"]:
+                return
+            if any(self._generations[t] != g for t, g in generations.items()):
+                return
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[2]
+            self._entries[key] = (tables, value, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                _, (_, _, size) = self._entries.popitem(last=False)
+                self._bytes -= size
+                self.evictions += 1
+
+    def bump(self, table=None):
+        """
+        테이블 세대를 증가시키고 해당 테이블을 읽은 항목만 제거합니다.
+        table이 None이면(판별 불가한 쓰기) 전체를 무효화합니다.
+        """
+        with self._lock:
+            if table is None:
+                self._generations["*"] += 1
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return
+            self._generations[table] += 1
+            stale = [k for k, (tables, _, _) in self._entries.items() if table in tables]
+            for k in stale:
+                self._bytes -= self._entries.pop(k)[2]
+            self.invalidations += len(stale)
+
+    def generation(self, table):
+        with self._lock:
+            return self._generations[table] + self._generations["*"]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_query_cache():
+    """
+    프로세스 전역에서 공유되는 QueryCache를 반환합니다.
+    """
+    return QueryCache(Config.QUERY_CACHE_MAX_MB * 1024 * 1024)
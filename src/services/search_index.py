@@ -0,0 +1,294 @@
+import math
+import threading
+import numpy as np
+import streamlit as st
+from src.services.db_service import DBService
+
+# =========================================================
+# 2. Service Layer - Search Index (회원/일정 검색)
+# 검색 대상 컬럼을 글자 단위 n-gram(한 글자 + 두 글자)으로 나눈 역색인을 메모리에 두고,
+# members/events 쓰기가 커밋되면 바뀐 행만 다시 읽어 색인을 고칩니다.
+# 한국어는 띄어쓰기/조사 때문에 단어 단위 색인이 잘 맞지 않아 글자 bigram을 씁니다.
+# =========================================================
+
+_EMPTY_IDS = np.zeros(0, dtype=np.int64)
+_EMPTY_WEIGHTS = np.zeros(0, dtype=np.float32)
+
+# 테이블 -> (키 컬럼, {검색 컬럼: 가중치})
+SOURCES = {
+    "members": ("user_no", {"name": 3.0, "original_name": 2.0, "description": 1.0}),
+    "events": ("event_id", {"title": 1.0}),
+}
+
+
+def query_tokens(text):
+    """
+    검색어 토큰. 두 글자 이상인 단어는 bigram만 사용합니다. (한 글자 토큰은 너무 흔해 후보를 줄이지 못함)
+    색인 쪽 토큰(tokens_sql)은 단어마다 한 글자 + 두 글자를 모두 가지고 있습니다.
+    """
+    tokens = set()
+    for word in str(text).lower().split():
+        if len(word) == 1:
+            tokens.add(word)
+        else:
+            tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class SearchIndex:
+    """
+    한 테이블의 역색인. 모든 검색어 토큰을 가진 행만 결과에 포함하고(AND),
+    토큰 희소도(idf) x 토큰이 나온 컬럼 가중치 합으로 순위를 매깁니다.
+    - base: 전체 생성 시 만든 토큰별 (문서 번호 배열, 가중치 배열)
+    - delta: 이후 커밋으로 바뀐 행의 토큰별 {문서 번호: 가중치}
+    - texts: 문서 번호별 검색 컬럼 원문(소문자). 토큰으로 고른 후보 중 검색어가 실제로 들어 있는 행만 남기는 데 사용합니다.
+    행이 바뀌면 기존 문서 번호를 지우고(alive=False) 새 번호로 delta에 넣습니다.
+    delta가 COMPACT_AT행을 넘으면 다음 검색 때 전체를 다시 만듭니다.
+    """
+    COMPACT_AT = 5000
+
+    def __init__(self, table):
+        self.table = table
+        self.key, self.fields = SOURCES[table]
+        # 컬럼 비트(mask) -> 가중치 합
+        weights = list(self.fields.values())
+        self._mask_weights = np.array(
+            [sum(w for i, w in enumerate(weights) if mask >> i & 1) for mask in range(1 << len(weights))], dtype=np.float32,
+        )
+        self.stale = True     # 처음이거나 대상 행을 알 수 없는 쓰기 이후에는 전체를 다시 만듦
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self.keys = []                              # 문서 번호 -> 키
+        self.texts = []                             # 문서 번호 -> "\n컬럼1\n컬럼2\n" (소문자)
+        self.ids = {}                               # 키 -> 현재 문서 번호
+        self.alive = np.zeros(0, dtype=bool)
+        self.base = {}
+        self.delta = {}
+        self.delta_docs = {}                        # 문서 번호 -> 토큰 목록 (delta에서 지울 때 사용)
+
+    def _tokens_sql(self, source):
+        """
+        source(doc, 검색 컬럼들)의 (doc, field, token) 행을 만드는 CTE. 토큰화를 DB에서 한 번에 처리합니다.
+        소문자로 바꾼 뒤 단어(공백 구분)마다 한 글자와 연속 두 글자를 토큰으로 만듭니다.
+        (마지막 글자의 두 글자 토큰은 한 글자와 같아지며, 중복은 집계에서 합쳐짐)
+        예) '북한산 둘레길' -> 북, 한, 산, 북한, 한산, 둘, 레, 길, 둘레, 레길
+        """
+        words = " UNION ALL ".join(
+            f"SELECT doc, {i} AS field, unnest(regexp_split_to_array(lower(\"{field}\"), '\\s+')) AS word FROM {source}"
+            for i, field in enumerate(self.fields)
+        )
+        return f"""
+            words AS ({words}),
+            grams AS (SELECT doc, field, word, unnest(range(1, length(word) + 1)) AS i FROM words WHERE word <> ''),
+            tokens AS (SELECT doc, field, unnest([substr(word, i, 1), substr(word, i, 2)]) AS token FROM grams)
+        """
+
+    def _build_sql(self):
+        """
+        토큰별 문서 목록. 문서 번호는 키 순서이며, 원소는 문서 번호 x 2^컬럼 수 + 토큰이 나온 컬럼 비트(mask)입니다.
+        """
+        fields = ", ".join(f'"{f}"' for f in self.fields)
+        return f"""
+            WITH src AS (SELECT row_number() OVER (ORDER BY CAST("{self.key}" AS VARCHAR)) - 1 AS doc, {fields} FROM {self.table}),
+            {self._tokens_sql("src")},
+            postings AS (SELECT token, doc, bit_or(1 << field) AS mask FROM tokens GROUP BY token, doc)
+            SELECT token, list(doc * {1 << len(self.fields)} + mask) AS postings FROM postings GROUP BY token
+        """
+
+    def _texts_sql(self, where=""):
+        """
+        (key, text) 행. text는 검색 컬럼을 소문자로 바꿔 줄바꿈으로 감싸 이은 문자열입니다.
+        (검색어는 한 줄 입력이라 컬럼 경계를 넘어 일치하지 않고, "\n검색어\n"으로 컬럼 값 전체 일치를 찾을 수 있음)
+        """
+        fields = ", ".join(f'coalesce(lower("{f}"), \'\')' for f in self.fields)
+        return f"""
+            SELECT CAST("{self.key}" AS VARCHAR) AS key, chr(10) || concat_ws(chr(10), {fields}) || chr(10) AS text
+            FROM {self.table}{where} ORDER BY 1
+        """
+
+    def _rows_sql(self):
+        """
+        키 목록(? 파라미터)에 해당하는 행의 (key, token, mask). 커밋 후 바뀐 행만 다시 토큰화할 때 사용합니다.
+        """
+        fields = ", ".join(f'"{f}"' for f in self.fields)
+        return f"""
+            WITH src AS (SELECT CAST("{self.key}" AS VARCHAR) AS doc, {fields} FROM {self.table} WHERE "{self.key}" IN (SELECT UNNEST(?))),
+            {self._tokens_sql("src")}
+            SELECT doc AS key, token, bit_or(1 << field) AS mask FROM tokens GROUP BY doc, token
+        """
+
+    def ensure_built(self):
+        """
+        색인이 없거나 무효화되었으면 테이블 전체를 읽어 다시 만듭니다.
+        키 목록과 토큰 목록은 같은 트랜잭션(같은 스냅샷)에서 읽어 문서 번호가 어긋나지 않게 합니다.
+        읽는 동안 잠금을 잡고 있으므로 그 사이 커밋된 쓰기는 after_commit에서 이어서 반영됩니다.
+        """
+        if not self.stale:
+            return
+        with self._lock:
+            if self.stale:
+                with DBService.transaction() as tx:
+                    texts = tx.query(self._texts_sql())
+                    postings = tx.query_arrow(self._build_sql())
+                self._build(texts, postings)
+                self.stale = False
+
+    def apply_commit(self, tx, keys):
+        """
+        커밋 직후 keys 행을 다시 읽어 색인을 고칩니다. keys가 None이면 무효화합니다. (다음 검색 때 전체 재생성)
+        아직 만들지 않은 색인은 건너뜁니다.
+        """
+        with self._lock:
+            if self.stale:
+                return
+            if keys is None or len(self.delta_docs) + len(keys) > self.COMPACT_AT:
+                self.stale = True
+                return
+            keys = sorted(keys)
+            rows = tx.query(self._rows_sql(), (keys,))
+            rows['weight'] = self._mask_weights[rows['mask'].to_numpy()]
+            texts = dict(tx.query(self._texts_sql(f' WHERE "{self.key}" IN (SELECT UNNEST(?))'), (keys,)).values.tolist())
+            for key in keys:
+                self._remove(key)
+            for key, group in rows.groupby('key', sort=False):
+                self._add(key, dict(zip(group['token'], group['weight'])), texts.get(key, "\n"))
+
+    def search(self, query, limit=None):
+        """
+        검색어와 맞는 행의 키를 반환합니다.
+        색인으로 모든 토큰을 가진 후보를 고른 뒤, 검색어 전체가 검색 컬럼 중 하나에 그대로 들어 있는 행만 남깁니다.
+        (토큰만 흩어져 있는 행 제외) 컬럼 값이 검색어와 똑같은 행을 먼저, 나머지는 점수 순으로 둡니다.
+        """
+        text = str(query).strip().lower()
+        tokens = query_tokens(query)
+        if not tokens:
+            return []
+        with self._lock:
+            n = len(self.keys)
+            scores = np.zeros(n, dtype=np.float32)
+            counts = np.zeros(n, dtype=np.int16)
+            live = max(1, len(self.ids))
+            for token in tokens:
+                ids, weights = self.base.get(token, (_EMPTY_IDS, _EMPTY_WEIGHTS))
+                extra = self.delta.get(token, {})
+                df = len(ids) + len(extra)
+                if df == 0:
+                    return []
+                idf = math.log(1 + live / df)
+                scores[ids] += weights * idf      # 한 토큰 안에서 문서 번호는 중복되지 않음
+                counts[ids] += 1
+                if extra:
+                    extra_ids = np.fromiter(extra.keys(), dtype=np.int64, count=len(extra))
+                    scores[extra_ids] += np.fromiter(extra.values(), dtype=np.float32, count=len(extra)) * idf
+                    counts[extra_ids] += 1
+            hits = np.flatnonzero((counts == len(tokens)) & self.alive)
+            order = hits[np.argsort(-scores[hits], kind="stable")]
+            keys, texts = self.keys, self.texts
+            exact, found = [], []
+            for i in order.tolist():
+                doc = texts[i]
+                if f"\n{text}\n" in doc:
+                    exact.append(keys[i])
+                elif text in doc:
+                    found.append(keys[i])
+            result = exact + found
+            return result[:limit] if limit else result
+
+    def _build(self, texts, postings):
+        """
+        _build_sql 결과(Arrow)를 토큰별 (문서 번호 배열, 가중치 배열)로 나눕니다.
+        """
+        self._reset()
+        self.keys = texts['key'].tolist()
+        self.texts = texts['text'].tolist()
+        self.ids = {k: i for i, k in enumerate(self.keys)}
+        self.alive = np.ones(len(self.keys), dtype=bool)
+        lists = postings.column('postings').combine_chunks()
+        offsets = lists.offsets.to_numpy()
+        values = lists.values.to_numpy()
+        shift = len(self.fields)
+        docs = values >> shift
+        weights = self._mask_weights[values & ((1 << shift) - 1)]
+        tokens = postings.column('token').to_pylist()
+        self.base = {t: (docs[s:e], weights[s:e]) for t, s, e in zip(tokens, offsets[:-1], offsets[1:])}
+
+    def _add(self, key, doc, text):
+        """
+        doc = {토큰: 가중치}인 행을 새 문서 번호로 delta에 넣습니다.
+        """
+        doc_id = len(self.keys)
+        self.keys.append(key)
+        self.texts.append(text)
+        self.ids[key] = doc_id
+        self.alive = np.append(self.alive, True)
+        for token, weight in doc.items():
+            self.delta.setdefault(token, {})[doc_id] = weight
+        self.delta_docs[doc_id] = list(doc)
+
+    def _remove(self, key):
+        doc_id = self.ids.pop(key, None)
+        if doc_id is None:
+            return
+        self.alive[doc_id] = False
+        for token in self.delta_docs.pop(doc_id, ()):
+            posting = self.delta.get(token)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self.delta[token]
+
+
+@st.cache_resource(show_spinner=False)
+def _get_indexes():
+    return {table: SearchIndex(table) for table in SOURCES}
+
+
+class _SearchMaintainer:
+    """
+    DBService 쓰기 옵저버입니다. 쓰기 직전에 바뀔 키를 모아 두었다가 커밋 직후 해당 행만 다시 읽어 색인을 고칩니다.
+    (커밋 전에 고치면 다른 스레드가 커밋되지 않은 내용으로 검색하거나 롤백 시 색인이 어긋남)
+    """
+    CONTEXT = "search_index"
+
+    def on_write(self, tx, table, batch):
+        if table is not None and table not in SOURCES:
+            return
+        pending = tx.context.setdefault(self.CONTEXT, {})
+        tables = [table] if table is not None else list(SOURCES)
+        for name in tables:
+            key = SOURCES[name][0]
+            if batch is None or key not in batch.columns:
+                pending[name] = None          # 전체 다시 만들기
+            elif pending.get(name, set()) is not None:
+                pending.setdefault(name, set()).update(str(k) for k in batch[key].dropna())
+
+    def before_commit(self, tx):
+        pass
+
+    def after_commit(self, tx):
+        pending = tx.context.pop(self.CONTEXT, None)
+        if not pending:
+            return
+        indexes = _get_indexes()
+        for table, keys in pending.items():
+            if keys is None or keys:
+                indexes[table].apply_commit(tx, keys)
+
+
+DBService.add_observer(_SearchMaintainer())
+
+
+class SearchService:
+    """
+    회원/일정 검색 진입점. 색인이 없거나 무효화되었으면 이때 한 번 전체를 만듭니다.
+    """
+    @staticmethod
+    def search(table, query, limit=None):
+        """
+        검색어와 맞는 키(user_no / event_id)를 관련도 순으로 반환합니다.
+        """
+        index = _get_indexes()[table]
+        index.ensure_built()
+        return index.search(query, limit)
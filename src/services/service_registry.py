@@ -0,0 +1,89 @@
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+import streamlit as st
+import streamlit_authenticator as stauth
+from src.config import Config
+from src.services.connection_manager import get_connection_manager
+from src.services.db_service import DBService
+from src.services.migrations import ensure_schema
+from src.services.ai_service import AIService
+from src.services.band_auth_service import BandAuthService
+
+# =========================================================
+# 2. Service Layer - Service Registry
+# 서비스 객체를 rerun마다 새로 만들지 않고 프로세스(또는 세션)당 한 번만 생성합니다.
+# 각 서비스의 초기화 소요 시간을 기록해 사이드바에서 확인할 수 있습니다.
+# =========================================================
+
+_timings = {}  # name -> {"seconds": float, "at": datetime}
+_timings_lock = threading.Lock()
+
+
+@contextmanager
+def timed(name):
+    """
+    블록 실행 시간을 name으로 기록합니다. (같은 이름은 마지막 측정값으로 덮어씀)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _timings_lock:
+            _timings[name] = {"seconds": elapsed, "at": datetime.now(Config.KST)}
+
+
+def startup_timings():
+    """
+    지금까지 기록된 초기화 시간 목록을 오래 걸린 순으로 반환합니다.
+    """
+    with _timings_lock:
+        items = [{"name": name, **t} for name, t in _timings.items()]
+    return sorted(items, key=lambda t: t["seconds"], reverse=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_db_service():
+    """
+    DuckDB 연결을 열고 스키마 마이그레이션을 마친 DBService를 반환합니다.
+    """
+    with timed("DBService (DuckDB 연결)"):
+        get_connection_manager().cursor()
+    with timed("DB 스키마 점검"):
+        ensure_schema()
+    return DBService()
+
+
+@st.cache_resource(show_spinner=False)
+def get_ai_service():
+    """
+    프로세스 전역 AIService를 반환합니다. 모델 탐색은 첫 사용 시점에 수행됩니다.
+    """
+    with timed("AIService"):
+        return AIService(on_discover=timed)
+
+
+@st.cache_resource(show_spinner=False)
+def get_band_auth():
+    """
+    밴드 OAuth 클라이언트를 반환합니다. (상태가 없으므로 모든 세션이 공유)
+    """
+    with timed("BandAuthService"):
+        return BandAuthService(
+            client_id=Config.BAND_CLIENT_ID,
+            client_secret=Config.BAND_CLIENT_SECRET,
+            redirect_uri=Config.BAND_REDIRECT_URI
+        )
+
+
+def get_authenticator():
+    """
+    로그인 위젯(stauth.Authenticate)을 반환합니다.
+    브라우저 쿠키 컴포넌트와 로그인 상태를 세션별로 가지므로 프로세스가 아닌 세션당 한 번만 만듭니다.
+    """
+    if "_authenticator" not in st.session_state:
+        with timed("Authenticator (세션)"):
+            st.session_state["_authenticator"] = stauth.Authenticate(Config.CREDENTIALS, "ddodak_cookie", "ddodak_key")
+    return st.session_state["_authenticator"]
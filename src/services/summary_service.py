@@ -0,0 +1,152 @@
+import threading
+from datetime import datetime
+import pandas as pd
+from src.config import Config
+from src.services.db_service import DBService
+
+# =========================================================
+# 2. Service Layer - Member Attendance Summary (구체화)
+# v_member_attendance_summary 뷰를 member_attendance_summary 테이블로 구체화하고
+# members/events/attendees 쓰기가 있을 때 영향받은 회원 행만 다시 계산합니다.
+# =========================================================
+
+VIEW = "v_member_attendance_summary"
+TABLE = "member_attendance_summary"
+KEY = "user_no"
+SOURCE_TABLES = ("members", "events", "attendees")
+
+
+def _today():
+    return datetime.now(Config.KST).date()
+
+
+def _values(series):
+    return [str(v) for v in series.dropna().unique()]
+
+
+class _SummaryMaintainer:
+    """
+    DBService 쓰기 옵저버입니다.
+    쓰기 직전에 영향받을 회원 번호를 모아 두었다가, 커밋 직전에 같은 트랜잭션 안에서 해당 행만 교체합니다.
+    대상 행을 알 수 없는 쓰기(tx.execute 등)가 섞이면 전체를 다시 만듭니다.
+    """
+    def on_write(self, tx, table, batch):
+        if table is not None and table not in SOURCE_TABLES:
+            return
+        state = tx.context.setdefault(TABLE, {"full": False, "ids": set()})
+        if state["full"]:
+            return
+        ids = self._affected_members(tx, table, batch)
+        if ids is None:
+            state["full"] = True
+        else:
+            state["ids"].update(ids)
+
+    def before_commit(self, tx):
+        state = tx.context.pop(TABLE, None)
+        if state is None:
+            return
+        if not Config.USE_SUMMARY_TABLE:
+            # 갱신을 건너뛰었으므로 다음에 테이블 경로를 켜면 전체를 다시 만들도록 기록 삭제
+            tx.execute("DELETE FROM materialized_refresh WHERE name=?", (TABLE,))
+            return
+        if tx.query("SELECT 1 FROM materialized_refresh WHERE name=?", (TABLE,)).empty:
+            return  # 아직 만들어지지 않았거나 무효화된 상태 (첫 조회 시 전체 생성)
+        if state["full"] or not MemberSummaryService.has_key():
+            MemberSummaryService.rebuild()
+        elif state["ids"]:
+            MemberSummaryService.refresh_members(tx, sorted(state["ids"]))
+
+    def after_commit(self, tx):
+        pass
+
+    @staticmethod
+    def _affected_members(tx, table, batch):
+        """
+        쓰기 대상 행(batch)에서 요약이 바뀔 수 있는 회원 번호를 구합니다. 알 수 없으면 None.
+        삭제 전에 호출되므로 attendees/events에서 기존 연결을 조회할 수 있습니다.
+        """
+        if batch is None:
+            return None
+        if table == "members" and KEY in batch.columns:
+            return _values(batch[KEY])
+        if table == "attendees":
+            if KEY in batch.columns:
+                return _values(batch[KEY])
+            if "event_id" in batch.columns:
+                return MemberSummaryService._members_of_events(tx, _values(batch["event_id"]))
+        if table == "events" and "event_id" in batch.columns:
+            ids = MemberSummaryService._members_of_events(tx, _values(batch["event_id"]))
+            if "host" in batch.columns:
+                ids += _values(batch["host"])
+            return ids
+        return None
+
+
+class MemberSummaryService:
+    """
+    회원 활동 요약(MemberID/점수/포인트/회원상태) 조회 경로를 제공합니다.
+    뷰 정의는 DB에 있으므로 테이블은 항상 `SELECT * FROM 뷰`로 채우며,
+    회원상태 등 날짜에 따라 달라지는 값 때문에 날짜(KST)가 바뀌면 한 번 전체를 다시 만듭니다.
+    """
+    _lock = threading.Lock()
+
+    @staticmethod
+    def relation():
+        """
+        요약을 읽을 테이블/뷰 이름을 반환합니다. (Config.USE_SUMMARY_TABLE)
+        """
+        if not Config.USE_SUMMARY_TABLE:
+            return VIEW
+        if MemberSummaryService.refreshed_on() != _today():
+            with MemberSummaryService._lock:
+                if MemberSummaryService.refreshed_on() != _today():
+                    MemberSummaryService.rebuild()
+        return TABLE
+
+    @staticmethod
+    def refreshed_on():
+        return DBService.query_scalar("SELECT refreshed_on FROM materialized_refresh WHERE name=?", (TABLE,))
+
+    @staticmethod
+    def has_key():
+        """
+        뷰에 회원 번호(user_no) 컬럼이 있어야 회원 단위로 갱신할 수 있습니다. 없으면 항상 전체 재계산합니다.
+        """
+        return KEY in DBService.query_column(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = ?", (VIEW,)
+        ).tolist()
+
+    @staticmethod
+    def rebuild():
+        """
+        뷰 전체를 다시 계산해 테이블을 교체합니다. (전체 재계산 명령: python rebuild_summary.py)
+        진행 중인 트랜잭션이 있으면 그 안에서 실행됩니다.
+        """
+        with DBService.transaction() as tx:
+            tx.execute(f"CREATE OR REPLACE TABLE {TABLE} AS SELECT * FROM {VIEW}")
+            tx.upsert_df("materialized_refresh", pd.DataFrame({"name": [TABLE], "refreshed_on": [_today()]}), "name")
+
+    @staticmethod
+    def refresh_members(tx, user_nos):
+        """
+        지정한 회원 행만 뷰에서 다시 읽어 교체합니다. (삭제된 회원은 뷰에 없으므로 제거됨)
+        """
+        # 상수 IN 목록이어야 필터가 뷰의 GROUP BY 아래로 내려가 해당 회원만 집계됨
+        placeholders = ", ".join("?" * len(user_nos))
+        tx.execute(f"DELETE FROM {TABLE} WHERE {KEY} IN ({placeholders})", tuple(user_nos))
+        tx.execute(f"INSERT INTO {TABLE} SELECT * FROM {VIEW} WHERE {KEY} IN ({placeholders})", tuple(user_nos))
+
+    @staticmethod
+    def _members_of_events(tx, event_ids):
+        if not event_ids:
+            return []
+        df = tx.query(
+            "SELECT user_no FROM attendees WHERE event_id IN (SELECT UNNEST(?)) "
+            "UNION SELECT host FROM events WHERE event_id IN (SELECT UNNEST(?))",
+            (event_ids, event_ids),
+        )
+        return _values(df["user_no"])
+
+
+DBService.add_observer(_SummaryMaintainer())
@@ -0,0 +1,241 @@
+import time
+import threading
+from dataclasses import dataclass, replace
+from datetime import date, datetime
+import requests
+import streamlit as st
+from src.config import Config
+
+# =========================================================
+# 2. Service Layer - Weather
+# Open-Meteo 일별 예보를 백그라운드 스레드에서 주기적으로 갱신하고,
+# 화면은 항상 마지막으로 성공한 예보를 즉시 그립니다. (stale-while-revalidate)
+# =========================================================
+
+SEOUL = (37.5665, 126.9780)
+
+
+@dataclass(frozen=True)
+class DailyWeather:
+    date: date
+    code: int       # WMO weather code
+    t_max: float
+    t_min: float
+
+
+@dataclass(frozen=True)
+class Forecast:
+    """
+    일별 예보 묶음. stale이면 마지막 갱신이 실패했거나 갱신 주기를 넘긴 오래된 예보입니다.
+    """
+    days: tuple             # DailyWeather 목록
+    fetched_at: datetime    # 마지막으로 성공한 조회 시각 (KST)
+    stale: bool = False
+    error: str = None       # 마지막 갱신 실패 사유
+
+
+def weather_icon(code):
+    """
+    WMO 날씨 코드를 이모지로 변환합니다.
+    """
+    if code == 0: return "☀️"
+    if code in [1,2,3]: return "🌥️"
+    if code in [45,48]: return "🌫️"
+    if code in [51,53,55,61,63,65]: return "🌧️"
+    if code in [71,73,75,77]: return "❄️"
+    if code >= 95: return "⛈️"
+    return "🌡️"
+
+
+def parse_daily(daily):
+    """
+    Open-Meteo 응답의 daily 블록을 DailyWeather 튜플로 변환합니다.
+    """
+    return tuple(
+        DailyWeather(datetime.strptime(d, "%Y-%m-%d").date(), int(code), float(t_max), float(t_min))
+        for d, code, t_max, t_min in zip(
+            daily['time'], daily['weather_code'], daily['temperature_2m_max'], daily['temperature_2m_min']
+        )
+    )
+
+
+class WeatherProvider:
+    """
+    한 지점의 일별 예보를 보관하는 프로세스 전역 캐시입니다.
+    start() 후에는 refresh_sec마다 백그라운드에서 갱신하며, get()은 네트워크를 기다리지 않습니다.
+    base_url을 바꾸면 로컬 스텁 서버(weather_stub.py)로 대체할 수 있습니다.
+    """
+    DAILY_FIELDS = "weather_code,temperature_2m_max,temperature_2m_min"
+
+    def __init__(self, base_url, latitude, longitude, refresh_sec, timeout):
+        self.base_url = base_url
+        self.latitude = latitude
+        self.longitude = longitude
+        self.refresh_sec = refresh_sec
+        self.timeout = timeout
+        self._forecast = None
+        self._lock = threading.Lock()
+        self._loaded = threading.Event()  # 첫 조회(성공/실패)가 끝났는지
+        self._stop = threading.Event()
+        self._thread = None
+
+    def fetch(self):
+        """
+        API를 동기 호출해 새 예보를 반환합니다. 실패하면 예외가 발생합니다.
+        """
+        params = {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "daily": self.DAILY_FIELDS,
+            "timezone": "Asia/Seoul",
+        }
+        res = requests.get(self.base_url, params=params, timeout=self.timeout)
+        res.raise_for_status()
+        data = res.json()
+        if 'daily' not in data:
+            raise ValueError(f"daily 항목 없음: {data.get('reason', data)}")
+        return Forecast(days=parse_daily(data['daily']), fetched_at=datetime.now(Config.KST))
+
+    def refresh(self):
+        """
+        예보를 한 번 갱신합니다. 실패하면 마지막 예보를 유지한 채 stale로 표시합니다.
+        """
+        try:
+            forecast = self.fetch()
+        except Exception as e:
+            print(f"Weather Refresh Error: {e}")
+            with self._lock:
+                if self._forecast is not None:
+                    self._forecast = replace(self._forecast, stale=True, error=str(e))
+        else:
+            with self._lock:
+                self._forecast = forecast
+        finally:
+            self._loaded.set()
+
+    def get(self, wait=0.0):
+        """
+        마지막 예보를 반환합니다. 아직 한 번도 성공하지 못했으면 None입니다.
+        wait > 0이면 첫 조회가 끝날 때까지 최대 wait초 기다립니다. (콜드 스타트 직후 첫 화면용)
+        """
+        if wait:
+            self._loaded.wait(wait)
+        with self._lock:
+            forecast = self._forecast
+        if forecast is not None and not forecast.stale:
+            age = (datetime.now(Config.KST) - forecast.fetched_at).total_seconds()
+            if age > self.refresh_sec * 2:
+                forecast = replace(forecast, stale=True)
+        return forecast
+
+    def start(self):
+        """
+        백그라운드 갱신 스레드를 시작합니다. (이미 실행 중이면 무시)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="weather-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.refresh_sec)
+
+
+def point_key(latitude, longitude):
+    """
+    좌표를 소수점 둘째 자리(약 1km)로 반올림한 캐시 키를 반환합니다.
+    """
+    return (round(float(latitude), 2), round(float(longitude), 2))
+
+
+class PointWeatherCache:
+    """
+    여러 지점(산 정상 등)의 일별 예보를 (반올림 좌표, 날짜) 단위로 보관합니다.
+    캐시에 없는 지점은 모아서 Open-Meteo 다중 좌표 요청 한 번으로 가져옵니다.
+    """
+    FORECAST_DAYS = 16   # Open-Meteo 최대 예보 기간
+    FAILURE_BACKOFF_SEC = 60
+
+    def __init__(self, base_url, ttl_sec, timeout):
+        self.base_url = base_url
+        self.ttl_sec = ttl_sec
+        self.timeout = timeout
+        self._days = {}     # (lat, lon, date) -> DailyWeather
+        self._fetched = {}  # (lat, lon) -> 조회 시각 (monotonic)
+        self._failed_at = None
+        self._lock = threading.Lock()
+
+    def get_many(self, queries):
+        """
+        [(lat, lon, date), ...]에 대한 예보를 같은 순서의 리스트로 반환합니다.
+        예보 범위 밖이거나 조회에 실패한 항목은 None입니다.
+        """
+        points = {point_key(lat, lon) for lat, lon, _ in queries}
+        now = time.monotonic()
+        with self._lock:
+            missing = sorted(p for p in points if now - self._fetched.get(p, -self.ttl_sec - 1) > self.ttl_sec)
+            backoff = self._failed_at is not None and now - self._failed_at < self.FAILURE_BACKOFF_SEC
+        if missing and not backoff:
+            self._fetch(missing)
+        with self._lock:
+            return [self._days.get((*point_key(lat, lon), d)) for lat, lon, d in queries]
+
+    def _fetch(self, points):
+        params = {
+            "latitude": ",".join(str(lat) for lat, _ in points),
+            "longitude": ",".join(str(lon) for _, lon in points),
+            "daily": WeatherProvider.DAILY_FIELDS,
+            "timezone": "Asia/Seoul",
+            "forecast_days": self.FORECAST_DAYS,
+        }
+        try:
+            res = requests.get(self.base_url, params=params, timeout=self.timeout)
+            res.raise_for_status()
+            data = res.json()
+            # 좌표가 하나면 객체, 여러 개면 요청 순서대로 리스트가 반환됨
+            results = data if isinstance(data, list) else [data]
+            parsed = [parse_daily(r['daily']) for r in results]
+        except Exception as e:
+            print(f"Weather Fetch Error: {e}")
+            with self._lock:
+                self._failed_at = time.monotonic()
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._failed_at = None
+            for point, days in zip(points, parsed):
+                self._fetched[point] = now
+                for day in days:
+                    self._days[(*point, day.date)] = day
+            # 지난 날짜 정리
+            today = datetime.now(Config.KST).date()
+            for key in [k for k in self._days if k[2] < today]:
+                del self._days[key]
+
+
+@st.cache_resource(show_spinner=False)
+def get_point_weather():
+    """
+    산 정상 등 지점별 예보를 보관하는 프로세스 전역 캐시를 반환합니다.
+    """
+    return PointWeatherCache(Config.WEATHER_API_URL, ttl_sec=Config.WEATHER_REFRESH_SEC, timeout=Config.WEATHER_TIMEOUT_SEC)
+
+
+@st.cache_resource(show_spinner=False)
+def get_weather_provider():
+    """
+    서울 예보를 갱신하는 프로세스 전역 WeatherProvider를 반환합니다. (첫 호출 시 갱신 스레드 시작)
+    """
+    provider = WeatherProvider(
+        Config.WEATHER_API_URL, *SEOUL,
+        refresh_sec=Config.WEATHER_REFRESH_SEC, timeout=Config.WEATHER_TIMEOUT_SEC,
+    )
+    provider.start()
+    return provider
@@ -1,2 +0,0 @@
-# Generated Assets
-BG_IMAGES = []
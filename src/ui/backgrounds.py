@@ -0,0 +1,191 @@
+import os
+import io
+import glob
+import json
+import shutil
+import hashlib
+from dataclasses import dataclass
+import streamlit as st
+from PIL import Image, features
+
+# =========================================================
+# 3. UI Layer - Background Images
+# 배경 이미지는 빌드 단계(build_assets.py)에서 여러 너비의 WebP/AVIF로 미리 인코딩해
+# static/assets/<해시>/ 아래에 두고, 런타임에는 작은 manifest.json만 읽어 URL로 참조합니다.
+# =========================================================
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+STATIC_DIR = os.path.join(ROOT, "static")
+ASSET_ROOT = os.path.join(STATIC_DIR, "assets")
+MANIFEST_PATH = os.path.join(ASSET_ROOT, "manifest.json")
+
+WIDTHS = (640, 1280, 1920)  # 원본보다 큰 너비는 만들지 않음
+FORMATS = [("avif", "image/avif", 50), ("webp", "image/webp", 75)]  # (확장자, MIME, 품질)
+
+
+@dataclass(frozen=True)
+class BackgroundVariant:
+    width: int
+    format: str
+    mime: str
+    path: str  # static/ 기준 상대 경로
+
+    @property
+    def url(self):
+        return f"app/static/{self.path}"
+
+
+@dataclass(frozen=True)
+class Background:
+    name: str
+    variants: tuple  # BackgroundVariant 목록 (너비 오름차순)
+
+    def widths(self):
+        return sorted({v.width for v in self.variants})
+
+    def at(self, width):
+        return [v for v in self.variants if v.width == width]
+
+
+def source_images(root=ROOT):
+    """
+    배경 원본 목록: background.png와 bg_*.png (프로젝트 루트)
+    """
+    sources = [os.path.join(root, "background.png")] + sorted(glob.glob(os.path.join(root, "bg_*.png")))
+    return [s for s in sources if os.path.exists(s)]
+
+
+def _formats():
+    return [(ext, mime, quality) for ext, mime, quality in FORMATS if features.check(ext)]
+
+
+def _encode(src):
+    """
+    원본 하나를 WIDTHS × FORMATS 조합으로 인코딩해 [(width, ext, mime, bytes), ...]로 반환합니다.
+    """
+    outputs = []
+    with Image.open(src) as img:
+        img = img.convert("RGB")
+        widths = sorted({w for w in WIDTHS if w < img.width} | {min(img.width, WIDTHS[-1])})
+        for width in widths:
+            resized = img.resize((width, round(img.height * width / img.width)), Image.LANCZOS)
+            for ext, mime, quality in _formats():
+                out = io.BytesIO()
+                resized.save(out, ext.upper(), quality=quality)
+                outputs.append((width, ext, mime, out.getvalue()))
+    return outputs
+
+
+def build_assets(sources=None, out_root=ASSET_ROOT):
+    """
+    배경 원본을 인코딩해 out_root/<빌드 해시>/에 쓰고 manifest.json을 갱신한 뒤 manifest를 반환합니다.
+    빌드 해시는 원본 내용과 인코딩 설정으로 정해지므로, 입력이 같으면 기존 결과를 그대로 재사용합니다.
+    이전 빌드 디렉터리는 manifest 교체 후 삭제합니다.
+    """
+    sources = source_images() if sources is None else sources
+    digest = hashlib.sha256(repr((WIDTHS, _formats())).encode())
+    for src in sources:
+        with open(src, "rb") as f:
+            digest.update(os.path.basename(src).encode() + b"\0" + f.read())
+    version = digest.hexdigest()[:12]
+    build_dir = os.path.join(out_root, version)
+    manifest_path = os.path.join(out_root, "manifest.json")
+
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == version and os.path.isdir(build_dir):
+            return manifest
+    except (OSError, ValueError):
+        pass
+
+    tmp_dir = build_dir + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    backgrounds = []
+    for src in sources:
+        stem = os.path.splitext(os.path.basename(src))[0]
+        variants = []
+        for width, ext, mime, data in _encode(src):
+            filename = f"{stem}-{width}.{ext}"
+            with open(os.path.join(tmp_dir, filename), "wb") as f:
+                f.write(data)
+            variants.append({
+                "width": width, "format": ext, "mime": mime, "bytes": len(data),
+                "path": f"assets/{version}/{filename}",
+            })
+        backgrounds.append({"name": stem, "variants": variants})
+    shutil.rmtree(build_dir, ignore_errors=True)
+    os.replace(tmp_dir, build_dir)
+
+    manifest = {"version": version, "backgrounds": backgrounds}
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+    for name in os.listdir(out_root):
+        path = os.path.join(out_root, name)
+        if name != version and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+    return manifest
+
+
+@st.cache_resource(show_spinner=False)
+def load_manifest(path=MANIFEST_PATH):
+    """
+    manifest.json을 읽습니다. (프로세스당 한 번, 배경이 처음 필요할 때)
+    빌드 결과가 없으면(로컬 개발 등) 이 자리에서 한 번 빌드합니다.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Asset manifest not found, building now: {e}")
+    try:
+        return build_assets(out_root=os.path.dirname(path))
+    except Exception as e:
+        print(f"Asset build failed: {e}")
+        return {"version": None, "backgrounds": []}
+
+
+def get_backgrounds():
+    """
+    manifest에 기록된 배경 목록을 반환합니다.
+    """
+    return [
+        Background(bg["name"], tuple(
+            BackgroundVariant(v["width"], v["format"], v["mime"], v["path"]) for v in bg["variants"]
+        ))
+        for bg in load_manifest()["backgrounds"]
+        if bg["variants"]
+    ]
+
+
+def _image_set(variants):
+    items = ", ".join(f'url("{v.url}") type("{v.mime}")' for v in variants)
+    return f"image-set({items})"
+
+
+def background_css(selector, background, overlay):
+    """
+    selector에 배경을 지정하는 CSS를 만듭니다.
+    화면 너비별로 알맞은 크기를, 브라우저가 지원하는 포맷(AVIF → WebP) 중에서 고르도록 합니다.
+    image-set()을 지원하지 않는 브라우저는 앞선 WebP url() 선언을 사용합니다.
+    """
+    def rule(width):
+        variants = background.at(width)
+        fallback = variants[-1]
+        return (
+            f"{selector} {{ background-image: {overlay}, url(\"{fallback.url}\") !important; "
+            f"background-image: {overlay}, {_image_set(variants)} !important; }}"
+        )
+
+    widths = background.widths()
+    # 기본은 가장 큰 너비, 이후 작은 화면 규칙을 큰 것부터 나열해 더 좁은 조건이 마지막에 적용되도록 함
+    rules = [rule(widths[-1])]
+    rules += [f"@media (max-width: {w}px) {{ {rule(w)} }}" for w in reversed(widths[:-1])]
+    return "\n".join(rules)
+
+
+def static_serving_enabled():
+    return bool(st.get_option("server.enableStaticServing"))
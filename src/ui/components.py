@@ -0,0 +1,120 @@
+from html import escape
+import streamlit as st
+from src.services.weather_service import weather_icon
+
+# =========================================================
+# 3. UI Layer - HTML Components
+# 카드, 순위, 날씨처럼 반복되는 요소를 섹션 단위의 HTML 한 덩어리로 만들어 st.markdown 한 번으로 그립니다.
+# (요소마다 st.markdown을 호출하면 그만큼 delta 메시지가 웹소켓으로 전송됨)
+# 스타일은 Styles의 공통 CSS 클래스(dd-*)를 사용하며, 행마다 값이 달라지는 경우에만 inline style을 씁니다.
+# 주의: markdown 안의 HTML은 빈 줄이나 들여쓰기가 있으면 코드 블록으로 바뀌므로 모두 한 줄로 이어 붙입니다.
+# =========================================================
+
+WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+def render(html):
+    """
+    만들어진 섹션 HTML을 한 번에 그립니다.
+    """
+    st.markdown(html, unsafe_allow_html=True)
+
+
+def panel(title, body):
+    """
+    제목이 있는 반투명 패널.
+    """
+    return f'<div class="dd-panel"><div class="dd-panel-title">{title}</div>{body}</div>'
+
+
+def grid(items, columns):
+    """
+    items를 columns열 격자로 배치합니다. (좁은 화면에서는 한 열)
+    """
+    return f'<div class="dd-grid dd-grid-{columns}">{"".join(items)}</div>'
+
+
+def column(title, body):
+    """
+    격자 안의 제목 있는 열.
+    """
+    return f'<div><div class="dd-col-title">{title}</div>{body}</div>'
+
+
+def empty(message):
+    return f'<div class="dd-note">{escape(message)}</div>'
+
+
+def temperature(t_max, t_min):
+    return f'<span class="dd-tmax">{int(t_max)}°</span>/<span class="dd-tmin">{int(t_min)}°</span>'
+
+
+def kpi_card(label, value, accent):
+    """
+    핵심 지표 카드. accent는 neon-border-* 색상 이름 (cyan / green / magenta)
+    """
+    return (
+        f'<div class="glass-card hover-3d dd-kpi neon-border-{accent}">'
+        f'<span class="dd-kpi-label">{escape(label)}</span>'
+        f'<span class="dd-kpi-value">{escape(str(value))}</span></div>'
+    )
+
+
+def event_card(title, badge, urgent, img_url, date, host_info, weather=None):
+    """
+    다가오는 산행 카드. weather는 (산 이름, DailyWeather) 또는 None.
+    """
+    weather_html = ""
+    if weather:
+        mountain, w = weather
+        weather_html = f'<div class="dd-meta">⛰️ {escape(mountain)} {weather_icon(w.code)} {temperature(w.t_max, w.t_min)}</div>'
+    return (
+        f'<div class="dd-event hover-3d{" dd-urgent" if urgent else ""}">'
+        f'<div class="dd-event-bar"></div><div class="dd-event-body">'
+        f'<div class="dd-event-head"><span class="dd-badge">{badge}</span>'
+        f'<span class="dd-event-title">{escape(str(title))}</span></div>'
+        f'<div class="dd-event-meta"><img class="dd-avatar" src="{img_url}">'
+        f'<div><div class="dd-meta dd-meta-date">📅 {date}</div>'
+        f'<div class="dd-meta dd-meta-host">👑 {escape(host_info)}</div>{weather_html}</div>'
+        f'</div></div></div>'
+    )
+
+
+def rank_card(rank, name, subtext, img_url):
+    """
+    명예의 전당 순위 카드. rank는 0부터 시작하며 1~3위는 금/은/동 테두리로 표시합니다.
+    """
+    medal = f" dd-rank-{rank + 1}" if rank < 3 else ""
+    return (
+        f'<div class="glass-card hover-3d dd-rank{medal}">'
+        f'<div class="dd-rank-avatar"><img src="{img_url}"><div class="dd-rank-num">{rank + 1}</div></div>'
+        f'<div><div class="dd-rank-name">{escape(str(name))}</div>'
+        f'<div class="dd-rank-sub">{escape(subtext)}</div></div></div>'
+    )
+
+
+def popular_event_card(rank, title, subtext):
+    """
+    인기 산행 순위 카드 (이미지 없음).
+    """
+    return (
+        f'<div class="dd-popular"><div class="dd-popular-num">{rank + 1}</div>'
+        f'<div><div class="dd-popular-title">{escape(str(title))}</div>'
+        f'<div class="dd-popular-sub">{escape(subtext)}</div></div></div>'
+    )
+
+
+def weather_day(day):
+    return (
+        f'<div class="dd-weather-day">{day.date.strftime("%m/%d")}<br>({WEEKDAYS[day.date.weekday()]})<br>'
+        f'<span class="dd-weather-icon">{weather_icon(day.code)}</span><br>'
+        f'<span class="dd-tmax">{int(day.t_max)}°</span><br><span class="dd-tmin">{int(day.t_min)}°</span></div>'
+    )
+
+
+def weather_strip(days, note=None):
+    """
+    일별 예보 한 줄 (최대 7일).
+    """
+    html = grid([weather_day(day) for day in days[:7]], 7)
+    return html + (empty(note) if note else "")
@@ -0,0 +1,94 @@
+import pandas as pd
+import streamlit as st
+from dataclasses import dataclass, field
+from typing import List
+
+# =========================================================
+# 3. UI Layer - Data Editor Change Set
+# st.data_editor의 편집 상태(edited/added/deleted_rows)를 실제 변경분으로 변환합니다.
+# =========================================================
+
+@dataclass
+class EditorChangeSet:
+    """
+    data_editor에서 사용자가 실제로 바꾼 행만 모은 변경 집합입니다.
+    - inserted: 새로 추가된 행
+    - updated: 값이 바뀐 기존 행 (편집 후 값)
+    - deleted_ids: 삭제된 행의 키 (키 자체를 바꾼 경우 이전 키 포함)
+    """
+    inserted: pd.DataFrame
+    updated: pd.DataFrame
+    deleted_ids: List[str] = field(default_factory=list)
+
+    @property
+    def upserts(self):
+        """
+        저장(Upsert)해야 할 행 전체 (추가 + 수정)
+        """
+        return pd.concat([self.inserted, self.updated])
+
+    @property
+    def is_empty(self):
+        return self.inserted.empty and self.updated.empty and not self.deleted_ids
+
+    @classmethod
+    def from_editor(cls, key, original, edited, id_col):
+        """
+        session_state[key]의 편집 상태와 data_editor 반환값(edited)으로 변경 집합을 계산합니다.
+
+        Streamlit은 셀 수정 → 행 삭제 → 행 추가 순으로 편집을 적용하므로,
+        edited의 앞부분은 삭제되지 않은 원본 행(원래 순서), 뒷부분은 추가된 행입니다.
+        edited_rows/deleted_rows의 행 번호는 모두 원본(original) 기준 위치입니다.
+        """
+        state = st.session_state.get(key) or {}
+        deleted_pos = sorted({int(p) for p in state.get("deleted_rows", [])})
+        edited_pos = [int(p) for p in state.get("edited_rows", {})]
+
+        deleted_set = set(deleted_pos)
+        kept = [p for p in range(len(original)) if p not in deleted_set]
+        kept_at = {p: i for i, p in enumerate(kept)}
+
+        deleted_ids = [str(v) for v in original[id_col].iloc[deleted_pos] if pd.notna(v)]
+
+        updated_rows = []
+        for pos in sorted(edited_pos):
+            if pos not in kept_at:
+                continue
+            before = original.iloc[pos]
+            after = edited.iloc[kept_at[pos]]
+            if _same_row(before, after):
+                continue
+            updated_rows.append(kept_at[pos])
+            # 키 값을 바꾼 경우 이전 키의 행은 삭제 대상
+            if pd.notna(before[id_col]) and str(before[id_col]) != str(after[id_col]):
+                deleted_ids.append(str(before[id_col]))
+
+        inserted = edited.iloc[len(kept):]
+        # 빈 행만 추가하고 아무것도 입력하지 않은 경우는 제외
+        inserted = inserted[inserted.notna().any(axis=1)]
+
+        return cls(
+            inserted=inserted,
+            updated=edited.iloc[updated_rows],
+            deleted_ids=list(dict.fromkeys(deleted_ids)),
+        )
+
+    def summary(self):
+        """
+        저장 완료 메시지에 사용할 변경 건수 문자열을 반환합니다.
+        """
+        return (
+            f"- ➕ **추가**: {len(self.inserted)}건\n"
+            f"- 💾 **수정**: {len(self.updated)}건\n"
+            f"- 🗑️ **삭제**: {len(self.deleted_ids)}건"
+        )
+
+
+def _same_row(before, after):
+    for col in before.index:
+        a, b = before[col], after[col]
+        if pd.isna(a) and pd.isna(b):
+            continue
+        if pd.isna(a) or pd.isna(b) or a != b:
+            return False
+    return True
@@ -18,6 +18,59 @@ class Layout:
             # 네비게이션 메뉴
             return st.radio("메뉴 이동", ["🏠 홈", "👥 회원 관리", "📅 공지 관리", "🏃 참가 체크", "📊 보고서 생성"])
 
+    @staticmethod
+    def render_theme_selector():
+        """
+        사이드바에 테마 선택 상자를 표시합니다. 선택값은 이 세션에만 적용됩니다.
+        """
+        from src.ui.themes import ThemeManager
+        with st.sidebar:
+            st.selectbox("🎨 테마", list(ThemeManager.THEMES), key=ThemeManager.SESSION_KEY)
+
+    @staticmethod
+    def render_cache_stats(stats):
+        """
+        사이드바 하단에 조회 결과 캐시 적중률을 표시합니다.
+        """
+        with st.sidebar:
+            with st.expander("🗄️ 쿼리 캐시 현황", expanded=False):
+                st.caption(
+                    f"적중 {stats['hits']}회 / 실패 {stats['misses']}회 "
+                    f"(적중률 {stats['hit_rate']:.0%})  \n"
+                    f"항목 {stats['entries']}개 · {stats['bytes'] / 1024 / 1024:.1f} / {stats['max_bytes'] / 1024 / 1024:.0f} MB  \n"
+                    f"LRU 제거 {stats['evictions']}회 · 무효화 {stats['invalidations']}회"
+                )
+
+    @staticmethod
+    def render_startup_timings(timings):
+        """
+        사이드바 하단에 서비스별 초기화 소요 시간을 표시합니다.
+        """
+        with st.sidebar:
+            with st.expander("⏱️ 서비스 초기화 시간", expanded=False):
+                if not timings:
+                    st.caption("기록 없음")
+                    return
+                st.caption("  \n".join(
+                    f"{t['name']}: {t['seconds'] * 1000:,.1f} ms ({t['at'].strftime('%m/%d %H:%M:%S')})"
+                    for t in timings
+                ))
+
+    @staticmethod
+    def render_pager(key, pages, signature):
+        """
+        페이지 번호 입력을 표시하고 선택된 페이지(0부터)를 반환합니다.
+        필터 조건(signature)이 바뀌면 첫 페이지로, 페이지 수가 줄면 마지막 페이지로 맞춥니다.
+        """
+        if st.session_state.get(f"{key}_filter") != signature:
+            st.session_state[f"{key}_filter"] = signature
+            st.session_state[key] = 1
+        st.session_state[key] = min(st.session_state.get(key, 1), pages)
+        if pages == 1:
+            return 0
+        page = st.number_input(f"페이지 (총 {pages}쪽)", min_value=1, max_value=pages, step=1, key=key)
+        return int(page) - 1
+
     @staticmethod
     def render_manual(page):
         """
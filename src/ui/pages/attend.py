@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 from src.ui.layout import Layout
+from src.services.member_index import MemberIndexService
+from src.services.attendance_import import AttendanceImportService, MATCHED, AMBIGUOUS, UNMATCHED, NO_EVENT
 
 # =========================================================
 # Page: Attendance (참가 체크)
@@ -16,53 +18,141 @@ class AttendancePage:
         
         # 목록 데이터 로드
         ev_list = self.db.query("SELECT event_id, date, title, host FROM events ORDER BY date DESC")
-        mb_list = self.db.query("SELECT user_no, birth_year, name, area FROM members WHERE role<>'exmember' ORDER BY birth_year, name")
         
         if ev_list.empty: return st.warning("일정을 먼저 등록하세요.")
         
+        ev_labels = (ev_list['date'].astype(str) + " | " + ev_list['title'].astype(str)).tolist()
+        mode = st.radio("입력 방식", ["✅ 개별 체크", "📋 일괄 입력"], horizontal=True, key="attend_mode")
+        if mode == "📋 일괄 입력":
+            return self._render_import(ev_list, ev_labels)
+        self._render_check(ev_list, ev_labels)
+
+    def _render_check(self, ev_list, ev_labels):
+        members = MemberIndexService(self.db).get()
+        
         # 일정 선택
-        ev_labels = ev_list.apply(lambda r: f"{r['date']} | {r['title']}", axis=1).tolist()
-        sel_label = st.selectbox(f"🎯 산행 선택 (총 {len(ev_list)}건)", ev_labels)
+        sel_idx = st.selectbox(f"🎯 산행 선택 (총 {len(ev_list)}건)", range(len(ev_labels)), format_func=ev_labels.__getitem__)
         
-        selected_event = ev_list.iloc[ev_labels.index(sel_label)]
-        sel_ev_id = selected_event['event_id']
+        selected_event = ev_list.iloc[sel_idx]
+        sel_ev_id = str(selected_event['event_id'])
         host_id = str(selected_event['host']) if selected_event['host'] else None
         
         # 기존 참석자 로드
-        existing = self.db.query("SELECT user_no FROM attendees WHERE event_id=?", (str(sel_ev_id),))['user_no'].tolist()
-        
-        # 표시 포맷 (생년/이름/지역)
-        mb_list['display'] = mb_list.apply(lambda r: f"{r['birth_year']}/{r['name']}/{r['area']}", axis=1)
+        existing = set(self.db.query_column("SELECT user_no FROM attendees WHERE event_id=?", (sel_ev_id,)).astype(str))
         
         # 공지자 표시 로직
-        if host_id:
-            host_row = mb_list[mb_list['user_no'].astype(str) == host_id]
-            if not host_row.empty:
-                host_name = host_row['display'].iloc[0]
-                st.markdown(f"👑 **공지자**: :orange[{host_name}]")
+        if host_id in members.by_user:
+            st.markdown(f"👑 **공지자**: :orange[{members.by_user[host_id]}]")
         
-        # 멀티 셀렉트로 참석자 체크
+        # 멀티 셀렉트로 참석자 체크 (표시 형식: 생년/이름/지역)
         selected = st.multiselect(
-            f"🏃 참석자 선택 (대상: {len(mb_list)}명)", 
-            options=mb_list['display'].tolist(),
-            default=mb_list[mb_list['user_no'].isin(existing)]['display'].tolist(),
+            f"🏃 참석자 선택 (대상: {len(members.labels)}명)", 
+            options=members.labels,
+            default=members.labels_for(existing),
             key=f"attendees_{sel_ev_id}" 
         )
         
         st.info(f"💡 현재 선택된 인원: **{len(selected)}명**")
         if st.button("✅ 참석 명단 최종 확정", type="primary"):
             with st.spinner("⏳ 참석 명단을 업데이트 중입니다..."):
-                # 기존 내역 삭제 후 재생성 (Bulk Insert)
-                self.db.execute("DELETE FROM attendees WHERE event_id=?", (str(sel_ev_id),))
-                for val in selected:
-                    u_no = mb_list.loc[mb_list['display'] == val, 'user_no'].iloc[0]
-                    self.db.execute("INSERT INTO attendees (event_id, user_no) VALUES (?, ?)", (str(sel_ev_id), u_no))
+                # 기존 명단과의 차이만 반영 (단일 트랜잭션)
+                # 목록에 없는 참석자(탈퇴 회원 등)는 화면에서 고를 수 없으므로 그대로 둠
+                chosen = set(members.user_nos_for(selected))
+                added = sorted(chosen - existing)
+                removed = sorted((existing & members.by_user.keys()) - chosen)
+                if added or removed:
+                    with self.db.transaction() as tx:
+                        tx.delete_keys("attendees", ("event_id", "user_no"), [(sel_ev_id, u) for u in removed])
+                        tx.insert_df("attendees", pd.DataFrame({'event_id': sel_ev_id, 'user_no': added}, columns=['event_id', 'user_no']))
                 
                 import time
                 time.sleep(0.5)
                 
                 st.success(f"""
                 ✅ **참석 정보 저장 완료!**
-                - 🏃 **최종 참석 인원**: {len(selected)}명
+                - 🏃 **최종 참석 인원**: {len(selected)}명 (추가 {len(added)}명, 제외 {len(removed)}명)
                 """)
                 st.rerun()
+
+    # --- 일괄 입력 (밴드 댓글/명단 붙여넣기, CSV) ---
+
+    STATUS_LABELS = {MATCHED: "자동 확정", AMBIGUOUS: "확인 필요", UNMATCHED: "매칭 실패", NO_EVENT: "일정 없음"}
+
+    def _render_import(self, ev_list, ev_labels):
+        service = AttendanceImportService(self.db)
+        source = st.radio("가져올 내용", ["💬 밴드 댓글/명단 붙여넣기", "📄 CSV (여러 일정)"], horizontal=True, key="import_source")
+        
+        entries = None
+        if source.startswith("💬"):
+            sel_idx = st.selectbox(f"🎯 산행 선택 (총 {len(ev_list)}건)", range(len(ev_labels)), format_func=ev_labels.__getitem__, key="import_event")
+            text = st.text_area("📋 댓글/명단 붙여넣기", height=200, key="import_text",
+                                placeholder="한 줄(또는 쉼표)에 한 명씩\n예) 홍길동 참석합니다 / 85 김철수 / 1990/이영희/강남")
+            if text.strip():
+                entries = service.parse_text(text, ev_list['event_id'].iloc[sel_idx])
+        else:
+            st.caption("필수 컬럼: event_id, name / 선택: birth_year")
+            file = st.file_uploader("📄 참석자 CSV", type=["csv"], key="import_file")
+            if file is not None:
+                try:
+                    entries = service.parse_csv(file)
+                except (ValueError, pd.errors.ParserError) as e:
+                    st.error(f"CSV를 읽을 수 없습니다: {e}")
+        
+        if st.button("🔍 회원 매칭", disabled=entries is None or entries.empty):
+            st.session_state["import_plan"] = service.match(entries)
+        
+        plan = st.session_state.get("import_plan")
+        if plan is not None:
+            events = dict(zip(ev_list['event_id'].astype(str), ev_labels))
+            self._render_plan(service, plan, events)
+
+    def _render_plan(self, service, plan, events):
+        counts = plan.counts()
+        st.info(" · ".join(f"{label} **{counts.get(status, 0)}건**" for status, label in self.STATUS_LABELS.items()))
+        
+        failed = plan.rows[plan.rows['status'].isin([UNMATCHED, NO_EVENT])]
+        if not failed.empty:
+            with st.expander(f"⚠️ 저장되지 않는 항목 ({len(failed)}건)"):
+                st.dataframe(
+                    failed.assign(사유=failed['status'].map(self.STATUS_LABELS))[['event_id', 'raw', '사유']],
+                    hide_index=True, use_container_width=True,
+                )
+        
+        with st.form("import_confirm"):
+            # 자동 확정: 체크 해제하면 제외
+            matched = plan.of(MATCHED)
+            matched_view = pd.DataFrame({
+                '포함': True,
+                '일정': matched['event_id'].map(events),
+                '입력': matched['raw'],
+                '회원': matched['label'],
+                '유사도': matched['score'].astype(float),
+            })
+            st.markdown(f"**✅ 자동 확정 ({len(matched)}건)**")
+            edited = st.data_editor(
+                matched_view, hide_index=True, use_container_width=True, key="import_matched",
+                disabled=['일정', '입력', '회원', '유사도'],
+            )
+            
+            # 확인 필요: 입력마다 후보 중에서 선택 (기본값 1순위)
+            ambiguous = plan.of(AMBIGUOUS)
+            picks = {}
+            if not ambiguous.empty:
+                st.markdown(f"**❓ 확인 필요 ({len(ambiguous)}건)**")
+            for i, row in ambiguous.iterrows():
+                options = [c[0] for c in row['candidates']] + [None]
+                names = {c[0]: f"{c[1]} ({c[2]:.2f})" for c in row['candidates']}
+                picks[i] = st.selectbox(
+                    f"{row['raw']} — {events.get(str(row['event_id']), row['event_id'])}",
+                    options, format_func=lambda u, names=names: names.get(u, "🚫 제외"), key=f"import_pick_{i}",
+                )
+            
+            submitted = st.form_submit_button("💾 일괄 저장", type="primary")
+        
+        if submitted:
+            pairs = list(zip(matched['event_id'][edited['포함'].to_numpy()], matched['user_no'][edited['포함'].to_numpy()]))
+            pairs += [(ambiguous.at[i, 'event_id'], u) for i, u in picks.items() if u is not None]
+            with st.spinner("⏳ 참석 명단을 저장 중입니다..."):
+                added = service.save(pairs)
+            del st.session_state["import_plan"]
+            st.success(f"✅ **일괄 저장 완료!** (선택 {len(set(pairs))}건 중 새로 추가 {added}건, 나머지는 이미 등록됨)")
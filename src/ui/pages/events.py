@@ -1,11 +1,42 @@
+import re
 import streamlit as st
 import pandas as pd
 from src.ui.layout import Layout
+from src.ui.editor_changes import EditorChangeSet
+from src.services.grid_service import GridService, GridFilter
+from src.services.dates import month_bounds
 
 # =========================================================
 # Page: Events (산행 일정)
 # =========================================================
 
+# 앨범 URL 끝의 숫자 = event_id. ".../12345", ".../12345/" 또는 슬래시 없이 끝나는 숫자 ("...?no=12345")
+_ALBUM_ID_RE = re.compile(r"/(\d+)/?$|(\d+)$")
+
+
+def normalize_event_ids(df):
+    """
+    저장할 일정 행의 event_id를 정리합니다. (공백 제거, 비어 있으면 album_url에서 추출)
+    (정리된 DataFrame, 오류 메시지 목록)을 반환하며, ID가 없거나 중복된 행이 있으면 오류로 돌려줍니다.
+    """
+    df = df.copy()
+    event_id = df['event_id'].astype("string").str.strip().fillna("")
+    if 'album_url' in df.columns:
+        album_url = df['album_url'].astype("string").str.strip().fillna("")
+        from_url = album_url.str.extract(_ALBUM_ID_RE).bfill(axis=1).iloc[:, 0]
+        event_id = event_id.mask(event_id == "", from_url.fillna(""))
+    df['event_id'] = event_id.astype(object)
+
+    errors = []
+    missing = df.loc[event_id == "", 'title'].fillna("(제목 없음)")
+    if len(missing):
+        errors.append(f"ID가 없는 일정 {len(missing)}건 (ID 또는 앨범 URL을 입력하세요): " + ", ".join(map(str, missing)))
+    dup = event_id[(event_id != "") & event_id.duplicated(keep=False)].unique()
+    if len(dup):
+        errors.append("같은 ID가 여러 행에 있습니다: " + ", ".join(dup))
+    return df, errors
+
+
 class EventsPage:
     def __init__(self, db):
         self.db = db
@@ -13,30 +44,29 @@ class EventsPage:
     def render(self):
         Layout.render_manual("공지 관리")
         st.header("📅 공지 관리")
-        df_e = self.db.query("SELECT * FROM events ORDER BY date DESC")
+        grid = GridService(self.db)
         
         # [일정 검색 및 필터]
         with st.expander("🔍 일정 검색 및 필터", expanded=True):
             c1, c2 = st.columns([1, 2])
             with c1:
-                df_e['month'] = df_e['date'].astype(str).str[:7]
-                months = sorted(df_e['month'].unique(), reverse=True)
+                months = grid.options("events", "strftime(month, '%Y-%m')")[::-1]
                 sel_month = st.selectbox("📅 월 선택", ["전체"] + months)
             with c2:
                 search_text = st.text_input("📝 제목 검색", placeholder="일정 제목")
 
-        mask = pd.Series([True] * len(df_e))
-        if sel_month != "전체":
-            mask &= (df_e['month'] == sel_month)
-        if search_text:
-            mask &= df_e['title'].str.contains(search_text, case=False, na=False)
-            
-        df_filtered = df_e[mask]
-        st.subheader(f"🗓️ 등록된 일정 (표시: {len(df_filtered)} / 전체: {len(df_e)}건)")
-        
-        # [DB에 없는 임시 컬럼 제거]
-        if 'month' in df_filtered.columns:
-            df_filtered = df_filtered.drop(columns=['month'])
+        # 월 필터는 생성 컬럼(month) 비교 대신 date 범위로 (행마다 date_trunc를 계산하지 않음)
+        month_start, month_end = (None, None) if sel_month == "전체" else month_bounds(sel_month)
+        grid_filter = (
+            GridFilter()
+            .between("date", month_start, month_end)
+            .search("events", "event_id", search_text)
+        )
+        matched = grid.count("events", grid_filter)
+        page = Layout.render_pager("event_page", grid.pages(matched), grid_filter.signature)
+        # month는 DB 생성 컬럼이라 저장 대상에서 제외
+        df_filtered = grid.page("events", grid_filter, "date DESC, event_id", page, columns="* EXCLUDE (month)")
+        st.subheader(f"🗓️ 등록된 일정 (표시: {matched} / 전체: {grid.total('events')}건)")
         
         # [컬럼 재정렬]
         target_order = ['date', 'title', 'host', 'event_id', 'album_url', 'description']
@@ -59,53 +89,28 @@ class EventsPage:
         )
         
         if st.button("💾 일정 최종 저장"):
+            # 편집 상태에서 실제로 바뀐 행만 추출
+            changes = EditorChangeSet.from_editor("event_editor", df_filtered, updated, "event_id")
+            if changes.is_empty:
+                st.info("변경된 내용이 없습니다.")
+                return
+            
+            # event_id 정리 및 검증 (문제가 있으면 아무것도 쓰지 않음)
+            to_save, errors = normalize_event_ids(changes.upserts)
+            if errors:
+                for message in errors:
+                    st.error(f"❌ {message}")
+                return
+
             with st.spinner("⏳ 일정을 저장하고 있습니다..."):
-                # [삭제 로직]
-                orig_ids_in_view = set(df_filtered['event_id'].astype(str).tolist())
-                curr_ids_in_view = set(updated['event_id'].astype(str).tolist())
-                deleted_ids = orig_ids_in_view - curr_ids_in_view
-                
-                for d_id in deleted_ids:
-                    self.db.execute("DELETE FROM events WHERE event_id = ?", (d_id,))
-                    self.db.execute("DELETE FROM attendees WHERE event_id = ?", (d_id,))
-                
-                # [저장/수정 로직]
-                cols = ", ".join([f'"{c}"' for c in updated.columns])
-                placeholders = ", ".join(["?"] * len(updated.columns))
-                sql = f"INSERT OR REPLACE INTO events ({cols}) VALUES ({placeholders})"
-                
-                import re
-                for _, row in updated.iterrows():
-                    # event_id 추출 및 보정
-                    event_id = str(row['event_id']).strip() if not pd.isna(row['event_id']) else ""
-                    album_url = str(row['album_url']).strip() if not pd.isna(row['album_url']) else ""
-                    
-                    if event_id == "" and album_url != "":
-                        # URL의 마지막 / 뒤의 숫자들 추출
-                        match = re.search(r'/(\d+)/?$', album_url)
-                        if not match:
-                            match = re.search(r'(\d+)$', album_url)
-                        
-                        if match:
-                            event_id = match.group(1)
-                    
-                    # 수동으로 튜플 생성하여 명시적으로 컬럼 순서 맞춤
-                    # updated.columns 순서대로 데이터 구성
-                    row_data = []
-                    for col in updated.columns:
-                        if col == 'event_id':
-                            row_data.append(event_id)
-                        else:
-                            row_data.append(row[col])
-                            
-                    self.db.execute(sql, tuple(row_data))
+                # 삭제 + 저장을 하나의 트랜잭션으로 반영
+                with self.db.transaction() as tx:
+                    tx.delete_keys("events", "event_id", changes.deleted_ids)
+                    tx.delete_keys("attendees", "event_id", changes.deleted_ids)
+                    tx.upsert_df("events", to_save, "event_id")
                     
                 import time
                 time.sleep(0.5)
                 
-                st.success(f"""
-                ✅ **일정 반영 완료!**
-                - 💾 **저장/수정**: {len(updated)}건
-                - 🗑️ **삭제**: {len(deleted_ids)}건
-                """)
+                st.success("✅ **일정 반영 완료!**\n" + changes.summary())
                 st.rerun()
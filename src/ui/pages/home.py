@@ -1,11 +1,12 @@
 import streamlit as st
 import pandas as pd
-import requests
 import plotly.express as px
 from datetime import datetime, timedelta
-from src.config import Config
+from src.services.dashboard_loader import DashboardLoader
+from src.services.leaderboard_service import LeaderboardService
+from src.services.image_cache import get_image_cache
+from src.ui import components
 from src.ui.layout import Layout
-from src.ui.styles import Styles
 from src.ui.themes import ThemeManager
 
 # =========================================================
@@ -16,6 +17,18 @@ class HomePage:
     def __init__(self, db, ai):
         self.db = db
         self.ai = ai
+        self.leaderboard = LeaderboardService(db)
+        self.loader = DashboardLoader(db)
+
+    # 탭 대신 선택된 섹션 하나만 실행 (st.tabs는 보이지 않는 탭까지 모두 계산함)
+    SECTIONS = ["📊 대시보드 (Overview)", "👥 회원 구성 (Demographics)", "🏆 명예의 전당 (Hall of Fame)"]
+
+    # 섹션별로 미리 불러올 데이터 (DashboardLoader.SOURCES 이름)
+    SECTION_SOURCES = [
+        ("kpis", "upcoming", "upcoming_weather", "forecast", "event_trend", "event_stats", "avatars"),
+        ("member_summary", "member_distribution"),
+        ("months", "leaderboard", "birth_years", "avatars"),
+    ]
 
     def render(self):
         Layout.render_manual("홈")
@@ -28,152 +41,138 @@ class HomePage:
         with col_print:
             pdf_mode = st.toggle("🖨️ PDF 출력 모드", key="pdf_mode_toggle", help="모든 인포그래픽을 한 화면에 표시하여 PDF로 저장하기 좋게 만듭니다.")
             if pdf_mode:
-                st.button("📄 PDF 파일로 저장", on_click=lambda: st.components.v1.html("<script>window.print();</script>", height=0))
-        
-        # [데이터 로드]
-        # v2.24.2 Hotfix: df_summary 정의 복구
-        df_summary = self.db.query("SELECT * FROM v_member_attendance_summary")
-        # v2.24.4 Hotfix: active_members 정의 복구
-        active_members = df_summary[df_summary['회원상태'] != 'exmember']
+                self._render_print_button()
         
         # [사이드바 AI 브리핑 버튼]
         with st.sidebar:
             st.divider()
-            st.subheader("🤖 AI 비서")
-            if st.button("✨ 월간 브리핑 생성", use_container_width=True):
-                today = datetime.now().strftime("%Y-%m-%d")
-                upcoming = self.db.query(f"SELECT * FROM events WHERE date >= '{today}' ORDER BY date ASC LIMIT 3")
-                if upcoming.empty:
-                    st.sidebar.warning("예정된 산행 데이터가 없습니다.")
-                else:
-                    self._show_ai_briefing(upcoming)
+            self._render_ai_assistant()
 
-        # [탭 또는 전체 보기 구조]
+        # [섹션 선택 또는 전체 보기 구조]
+        # 각 섹션은 fragment이므로 섹션 안의 위젯 조작은 해당 섹션만 다시 실행합니다.
+        # 보여줄 섹션의 데이터는 그리기 전에 한꺼번에 동시 조회 (DashboardLoader)
         if not pdf_mode:
-            tab_overview, tab_demo, tab_activity = st.tabs(["📊 대시보드 (Overview)", "👥 회원 구성 (Demographics)", "🏆 명예의 전당 (Hall of Fame)"])
+            section = st.radio("섹션", self.SECTIONS, horizontal=True, key="home_section", label_visibility="collapsed")
+            snapshot = self.loader.load(self.SECTION_SOURCES[self.SECTIONS.index(section)])
             
-            # --- [TAB 1] 종합 현황 (Overview) ---
-            with tab_overview: self._render_overview(df_summary)
+            # --- [1] 종합 현황 (Overview) ---
+            if section == self.SECTIONS[0]: self._render_overview(snapshot)
 
-            # --- [TAB 2] 회원 통계 (Demographics) ---
-            with tab_demo: self._render_demographics(df_summary)
+            # --- [2] 회원 통계 (Demographics) ---
+            elif section == self.SECTIONS[1]: self._render_demographics(snapshot)
 
-            # --- [TAB 3] 명예의 전당 (Hall of Fame) ---
-            with tab_activity: self._render_hall_of_fame(df_summary, active_members)
+            # --- [3] 명예의 전당 (Hall of Fame) ---
+            else: self._render_hall_of_fame(snapshot)
         else:
+            snapshot = self.loader.load(sum(self.SECTION_SOURCES, ()))
             # PDF 모드: 모든 내용을 위에서 아래로 순차적으로 렌더링
             st.info("💡 **PDF 출력 모드 활성화됨**: 모든 탭의 내용이 아래로 펼쳐집니다. 상단의 'PDF 파일로 저장' 버튼을 눌러주세요.")
             
             st.markdown("### 📊 [1] 종합 현황 (Overview)")
-            self._render_overview(df_summary)
+            self._render_overview(snapshot)
             
             st.divider()
             st.markdown("### 👥 [2] 회원 구성 (Demographics)")
-            self._render_demographics(df_summary)
+            self._render_demographics(snapshot)
             
             st.divider()
             st.markdown("### 🏆 [3] 명예의 전당 (Hall of Fame)")
-            self._render_hall_of_fame(df_summary, active_members)
+            self._render_hall_of_fame(snapshot)
+
+    @staticmethod
+    def _missing(snapshot, name, label):
+        """
+        snapshot에 name 항목이 없으면(실패/시간 초과) 경고를 표시하고 True를 반환합니다.
+        """
+        if getattr(snapshot, name) is not None:
+            return False
+        st.warning(f"⏱️ {label}을(를) 불러오지 못했습니다. ({snapshot.errors.get(name, '알 수 없음')})")
+        return True
+
+    @st.fragment
+    def _render_print_button(self):
+        # 인쇄 스크립트는 fragment 안에 그려야 페이지 전체가 다시 실행되지 않음
+        if st.button("📄 PDF 파일로 저장"):
+            st.components.v1.html("<script>window.parent.print();</script>", height=0)
+
+    @st.fragment
+    def _render_ai_assistant(self):
+        """
+        사이드바 AI 비서. 버튼을 눌러도 대시보드 전체가 아닌 이 영역만 다시 실행됩니다.
+        """
+        st.subheader("🤖 AI 비서")
+        if st.button("✨ 월간 브리핑 생성", use_container_width=True):
+            upcoming = self.db.query("SELECT * FROM events WHERE date >= ? ORDER BY date ASC LIMIT 3", (datetime.now().date(),))
+            if upcoming.empty:
+                st.warning("예정된 산행 데이터가 없습니다.")
+            else:
+                self._show_ai_briefing(upcoming)
 
-    def _render_overview(self, df_summary):
+    @st.fragment
+    def _render_overview(self, snapshot):
         # 1. KPI Cards
-        total_members = self.db.query("SELECT COUNT(*) FROM members WHERE role<>'exmember'").iloc[0, 0]
-        
-        df_points = self.db.query("SELECT user_no, point FROM members WHERE role<>'exmember'")
-        total_base = df_points['point'].sum() if not df_points.empty else 0
-        event_score = self.db.query("SELECT SUM(e.score) FROM events e JOIN attendees a ON e.event_id = a.event_id").iloc[0,0]
-        if pd.isna(event_score): event_score = 0
-        total_activity_score = total_base + event_score
-        
-        three_months_ago = (datetime.now() - timedelta(days=90)).strftime('%Y-%m-%d')
-        active_count = self.db.query(f"SELECT COUNT(DISTINCT user_no) FROM attendees a JOIN events e ON a.event_id = e.event_id WHERE e.date >= '{three_months_ago}'").iloc[0,0]
+        # 단일 집계 쿼리 (쓰기가 없으면 조회 캐시에서 바로 반환)
+        if not self._missing(snapshot, "kpis", "핵심 지표"):
+            kpis = snapshot.kpis
+            # 세 카드를 한 번의 st.markdown으로 전송 (공통 클래스는 Styles.compile_css의 dd-* 참고)
+            components.render(components.grid([
+                components.kpi_card("총 회원수", kpis.total_members, "cyan"),
+                components.kpi_card("최근 활동 회원", kpis.active_members, "green"),
+                components.kpi_card("누적 포인트", f"{int(kpis.total_points):,}", "magenta"),
+            ], 3))
 
-        c = ThemeManager.current.colors
-        
-        c1, c2, c3 = st.columns(3)
-        with c1:
-            # Force White/Light colors for visibility on dark background
-            st.markdown(Styles.card_template(f"""<span style="font-size: 15px; color: #b7e4c7 !important; font-weight: bold;">총 회원수</span><br><span style="font-size: 38px; font-weight: bold; color: #ffffff !important;">{total_members}</span>""", extra_classes="neon-border-cyan"), unsafe_allow_html=True)
-        with c2:
-            st.markdown(Styles.card_template(f"""<span style="font-size: 15px; color: #b7e4c7 !important; font-weight: bold;">최근 활동 회원</span><br><span style="font-size: 38px; font-weight: bold; color: #ffffff !important;">{active_count}</span>""", extra_classes="neon-border-green"), unsafe_allow_html=True)
-        with c3:
-            st.markdown(Styles.card_template(f"""<span style="font-size: 15px; color: #b7e4c7 !important; font-weight: bold;">누적 포인트</span><br><span style="font-size: 38px; font-weight: bold; color: #ffffff !important;">{int(total_activity_score):,}</span>""", extra_classes="neon-border-magenta"), unsafe_allow_html=True)
-        
         st.markdown("---")
         
         # 2. Events & Weather
         c3, c4 = st.columns([1.2, 1])
         
         with c3:
-            st.markdown(f"""<div style="background-color: rgba(0,0,0,0.5); padding: 20px; border-radius: 15px;">""", unsafe_allow_html=True)
-            st.subheader("📅 다가오는 산행")
             today = datetime.now().strftime("%Y-%m-%d")
-            # 주최자 정보를 가져오기 위해 members 테이블과 JOIN
-            sql = f"""
-                SELECT e.*, m.name as host_name, m.birth_year, m.area, m.profile_image_url 
-                FROM events e 
-                LEFT JOIN members m ON e.host = m.user_no 
-                WHERE e.date >= '{today}' 
-                ORDER BY e.date ASC 
-                LIMIT 3
-            """
-            upcoming = self.db.query(sql)
+            upcoming = snapshot.upcoming if snapshot.upcoming is not None else pd.DataFrame()
+            self._missing(snapshot, "upcoming", "다가오는 산행")
             
+            cards = []
             if not upcoming.empty:
-                for _, row in upcoming.iterrows():
+                # 산행지 예보와 프로필 썸네일은 로더가 미리 받아 둠 (실패/시간 초과 시 날씨 생략, 이니셜 아바타)
+                event_weather = snapshot.upcoming_weather or (None,) * len(upcoming)
+                avatars = get_image_cache()
+                for i, (_, row) in enumerate(upcoming.iterrows()):
                     d_day = (pd.to_datetime(row['date']) - pd.to_datetime(today)).days
-                    badge = f"D-{d_day}" if d_day > 0 else "D-Day"
-                    badge_color = "#ef4444" if d_day <= 3 else "#3b82f6"
                     
                     # 주최자 상세 정보 포맷팅 (생년/이름/지역)
                     birth = str(int(row['birth_year']))[-2:] if pd.notna(row['birth_year']) else "??"
                     host_info = f"{birth}/{row['host_name'] or row['host']}/{row['area'] or '미상'}"
                     
-                    # 프로필 이미지 처리
-                    img_url = row['profile_image_url'] if pd.notna(row['profile_image_url']) and row['profile_image_url'] else "https://ui-avatars.com/api/?name=" + (row['host_name'] or "Host") + "&background=random"
-                    
-                    # 날짜 형식 처리 (시간 정보 제거)
-                    display_date = pd.to_datetime(row['date']).strftime('%Y-%m-%d')
-                    
-                    c = ThemeManager.current.colors
-                    
-                    st.markdown(f"""
-                    <div style="background: {c.card_bg}; border-radius: 12px; margin-bottom: 12px; border: 1px solid {c.border}; display: flex; overflow: hidden; box-shadow: 0 4px 10px rgba(0,0,0,0.05); transition: transform 0.3s ease;" class="hover-3d">
-                        <div style="width: 6px; background: {badge_color};"></div>
-                        <div style="flex-grow: 1; padding: 12px; display: flex; justify-content: space-between; align-items: center;">
-                            <div>
-                                <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 6px;">
-                                    <span style="background-color: {badge_color}22; color: {badge_color}; padding: 2px 8px; border-radius: 4px; font-size: 11px; font-weight: bold;">{badge}</span>
-                                    <span style="font-weight: bold; font-size: 16px; color: {c.text_primary};">{row['title']}</span>
-                                </div>
-                                <div style="display: flex; align-items: center; gap: 10px;">
-                                    <img src="{img_url}" style="width: 35px; height: 35px; border-radius: 50%; object-fit: cover; border: 1px solid {c.border};">
-                                    <div style="display: flex; flex-direction: column;">
-                                        <div style="color: {c.text_secondary}; font-size: 13px; font-weight: 500;">📅 {display_date}</div>
-                                        <div style="color: {c.text_secondary}; font-size: 12px; opacity: 0.8;">👑 {host_info}</div>
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
-            else:
-                st.info("예정된 산행이 없습니다.")
-            st.markdown("</div>", unsafe_allow_html=True)
+                    cards.append(components.event_card(
+                        title=row['title'],
+                        badge=f"D-{d_day}" if d_day > 0 else "D-Day",
+                        urgent=d_day <= 3,
+                        # 프로필 이미지 (로컬 썸네일 또는 이니셜 아바타)
+                        img_url=avatars.avatar(row['profile_image_url'], row['host_name'] or row['host']),
+                        # 날짜 형식 처리 (시간 정보 제거)
+                        date=pd.to_datetime(row['date']).strftime('%Y-%m-%d'),
+                        host_info=host_info,
+                        # 산행지 날씨 (제목에서 산을 찾지 못했거나 예보 범위 밖이면 생략)
+                        weather=event_weather[i],
+                    ))
+            body = "".join(cards) if cards else components.empty("예정된 산행이 없습니다.")
+            components.render(components.panel("📅 다가오는 산행", body))
 
         with c4:
-            st.markdown(f"""<div style="background-color: rgba(0,0,0,0.5); padding: 20px; border-radius: 15px;">""", unsafe_allow_html=True)
-            st.subheader("🌤️ 서울 날씨")
-            self._render_weather_forecast()
-            st.markdown("</div>", unsafe_allow_html=True)
+            self._render_weather_forecast(snapshot.forecast)
 
         # 4. 최근 공지 분석 (Relocated from Demographics)
         st.markdown("---")
-        self._render_event_analysis()
+        self._render_event_analysis(snapshot)
 
-    def _render_demographics(self, df_summary):
+    @st.fragment
+    def _render_demographics(self, snapshot):
+        if self._missing(snapshot, "member_summary", "회원 요약") or self._missing(snapshot, "member_distribution", "회원 분포"):
+            return
+        df_summary = snapshot.member_summary
         c3, c4 = st.columns(2)
-        df_dist = self.db.query("SELECT birth_year, gender FROM members WHERE role<>'exmember'")
+        # 스냅샷은 공유 데이터이므로 컬럼을 추가하기 전에 사본 사용
+        df_dist = snapshot.member_distribution.copy()
         
         with c3:
             st.markdown("### 📅 연도별 인원 (Birth Year)")
@@ -362,41 +361,16 @@ class HomePage:
         st.plotly_chart(fig_map, use_container_width=True)
         st.markdown("""<div style="text-align: right; font-size: 13px; color: #bbb; margin-top: -10px;">* 위치는 실제 지도 좌표를 바탕으로 단순화된 모식도입니다.</div>""", unsafe_allow_html=True)
 
-    def _render_event_analysis(self):
+    def _render_event_analysis(self, snapshot):
         c1, c2 = st.columns([1, 1.2])
+        df_stats = snapshot.event_stats if snapshot.event_stats is not None else pd.DataFrame()
         with c1:
             st.subheader("📊 최근 공지 분석")
-            # 1. 월별 추이 (최근 5개월)
-            sql_trend = """
-                SELECT strftime('%Y-%m', date) as month, count(*) as count 
-                FROM events 
-                WHERE date >= CAST(date_trunc('month', today() - interval 4 month) AS DATE)
-                  AND date <= today()
-                GROUP BY month 
-                ORDER BY month
-            """
-            
-            # 2. 연간 통계 (최근 12개월)
-            sql_stats = """
-                WITH monthly_data AS (
-                    SELECT strftime('%Y-%m', date) as month, count(*) as cnt 
-                    FROM events 
-                    WHERE date >= CAST(date_trunc('month', today() - interval 11 month) AS DATE)
-                      AND date <= today()
-                    GROUP BY month
-                )
-                SELECT 
-                    (SELECT AVG(cnt) FROM monthly_data) as avg_cnt,
-                    (SELECT month FROM monthly_data ORDER BY cnt DESC, month DESC LIMIT 1) as peak_month,
-                    (SELECT cnt FROM monthly_data ORDER BY cnt DESC, month DESC LIMIT 1) as peak_cnt,
-                    (SELECT month FROM monthly_data ORDER BY cnt ASC, month ASC LIMIT 1) as low_month,
-                    (SELECT cnt FROM monthly_data ORDER BY cnt ASC, month ASC LIMIT 1) as low_cnt,
-                    (SELECT count(*) FROM events WHERE strftime('%Y-%m', date) = strftime('%Y-%m', today()) AND date <= today()) as current_cnt
-            """
-            
+            # 월별 추이(최근 5개월)와 연간 통계(최근 12개월)는 DashboardService.TREND_SQL / STATS_SQL
             try:
-                df_trend = self.db.query(sql_trend)
-                df_stats = self.db.query(sql_stats)
+                if self._missing(snapshot, "event_trend", "월별 추이") or self._missing(snapshot, "event_stats", "연간 통계"):
+                    return
+                df_trend = snapshot.event_trend
                 
                 if not df_trend.empty and not df_stats.empty:
                     max_count = df_trend['count'].max()
@@ -463,127 +437,60 @@ class HomePage:
                 st.error(f"Stats Load Error: {e}")
 
 
-    def _render_hall_of_fame(self, df_summary, active_members):
-        now = datetime.now(Config.KST)
-        cur_month_str = now.strftime('%Y-%m')
-        st.subheader(f"🏆 {now.month}월의 명예의 전당")
-        
-        c_host, c_attend, c_event = st.columns(3)
+    @st.fragment
+    def _render_hall_of_fame(self, snapshot):
+        # [월 선택] 이번 달은 스냅샷, 지난 달은 캐시된 집계로 바로 조회
+        months = list(snapshot.months) if snapshot.months is not None else self.leaderboard.available_months()
+        current = self.leaderboard.current_month()
+        cur_month_str = st.selectbox("📅 조회 월", months, index=months.index(current), key="hof_month")
+        sel_month = int(cur_month_str[5:7])
+        # 이번 달이 아니면 카드/요약 문구에 선택한 월을 표시 (다른 해면 연도까지)
+        if cur_month_str == current:
+            card_label, total_label = "이달", "이번 달"
+        else:
+            card_label = total_label = f"{sel_month}월" if cur_month_str[:4] == current[:4] else f"{cur_month_str[:4]}년 {sel_month}월"
+        if snapshot.leaderboard is not None and snapshot.leaderboard.month == cur_month_str:
+            board = snapshot.leaderboard
+        else:
+            board = self.leaderboard.get_month(cur_month_str)
+        st.subheader(f"🏆 {sel_month}월의 명예의 전당")
         
-        def get_rank_html(rank, text, subtext, img_url=None):
-            colors = ["#FFD700", "#C0C0C0", "#CD7F32"] 
-            color = colors[rank] if rank < 3 else "rgba(128,128,128,0.5)"
-            rank_num = rank + 1
-            
-            c = ThemeManager.current.colors
-            
-            # 이미지 URL이 없으면 기본 아바타 사용
-            if not img_url:
-                img_url = f"https://ui-avatars.com/api/?name={text}&background=random"
-            
-            border_style = f"border: 2px solid {color};" if rank < 3 else f"border: 1px solid {c.border};"
-            
-            return f"""
-            <div class="glass-card hover-3d" style="{border_style} padding: 12px; margin-bottom: 10px; display: flex; align-items: center; background: {c.card_bg};">
-                <div style="position: relative; margin-right: 15px;">
-                    <img src="{img_url}" style="width: 40px; height: 40px; border-radius: 50%; object-fit: cover; border: 2px solid {color if rank < 3 else c.border};">
-                    <div style="position: absolute; bottom: -5px; right: -5px; width: 20px; height: 20px; background-color: {color}; color: #000; font-weight: bold; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 11px; box-shadow: 0 2px 4px rgba(0,0,0,0.2);">{rank_num}</div>
-                </div>
-                <div style="flex-grow: 1;">
-                    <div style="font-weight: bold; color: {c.text_primary}; font-size: 15px;">{text}</div>
-                    <div style="font-size: 13px; color: {c.text_secondary}; font-weight: 500;">{subtext}</div>
-                </div>
-            </div>
-            """
-
-        with c_host:
-            st.markdown("##### 📣 이달의 공지왕")
-            try:
-                # members 테이블과 JOIN하여 profile_image_url 가져옴
-                df_host = self.db.query(f"""
-                    SELECT m.name, m.profile_image_url, COUNT(*) as cnt 
-                    FROM events e 
-                    JOIN members m ON e.host = m.user_no 
-                    WHERE strftime('%Y-%m', e.date) = '{cur_month_str}' 
-                    GROUP BY m.name, m.profile_image_url 
-                    ORDER BY cnt DESC 
-                    LIMIT 3
-                """)
-                if not df_host.empty:
-                    for idx, row in df_host.iterrows():
-                        st.markdown(get_rank_html(idx, row['name'], f"{row['cnt']}회", row['profile_image_url']), unsafe_allow_html=True)
-                else:
-                    st.caption("데이터 없음")
-            except Exception as e:
-                st.error(f"Error: {e}")
+        # 스냅샷에 없던 달의 사진은 avatar()가 백그라운드로 받아 두고, 그동안은 이니셜 아바타로 표시
+        avatars = get_image_cache()
 
-        with c_attend:
-            st.markdown("##### 🏃 이달의 참석왕")
+        def rank_column(title, df, build):
+            # 세 열의 순위 카드를 모아 한 번에 그림 (열마다 오류는 해당 열에만 표시)
             try:
-                # active_members에는 profile_image_url이 없을 수 있으므로 members와 다시 JOIN 하거나
-                # 애초에 획득점수를 다시 계산하여 가져옴
-                df_attend = self.db.query(f"""
-                    SELECT m.name, m.profile_image_url, SUM(e.score) as score
-                    FROM attendees a
-                    JOIN events e ON a.event_id = e.event_id
-                    JOIN members m ON a.user_no = m.user_no
-                    WHERE strftime('%Y-%m', e.date) = '{cur_month_str}'
-                    GROUP BY m.name, m.profile_image_url
-                    ORDER BY score DESC
-                    LIMIT 3
-                """)
-                
-                if not df_attend.empty:
-                    for idx, row in df_attend.iterrows():
-                        st.markdown(get_rank_html(idx, row['name'], f"{int(row['score'])}점", row['profile_image_url']), unsafe_allow_html=True)
-                else:
-                    st.caption("데이터 없음")
+                cards = [build(idx, row) for idx, row in df.iterrows()]
+                body = "".join(cards) if cards else components.empty("데이터 없음")
             except Exception as e:
-                st.error(f"Error: {e}")
+                body = components.empty(f"Error: {e}")
+            return components.column(title, body)
 
-        with c_event:
-            st.markdown("##### 🔥 이달의 인기 산행")
-            try:
-                df_pop = self.db.query(f"SELECT e.title, COUNT(a.user_no) as cnt FROM events e JOIN attendees a ON e.event_id = a.event_id WHERE strftime('%Y-%m', e.date) = '{cur_month_str}' GROUP BY e.title ORDER BY cnt DESC LIMIT 3")
-                if not df_pop.empty:
-                    for idx, row in df_pop.iterrows():
-                        # 이벤트는 이미지가 없으므로 텍스트만 표시하는 기존 스타일 유지하거나 아이콘 사용
-                        st.markdown(f"""
-                        <div style="background-color: rgba(0,0,0,0.4); padding: 10px; border-radius: 12px; margin-bottom: 8px; display: flex; align-items: center; border: 1px solid rgba(255,255,255,0.05);">
-                            <div style="width: 28px; height: 28px; border-radius: 50%; background-color: #FFFFFF; color: #000; font-weight: bold; display: flex; align-items: center; justify-content: center; margin-right: 12px; flex-shrink: 0; font-size: 14px;">{idx+1}</div>
-                            <div style="flex-grow: 1;">
-                                <div style="font-weight: bold; color: #fff; font-size: 14px;">{row['title']}</div>
-                                <div style="font-size: 13px; color: #ddd;">{row['cnt']}명 참석</div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                else:
-                    st.caption("데이터 없음")
-            except Exception as e:
-                st.error(f"Error: {e}")
+        components.render(components.grid([
+            rank_column(f"📣 {card_label}의 공지왕", board.top_hosts, lambda idx, row: components.rank_card(
+                idx, row['name'], f"{row['cnt']}회", avatars.avatar(row['profile_image_url'], row['name']))),
+            rank_column(f"🏃 {card_label}의 참석왕", board.top_attendees, lambda idx, row: components.rank_card(
+                idx, row['name'], f"{int(row['score'])}점", avatars.avatar(row['profile_image_url'], row['name']))),
+            rank_column(f"🔥 {card_label}의 인기 산행", board.popular_events, lambda idx, row: components.popular_event_card(
+                idx, row['title'], f"{row['cnt']}명 참석")),
+        ], 3))
         
         st.divider()
-        # [생년별 포인트 -> 이달의 생년별 참가 현황]
+        # [생년별 포인트 -> 선택한 달의 생년별 참가 현황]
         try:
             # 1. 모든 활성 회원의 생년 기종 추출
-            df_all_births = self.db.query("SELECT DISTINCT birth_year FROM members WHERE role<>'exmember' ORDER BY birth_year")
+            df_all_births = snapshot.birth_years if snapshot.birth_years is not None else self.loader.dashboard.get_birth_years()
             
-            # 2. 이달의 참가 데이터 추출 (실인원 기준: 중복 제거)
-            df_curr_attend_raw = self.db.query(f"""
-                SELECT m.birth_year, COUNT(DISTINCT a.user_no) as cnt
-                FROM attendees a
-                JOIN events e ON a.event_id = e.event_id
-                JOIN members m ON a.user_no = m.user_no
-                WHERE strftime('%Y-%m', e.date) = '{cur_month_str}'
-                GROUP BY m.birth_year
-            """)
+            # 2. 선택한 달의 참가 데이터 (실인원 기준: 중복 제거, 명예의 전당 집계에 포함)
+            df_curr_attend_raw = board.birth_year_attendance
             
             # 3. 모든 생년에 대해 데이터 병합 (없으면 0)
             if not df_all_births.empty:
                 df_final = pd.merge(df_all_births, df_curr_attend_raw, on='birth_year', how='left').fillna(0)
                 df_final['생년'] = df_final['birth_year'].astype(int).astype(str).str[-2:] + "년"
                 
-                c = ThemeManager.current.colors
+                c = ThemeManager.get().colors
                 
                 # 차트 생성 (Mockup 기반 프리미엄 디자인)
                 fig_attend = px.bar(
@@ -605,9 +512,9 @@ class HomePage:
                 
                 fig_attend.update_layout(
                     title={
-                        'text': f"📅 {now.month}월 생년별 참가 분포 (실인원 기준)",
+                        'text': f"📅 {sel_month}월 생년별 참가 분포 (실인원 기준)",
                         'y':0.95, 'x':0.5, 'xanchor': 'center', 'yanchor': 'top',
-                        'font': {'size': 20, 'color': c.text_primary, 'family': ThemeManager.current.font_header}
+                        'font': {'size': 20, 'color': c.text_primary, 'family': ThemeManager.get().font_header}
                     },
                     paper_bgcolor='rgba(0,0,0,0)',
                     plot_bgcolor=c.card_bg, # Use card bg for plot area integration
@@ -633,7 +540,7 @@ class HomePage:
                 total_m_attend = int(df_final['cnt'].sum())
                 st.markdown(f"""
                 <div style="text-align: center; color: #ddd; font-size: 15px; margin-top: -10px;">
-                    🎯 이번 달 총 참가 실인원: <span style="color: #ec4899; font-weight: bold; font-size: 19px;">{total_m_attend}명</span> (생년별 중복 제외 합계)
+                    🎯 {total_label} 총 참가 실인원: <span style="color: #ec4899; font-weight: bold; font-size: 19px;">{total_m_attend}명</span> (생년별 중복 제외 합계)
                 </div>
                 """, unsafe_allow_html=True)
             else:
@@ -641,42 +548,17 @@ class HomePage:
         except Exception as e:
             st.error(f"Chart Render Error: {e}")
 
-    def _render_weather_forecast(self):
-        try:
-            url = "https://api.open-meteo.com/v1/forecast?latitude=37.5665&longitude=126.9780&daily=weather_code,temperature_2m_max,temperature_2m_min&timezone=Asia%2FTokyo"
-            res = requests.get(url, timeout=3).json()
-            
-            if 'daily' in res:
-                d = res['daily']
-                dates = d['time']
-                codes = d['weather_code']
-                max_t = d['temperature_2m_max']
-                min_t = d['temperature_2m_min']
-                
-                def get_icon(c):
-                    if c == 0: return "☀️"
-                    if c in [1,2,3]: return "🌥️"
-                    if c in [45,48]: return "🌫️"
-                    if c in [51,53,55,61,63,65]: return "🌧️"
-                    if c in [71,73,75,77]: return "❄️"
-                    if c >= 95: return "⛈️"
-                    return "🌡️"
-
-                cols = st.columns(7)
-                for i in range(7): 
-                    with cols[i]:
-                        dt = datetime.strptime(dates[i], "%Y-%m-%d")
-                        dow = ["월", "화", "수", "목", "금", "토", "일"][dt.weekday()]
-                        
-                        st.markdown(f"""<div style="text-align: center; font-size: 12px; background-color: rgba(255,255,255,0.05); padding: 5px; border-radius: 8px;">
-                        {dt.strftime('%m/%d')}<br>({dow})<br>
-                        <span style="font-size: 20px;">{get_icon(codes[i])}</span><br>
-                        <span style="color: #ff6b6b;">{int(max_t[i])}°</span><br><span style="color: #4ecdc4;">{int(min_t[i])}°</span>
-                        </div>""", unsafe_allow_html=True)
-            else:
-                st.error("날씨 정보 없음")
-        except Exception as e:
+    def _render_weather_forecast(self, forecast):
+        # 네트워크는 백그라운드 스레드가 담당하고, 여기서는 로더가 받아 둔 마지막 예보만 그림
+        if forecast is None:
+            st.subheader("🌤️ 서울 날씨")
             st.error("날씨 로드 실패")
+            return
+
+        note = None
+        if forecast.stale:
+            note = f"⚠️ 최신 예보를 가져오지 못해 {forecast.fetched_at.strftime('%m/%d %H:%M')} 기준 예보를 표시합니다."
+        components.render(components.panel("🌤️ 서울 날씨", components.weather_strip(forecast.days, note)))
 
     def _show_ai_briefing(self, upcoming_events):
         with st.chat_message("assistant"):
@@ -1,6 +1,7 @@
 import streamlit as st
-import pandas as pd
 from src.ui.layout import Layout
+from src.ui.editor_changes import EditorChangeSet
+from src.services.grid_service import GridService, GridFilter
 
 # =========================================================
 # Page: Members (회원 관리)
@@ -14,37 +15,32 @@ class MembersPage:
         Layout.render_manual("회원 관리")
         st.header("👥 회원 명부 관리")
         
-        # 1. 원본 데이터 로드
-        df_all = self.db.query("SELECT * FROM members ORDER BY birth_year, name")
+        grid = GridService(self.db)
         
-        # [고급 필터 & 검색]
+        # [고급 필터 & 검색] 선택지는 members에 쓰기가 있을 때만 다시 조회
         with st.expander("🔍 상세 검색 및 필터", expanded=True):
             c1, c2, c3, c4 = st.columns([1, 1, 1, 1.5])
             with c1: 
-                years = sorted(df_all['birth_year'].dropna().unique())
-                sel_years = st.multiselect("🎂 생년", years, placeholder="전체")
+                sel_years = st.multiselect("🎂 생년", grid.options("members", "birth_year"), placeholder="전체")
             with c2:
-                areas = sorted(df_all['area'].dropna().unique())
-                sel_areas = st.multiselect("📍 지역", areas, placeholder="전체")
+                sel_areas = st.multiselect("📍 지역", grid.options("members", "area"), placeholder="전체")
             with c3:
-                roles = sorted(df_all['role'].dropna().unique())
-                sel_roles = st.multiselect("👑 역할", roles, placeholder="전체")
+                sel_roles = st.multiselect("👑 역할", grid.options("members", "role"), placeholder="전체")
             with c4:
                 search_name = st.text_input("👤 이름/설명 검색", placeholder="검색어 입력")
 
-        # 필터링 로직
-        mask = pd.Series([True] * len(df_all))
-        if sel_years: mask &= df_all['birth_year'].isin(sel_years)
-        if sel_areas: mask &= df_all['area'].isin(sel_areas)
-        if sel_roles: mask &= df_all['role'].isin(sel_roles)
-        if search_name:
-            mask &= (
-                df_all['name'].str.contains(search_name, case=False, na=False) | 
-                df_all['description'].str.contains(search_name, case=False, na=False)
-            )
-        
-        df_filtered = df_all[mask]
-        st.caption(f"검색 결과: **{len(df_filtered)}**명 (전체 {len(df_all)}명 중)")
+        # 필터링 로직 (파라미터 SQL)
+        grid_filter = (
+            GridFilter()
+            .isin("birth_year", sel_years)
+            .isin("area", sel_areas)
+            .isin("role", sel_roles)
+            .search("members", "user_no", search_name)
+        )
+        matched = grid.count("members", grid_filter)
+        page = Layout.render_pager("member_page", grid.pages(matched), grid_filter.signature)
+        df_filtered = grid.page("members", grid_filter, "birth_year, name, user_no", page)
+        st.caption(f"검색 결과: **{matched}**명 (전체 {grid.total('members')}명 중)")
         
         # 컬럼 순서
         target_order = ['birth_year', 'name', 'area', 'role', 'gender', 'user_no', 'phone', 'description', 'original_name', 'point', 'created_at', 'last_attended', 'profile_image_url']
@@ -69,28 +65,20 @@ class MembersPage:
         )
         
         if st.button("💾 회원 정보 최종 저장"):
+            # 편집 상태에서 실제로 바뀐 행만 추출
+            changes = EditorChangeSet.from_editor("member_editor", df_filtered, updated, "user_no")
+            if changes.is_empty:
+                st.info("변경된 내용이 없습니다.")
+                return
+            
             with st.spinner("⏳ 회원 정보를 저장하고 있습니다..."):
-                # [삭제 로직]
-                orig_ids_in_view = set(df_filtered['user_no'].astype(str).tolist())
-                curr_ids_in_view = set(updated['user_no'].astype(str).tolist())
-                deleted_ids = orig_ids_in_view - curr_ids_in_view
-                
-                for d_id in deleted_ids:
-                    self.db.execute("DELETE FROM members WHERE user_no = ?", (d_id,))
-                
-                # [저장/수정 로직]
-                cols = ", ".join([f'"{c}"' for c in updated.columns])
-                placeholders = ", ".join(["?"] * len(updated.columns))
-                sql = f"INSERT OR REPLACE INTO members ({cols}) VALUES ({placeholders})"
-                for _, row in updated.iterrows():
-                    self.db.execute(sql, tuple(row))
+                # [삭제 + 저장/수정 로직] 추가/수정된 행만 하나의 트랜잭션으로 반영
+                with self.db.transaction() as tx:
+                    tx.delete_keys("members", "user_no", changes.deleted_ids)
+                    tx.upsert_df("members", changes.upserts, "user_no")
                 
                 import time
                 time.sleep(0.5)
                 
-                st.success(f"""
-                ✅ **작업 완료!**
-                - 💾 **저장/수정**: {len(updated)}건
-                - 🗑️ **삭제**: {len(deleted_ids)}건
-                """)
+                st.success("✅ **작업 완료!**\n" + changes.summary())
                 st.rerun()
@@ -2,6 +2,8 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 from src.config import Config
+from src.services.dates import month_bounds
+from src.services.summary_service import MemberSummaryService
 from src.ui.layout import Layout
 
 # =========================================================
@@ -20,10 +22,17 @@ class ReportPage:
         with col2: target_month = st.text_input("📅 대상 월 (YYYY-MM)", value=datetime.now(Config.KST).strftime('%Y-%m'))
         
         if st.button("📝 보고서 생성", type="primary", use_container_width=True):
+            try:
+                month_start, month_end = month_bounds(target_month)
+            except ValueError:
+                st.error("대상 월은 YYYY-MM 형식으로 입력해주세요. (예: 2024-05)")
+                return
+            target_month = month_start.strftime('%Y-%m')
+
             # 산행 내역 쿼리
-            df_ev = self.db.query(f"SELECT e.date, e.title, e.album_url, m.birth_year, m.name FROM events e JOIN attendees a ON e.event_id=a.event_id JOIN members m ON a.user_no=m.user_no WHERE strftime('%Y-%m', e.date)='{target_month}' ORDER BY e.date, m.birth_year, m.name")
+            df_ev = self.db.query("SELECT e.date, e.title, e.album_url, m.birth_year, m.name FROM events e JOIN attendees a ON e.event_id=a.event_id JOIN members m ON a.user_no=m.user_no WHERE e.date >= ? AND e.date < ? ORDER BY e.date, m.birth_year, m.name", (month_start, month_end))
             # 전체 활동 통계 쿼리
-            df_rep = self.db.query("SELECT * FROM v_member_attendance_summary ORDER BY MemberID ASC")
+            df_rep = self.db.query(f"SELECT * FROM {MemberSummaryService.relation()} ORDER BY MemberID ASC")
             
             # 결측치 처리
             df_rep['획득점수'] = df_rep['획득점수'].fillna(0).astype(int)
@@ -52,14 +61,14 @@ class ReportPage:
             report += f"🏆 **[이달의 시상 현황]**{sp}\n" + (f"{sp}\n".join(winners) if winners else "해당사항 없음") + f"{sp}\n\n"
             
             # 2.5 신입 첫 산행 축하
-            df_first = self.db.query(f"""
+            df_first = self.db.query("""
                 SELECT m.name, MIN(e.date) as first_date 
                 FROM attendees a 
                 JOIN events e ON a.event_id = e.event_id 
                 JOIN members m ON a.user_no = m.user_no 
                 GROUP BY m.user_no, m.name 
-                HAVING strftime('%Y-%m', first_date) = '{target_month}'
-            """)
+                HAVING MIN(e.date) >= ? AND MIN(e.date) < ?
+            """, (month_start, month_end))
             celebrations = [f"🎊 {row['name']}님 (첫 참석 환영합니다!)" for _, row in df_first.iterrows()]
             report += f"🎉 **[첫 참석을 반겨요]**{sp}\n" + (f"{sp}\n".join(celebrations) if celebrations else "없음") + f"{sp}\n\n"
             
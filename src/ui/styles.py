@@ -1,77 +1,54 @@
+import re
+import random
+from functools import lru_cache
 import streamlit as st
-import base64
+from src.ui.themes import ThemeManager
+from src.ui.backgrounds import get_backgrounds, background_css, static_serving_enabled
 
 # =========================================================
 # 3. UI Layer - Styles & Visuals
 # CSS 및 시각적 요소(배경, 폰트, 애니메이션)를 관리합니다.
 # =========================================================
 
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_WHITESPACE = re.compile(r"\s+")
+
 class Styles:
     @staticmethod
     def apply_custom_css():
         """
         Applies global CSS styles to the Streamlit app.
-        Uses ThemeManager to inject dynamic colors.
+        테마는 세션별(ThemeManager.get), 스타일시트는 (테마, 배경) 조합마다 한 번만 생성해 재사용합니다.
         """
-        from src.ui.themes import ThemeManager
-        import random
-        # Import Base64 Assets List
-        try:
-            from src.ui.assets import BG_IMAGES
-        except ImportError:
-            BG_IMAGES = [] # Fallback
+        theme = ThemeManager.get()
+        st.markdown(Styles.compile_css(theme.name, Styles._session_background()), unsafe_allow_html=True)
 
-        # Select a random image from the local AI assets
-        if BG_IMAGES:
-            bg_b64 = random.choice(BG_IMAGES)
-        else:
-            bg_b64 = ""
-            
-        theme = ThemeManager.current
-        c = theme.colors
-        
-        # ... (lines 28-196 skipped for brevity in this view, assuming context matches)
-        # Actually I need to replace the CSS block too where it uses the variable.
-        # Let's target the exact CSS block again.
-        
-        # Internal Verified Mountain List
-        mountains = [
-            "https://upload.wikimedia.org/wikipedia/commons/e/e0/Ulsanbawi_Seoraksan_Korea.JPG", 
-            "https://upload.wikimedia.org/wikipedia/commons/5/52/Hallasan_Baengnokdam.jpg",
-            "https://upload.wikimedia.org/wikipedia/commons/1/13/Bukhansan_National_Park.jpg",
-            "https://upload.wikimedia.org/wikipedia/commons/0/07/Jirisan_Cheonwangbong_Peak.jpg",
-            "https://upload.wikimedia.org/wikipedia/commons/9/91/Naejangsan_National_Park.jpg"
-        ]
-        
-        # Select Image
-        bg_url = theme.bg_image_url
-        if bg_url == "RANDOM_KOREAN_MOUNTAIN":
-             # Use the first one (Ulsanbawi) for stability as requested, or random.
-             # Let's go back to random but with Base64 caching to ensure it works.
-             # Actually, user said "Random" in Step 906, but "Fixed" in Step 962.
-             # Let's use Random as per original requirement, but Base64 ensures it loads.
-             bg_url = random.choice(mountains)
-        
-        # Helper to load image as Base64 (Cached)
-        @st.cache_data(show_spinner=False)
-        def get_img_as_base64(url):
-            try:
-                response = requests.get(url, timeout=5)
-                if response.status_code == 200:
-                    return base64.b64encode(response.content).decode()
-            except:
-                return None
+    @staticmethod
+    def _session_background():
+        """
+        세션에 고정된 배경 번호를 반환합니다. 배경을 쓸 수 없으면 None.
+        """
+        if not static_serving_enabled():
+            return None
+        count = len(get_backgrounds())
+        if not count:
             return None
+        if "_bg_index" not in st.session_state:
+            st.session_state["_bg_index"] = random.randrange(count)
+        return st.session_state["_bg_index"] % count
 
-        img_b64 = get_img_as_base64(bg_url)
-        
-        # Construct CSS - If B64 fails, fallback to URL, then Color
-        if img_b64:
-            bg_css_val = f"url('data:image/jpg;base64,{img_b64}')"
-        else:
-            bg_css_val = f"url('{bg_url}')"
-        
-        st.markdown(f"""
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def compile_css(theme_name, bg_index):
+        """
+        전역 스타일시트(<style> 블록)를 만듭니다. (theme_name, bg_index) 조합마다 프로세스당 한 번 실행됩니다.
+        (st.cache_resource는 인자 해싱 비용이 문자열 생성보다 커서 lru_cache 사용)
+        """
+        theme = ThemeManager.THEMES[theme_name]
+        c = theme.colors
+        bg_css = Styles._background_css(theme, bg_index)
+
+        css = f"""
         <style>
             /* 1. Google Fonts Import */
             @import url('https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;700&family=Orbitron:wght@400;700&family=Noto+Sans+KR:wght@300;400;500;700&display=swap');
@@ -213,47 +190,100 @@ class Styles:
             }}
             
             [data-testid="stAppViewContainer"] {{
-                background-image: linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.5)), url('data:image/png;base64,{bg_b64}') !important;
                 background-size: cover !important;
                 background-position: center center !important;
                 background-attachment: fixed !important;
                 background-repeat: no-repeat !important;
             }}
+            {bg_css}
+
+            /* 9. Section Components (src/ui/components.py) */
+            .dd-grid {{ display: grid; gap: 1rem; margin-bottom: 1rem; }}
+            .dd-grid-3 {{ grid-template-columns: repeat(3, minmax(0, 1fr)); }}
+            .dd-grid-7 {{ grid-template-columns: repeat(7, minmax(0, 1fr)); gap: 0.4rem; margin-bottom: 0; }}
+            @media (max-width: 640px) {{
+                .dd-grid-3 {{ grid-template-columns: 1fr; }}
+                .dd-grid-7 {{ grid-template-columns: repeat(4, minmax(0, 1fr)); }}
+            }}
+            .dd-panel {{ background-color: rgba(0,0,0,0.5); padding: 20px; border-radius: 15px; margin-bottom: 1rem; }}
+            .dd-panel-title {{ font-size: 1.5rem; font-weight: 600; color: {c.text_primary}; margin-bottom: 12px; }}
+            .dd-col-title {{ font-size: 1.1rem; font-weight: 600; color: {c.text_primary}; margin-bottom: 0.75rem; }}
+            .dd-note {{ font-size: 13px; color: {c.text_secondary}; opacity: 0.8; margin-top: 8px; }}
+            .dd-tmax {{ color: #ff6b6b; }}
+            .dd-tmin {{ color: #4ecdc4; }}
+
+            .dd-kpi {{ display: flex; flex-direction: column; justify-content: center; height: 100%; }}
+            .dd-kpi .dd-kpi-label {{ font-size: 15px; color: #b7e4c7 !important; font-weight: bold; }}
+            .dd-kpi .dd-kpi-value {{ font-size: 38px; font-weight: bold; color: #ffffff !important; }}
+
+            .dd-event {{
+                background: {c.card_bg}; border-radius: 12px; margin-bottom: 12px; border: 1px solid {c.border};
+                display: flex; overflow: hidden; box-shadow: 0 4px 10px rgba(0,0,0,0.05); transition: transform 0.3s ease;
+                --badge: #3b82f6;
+            }}
+            .dd-event.dd-urgent {{ --badge: #ef4444; }}
+            .dd-event-bar {{ width: 6px; background: var(--badge); }}
+            .dd-event-body {{ flex-grow: 1; padding: 12px; }}
+            .dd-event-head {{ display: flex; align-items: center; gap: 8px; margin-bottom: 6px; }}
+            .dd-badge {{ background-color: color-mix(in srgb, var(--badge) 13%, transparent); color: var(--badge); padding: 2px 8px; border-radius: 4px; font-size: 11px; font-weight: bold; }}
+            .dd-event-title {{ font-weight: bold; font-size: 16px; color: {c.text_primary}; }}
+            .dd-event-meta {{ display: flex; align-items: center; gap: 10px; }}
+            .dd-avatar {{ width: 35px; height: 35px; border-radius: 50%; object-fit: cover; border: 1px solid {c.border}; }}
+            .dd-meta {{ color: {c.text_secondary}; font-size: 12px; }}
+            .dd-meta-date {{ font-size: 13px; font-weight: 500; }}
+            .dd-meta-host {{ opacity: 0.8; }}
+
+            .glass-card.dd-rank {{ padding: 12px !important; margin-bottom: 10px; display: flex; align-items: center; --rank: rgba(128,128,128,0.5); }}
+            .glass-card.dd-rank-1 {{ --rank: #FFD700; border: 2px solid var(--rank) !important; }}
+            .glass-card.dd-rank-2 {{ --rank: #C0C0C0; border: 2px solid var(--rank) !important; }}
+            .glass-card.dd-rank-3 {{ --rank: #CD7F32; border: 2px solid var(--rank) !important; }}
+            .dd-rank-avatar {{ position: relative; margin-right: 15px; }}
+            .dd-rank-avatar img {{ width: 40px; height: 40px; border-radius: 50%; object-fit: cover; border: 2px solid var(--rank); }}
+            .dd-rank .dd-rank-num {{
+                position: absolute; bottom: -5px; right: -5px; width: 20px; height: 20px; background-color: var(--rank);
+                color: #000 !important; font-weight: bold; border-radius: 50%; display: flex; align-items: center; justify-content: center;
+                font-size: 11px; box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+            }}
+            .dd-rank .dd-rank-name {{ font-weight: bold; color: {c.text_primary} !important; font-size: 15px; }}
+            .dd-rank .dd-rank-sub {{ font-size: 13px; color: {c.text_secondary} !important; font-weight: 500; }}
+
+            .dd-popular {{ background-color: rgba(0,0,0,0.4); padding: 10px; border-radius: 12px; margin-bottom: 8px; display: flex; align-items: center; border: 1px solid rgba(255,255,255,0.05); }}
+            .dd-popular-num {{ width: 28px; height: 28px; border-radius: 50%; background-color: #FFFFFF; color: #000; font-weight: bold; display: flex; align-items: center; justify-content: center; margin-right: 12px; flex-shrink: 0; font-size: 14px; }}
+            .dd-popular-title {{ font-weight: bold; color: #fff; font-size: 14px; }}
+            .dd-popular-sub {{ font-size: 13px; color: #ddd; }}
+
+            .dd-weather-day {{ text-align: center; font-size: 12px; background-color: rgba(255,255,255,0.05); padding: 5px; border-radius: 8px; }}
+            .dd-weather-icon {{ font-size: 20px; }}
         </style>
-        """, unsafe_allow_html=True)
+        """
+        # rerun마다 전송되므로 주석과 공백을 줄여 한 줄로 보냄 (생성은 조합당 한 번)
+        return _CSS_WHITESPACE.sub(" ", _CSS_COMMENT.sub("", css)).strip()
 
     @staticmethod
-    def set_background(image_path="background.png"):
+    def _background_css(theme, bg_index, selector='[data-testid="stAppViewContainer"]', overlay=None):
+        """
+        배경 이미지 CSS를 만듭니다. 이미지는 빌드된 정적 파일을 URL로 참조합니다. (base64 미사용)
+        """
+        overlay = overlay or "linear-gradient(rgba(0, 0, 0, 0.5), rgba(0, 0, 0, 0.5))"
+        if theme.bg_image_url and theme.bg_image_url.startswith(("http://", "https://")):
+            return f"{selector} {{ background-image: {overlay}, url('{theme.bg_image_url}') !important; }}"
+        if bg_index is None:
+            # 정적 서빙이 꺼져 있거나 이미지가 없으면 테마 배경색 그라데이션으로 대체
+            return f"{selector} {{ background-image: linear-gradient(135deg, {theme.colors.background} 0%, #0f0f0f 100%) !important; }}"
+        return background_css(selector, get_backgrounds()[bg_index], overlay)
+
+    @staticmethod
+    def set_background(overlay="linear-gradient(rgba(0, 0, 0, 0.8), rgba(0, 0, 0, 0.8))"):
         """
         배경 이미지를 설정하고 어두운 오버레이를 적용하여 가독성을 높입니다.
         """
-        try:
-            with open(image_path, "rb") as f:
-                data = f.read()
-            bin_str = base64.b64encode(data).decode()
-            
-            page_bg_img = f"""
-            <style>
-            .stApp {{
-                background-image: linear-gradient(rgba(0, 0, 0, 0.8), rgba(0, 0, 0, 0.8)), url("data:image/png;base64,{bin_str}");
-                background-size: cover;
-                background-attachment: fixed;
-                background-position: center;
-            }}
-            </style>
-            """
-            st.markdown(page_bg_img, unsafe_allow_html=True)
-        except Exception as e:
-            # 배경 이미지가 없을 경우 안전한 그라데이션 폴백
-            fallback_bg = """
-            <style>
-            .stApp {
-                background: linear-gradient(135deg, #1e1e1e 0%, #0f0f0f 100%);
-            }
-            </style>
-            """
-            st.markdown(fallback_bg, unsafe_allow_html=True)
-            print(f"Background image load failed: {e}")
+        bg_css = Styles._background_css(ThemeManager.get(), Styles._session_background(), selector=".stApp", overlay=overlay)
+        st.markdown(f"""
+        <style>
+        .stApp {{ background-size: cover; background-attachment: fixed; background-position: center; }}
+        {bg_css}
+        </style>
+        """, unsafe_allow_html=True)
 
     @staticmethod
     def card_template(content, height="100%", extra_classes=""):
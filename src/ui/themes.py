@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from typing import List
+import streamlit as st
 
 @dataclass
 class ThemeColors:
@@ -77,5 +78,23 @@ CyberTheme = Theme(
 )
 
 class ThemeManager:
-    # Active Theme Selection
-    current: Theme = NatureTheme
+    """
+    테마 선택은 세션별로 st.session_state에 보관합니다. (한 사용자의 선택이 다른 세션에 영향을 주지 않음)
+    """
+    DEFAULT: Theme = NatureTheme
+    THEMES = {t.name: t for t in (NatureTheme, CyberTheme)}
+    SESSION_KEY = "theme_name"
+
+    @staticmethod
+    def get() -> Theme:
+        """
+        현재 세션의 테마를 반환합니다.
+        """
+        name = st.session_state.get(ThemeManager.SESSION_KEY, ThemeManager.DEFAULT.name)
+        return ThemeManager.THEMES.get(name, ThemeManager.DEFAULT)
+
+    @staticmethod
+    def set(name):
+        if name not in ThemeManager.THEMES:
+            raise ValueError(f"알 수 없는 테마: {name}")
+        st.session_state[ThemeManager.SESSION_KEY] = name
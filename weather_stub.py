@@ -0,0 +1,96 @@
+import json
+import time
+import argparse
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# =========================================================
+# 로컬 날씨 API 스텁 (Open-Meteo /v1/forecast 호환)
+# 네트워크 없이 날씨 화면을 확인할 때 사용합니다. 좌표/날짜로 결정되는 고정 예보를 반환합니다.
+# 실행: python weather_stub.py --port 8765
+#       WEATHER_API_URL=http://localhost:8765/v1/forecast streamlit run app.py
+# --fail을 주면 항상 503을 반환합니다. (stale 표시 확인용)
+# --delay 초를 주면 응답을 그만큼 늦춥니다. (느린 API / 제한 시간 확인용)
+# =========================================================
+
+DAYS = 7
+
+
+def fixture(latitude, longitude, start=None, days=DAYS):
+    """
+    좌표와 날짜로 결정되는 가짜 일별 예보(daily 블록)를 만듭니다.
+    """
+    # 앱은 timezone=Asia/Seoul로 요청하므로 KST 기준 오늘부터 생성
+    start = start or datetime.now(timezone(timedelta(hours=9))).date()
+    seed = int(abs(latitude * 100) + abs(longitude * 100))
+    codes = [0, 1, 3, 45, 61, 71, 95]
+    dates = [start + timedelta(days=i) for i in range(days)]
+    return {
+        "time": [d.isoformat() for d in dates],
+        "weather_code": [codes[(seed + d.toordinal()) % len(codes)] for d in dates],
+        "temperature_2m_max": [round(15 + (seed + i * 3) % 10 + 0.5, 1) for i in range(days)],
+        "temperature_2m_min": [round(5 + (seed + i * 3) % 10 - 0.5, 1) for i in range(days)],
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    fail = False
+    delay = 0.0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/v1/forecast":
+            return self._send(404, {"error": True, "reason": "not found"})
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            return self._send(503, {"error": True, "reason": "stub failure"})
+        query = parse_qs(url.query)
+        try:
+            # Open-Meteo처럼 쉼표로 여러 좌표를 받으면 좌표 순서대로 리스트를 반환
+            latitudes = [float(v) for v in query["latitude"][0].split(",")]
+            longitudes = [float(v) for v in query["longitude"][0].split(",")]
+            days = int(query.get("forecast_days", [DAYS])[0])
+        except (KeyError, ValueError):
+            return self._send(400, {"error": True, "reason": "latitude/longitude required"})
+        if len(latitudes) != len(longitudes):
+            return self._send(400, {"error": True, "reason": "latitude/longitude length mismatch"})
+        self.server.request_count += 1
+        results = [
+            {"latitude": lat, "longitude": lon, "daily": fixture(lat, lon, days=days)}
+            for lat, lon in zip(latitudes, longitudes)
+        ]
+        self._send(200, results if len(results) > 1 else results[0])
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port=8765, fail=False, delay=0.0):
+    """
+    스텁 서버를 만들어 반환합니다. (serve_forever()는 호출하는 쪽에서 실행)
+    """
+    handler = type("Handler", (StubHandler,), {"fail": fail, "delay": delay})
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.request_count = 0  # 처리한 예보 요청 수 (일괄 조회 확인용)
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail", action="store_true")
+    parser.add_argument("--delay", type=float, default=0.0)
+    args = parser.parse_args()
+    server = serve(args.port, args.fail, args.delay)
+    print(f"Weather stub: http://127.0.0.1:{args.port}/v1/forecast")
+    server.serve_forever()